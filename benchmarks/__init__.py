@@ -0,0 +1,12 @@
+"""
+Micro-benchmarks for the epc package.
+
+Run the suite and save the results as a baseline::
+
+    python -m benchmarks run -o baseline.json
+
+Compare a later run against it, exiting with status 1 on slowdowns::
+
+    python -m benchmarks run -o current.json
+    python -m benchmarks compare baseline.json current.json --threshold 0.1
+"""
@@ -0,0 +1,71 @@
+"""
+asyncio pipeline benchmarks against a local TCP server standing in for an RFID reader.
+
+Each case connects to a server that writes a fixed set of hex encoded reads, one per line,
+and decodes them all through :class:`epc.aio.DecodePipeline`.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from epc.aio import DecodePipeline
+
+from benchmarks.schemes import ENCODINGS, sample
+
+READS = 2000
+
+
+def _payload():
+    lines = []
+    for name, _, _, _ in ENCODINGS:
+        lines.extend('{:x}\n'.format(int(tag)) for tag in sample(name, READS // len(ENCODINGS)))
+    return ''.join(lines).encode('ascii')
+
+
+async def _serve(payload, reader, writer):
+    writer.write(payload)
+    await writer.drain()
+    writer.close()
+
+
+async def _consume(port, **kwargs):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    count = 0
+
+    async with DecodePipeline(reader, **kwargs) as pipeline:
+        async for batch in pipeline:
+            count += len(batch)
+
+    writer.close()
+    return count
+
+
+def _run(payload, **kwargs):
+    def run():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            server = loop.run_until_complete(asyncio.start_server(
+                lambda reader, writer: _serve(payload, reader, writer), '127.0.0.1', 0
+            ))
+            port = server.sockets[0].getsockname()[1]
+
+            loop.run_until_complete(_consume(port, **kwargs))
+
+            server.close()
+            loop.run_until_complete(server.wait_closed())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+    return run
+
+
+def cases():
+    payload = _payload()
+    count = payload.count(b'\n')
+    executor = ThreadPoolExecutor(1)
+
+    yield 'tcp.batch-1', _run(payload, batch_size=1), count
+    yield 'tcp.batch-64', _run(payload, batch_size=64), count
+    yield 'tcp.batch-256', _run(payload, batch_size=256), count
+    yield 'tcp.batch-256.executor', _run(payload, batch_size=256, executor=executor), count
@@ -0,0 +1,24 @@
+"""
+Import time benchmarks, each case runs a fresh interpreter.
+
+``interpreter`` is the cost of starting Python alone, subtract it from the other cases to get
+the cost of the import.
+"""
+import subprocess
+import sys
+
+
+def _run(code):
+    def run():
+        subprocess.check_call([sys.executable, '-c', code])
+    return run
+
+
+def cases():
+    yield 'interpreter', _run('pass'), 1
+    yield 'epc.utils', _run('import epc.utils'), 1
+    yield 'decode_epc.gid-96', _run(
+        'import epc.utils; epc.utils.decode_epc("3500079ff00000b00000000c")'), 1
+    yield 'decode_epc.sgtin-198', _run(
+        'import epc.utils; '
+        'epc.utils.decode_epc("3618000040000058800000000000000000000000000000000000")'), 1
@@ -0,0 +1,117 @@
+"""
+Load test for :mod:`epc.server` on localhost.
+
+Starts a server in a background thread (or targets one already running with ``--port``),
+then runs concurrent keep-alive clients posting batches of hex reads to ``/decode``.
+
+Usage::
+
+    python -m benchmarks.loadtest --clients 8 --requests 200 --batch-size 100
+"""
+import argparse
+import asyncio
+import json
+import threading
+import time
+
+from epc.server import DecodeServer
+
+from benchmarks.schemes import ENCODINGS, sample
+
+
+def _values(count):
+    values = []
+    for name, _, _, _ in ENCODINGS:
+        values.extend('{:x}'.format(int(tag)) for tag in sample(name, count // len(ENCODINGS) + 1))
+    return values[:count]
+
+
+async def _client(port, path, bodies, latencies):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            writer.write(
+                'POST {} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n'
+                'Content-Length: {}\r\n\r\n'.format(path, len(body)).encode('latin-1') + body
+            )
+            head = await reader.readuntil(b'\r\n\r\n')
+            status = int(head.split(b' ', 2)[1])
+            length = int(head.lower().split(b'content-length:', 1)[1].split(b'\r\n', 1)[0])
+            await reader.readexactly(length)
+
+            if status != 200:
+                raise RuntimeError('Request failed with status %d' % status)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def _load(port, path, clients, requests, batch_size, distinct):
+    values = _values(distinct)
+    position = 0
+    client_bodies = []
+
+    for _ in range(clients):
+        bodies = []
+        for _ in range(requests):
+            batch = [values[(position + i) % distinct] for i in range(batch_size)]
+            bodies.append(json.dumps({'values': batch}).encode('utf-8'))
+            position += batch_size
+        client_bodies.append(bodies)
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*[_client(port, path, bodies, latencies) for bodies in client_bodies])
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def _serve(server, started):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(server.start())
+    started.set()
+    loop.run_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.loadtest')
+    parser.add_argument('--port', type=int, help='Port of a running server to test')
+    parser.add_argument('--path', default='/decode', help='Endpoint (default: /decode)')
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent connections')
+    parser.add_argument('--requests', type=int, default=200, help='Requests per client')
+    parser.add_argument('--batch-size', type=int, default=100, help='Values per request')
+    parser.add_argument(
+        '--distinct', type=int, default=100000,
+        help='Distinct values, lower values increase cache hits (default: 100000)'
+    )
+    args = parser.parse_args(argv)
+
+    port = args.port
+    if port is None:
+        server = DecodeServer(port=0)
+        started = threading.Event()
+        threading.Thread(target=_serve, args=(server, started), daemon=True).start()
+        started.wait()
+        port = server.port
+
+    loop = asyncio.new_event_loop()
+    elapsed, latencies = loop.run_until_complete(_load(
+        port, args.path, args.clients, args.requests, args.batch_size, args.distinct
+    ))
+    loop.close()
+
+    requests = len(latencies)
+    print('{:,} requests, {:,} values in {:.2f}s'.format(
+        requests, requests * args.batch_size, elapsed))
+    print('{:,.0f} requests/s, {:,.0f} values/s'.format(
+        requests / elapsed, requests * args.batch_size / elapsed))
+    print('latency p50 {:.1f} ms, p99 {:.1f} ms, max {:.1f} ms'.format(
+        latencies[requests // 2] * 1000, latencies[int(requests * 0.99)] * 1000,
+        latencies[-1] * 1000))
+    return 0
+
+
+if __name__ == '__main__':
+    main()
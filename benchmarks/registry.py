@@ -0,0 +1,48 @@
+"""
+SQLite tag registry benchmarks: bulk loads into a new database file, and indexed queries.
+"""
+import os
+import tempfile
+
+from epc.registry import TagRegistry
+
+from benchmarks.schemes import ENCODINGS, sample
+
+TAGS = 20000
+
+
+def _hex_strings():
+    hex_strings = []
+    for name, _, _, _ in ENCODINGS:
+        hex_strings.extend(
+            '{:0{}x}'.format(int(tag), tag._tag_size // 4)
+            for tag in sample(name, TAGS // len(ENCODINGS))
+        )
+    return hex_strings
+
+
+def _load(directory, values):
+    def run():
+        path = os.path.join(directory, 'registry.db')
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+        with TagRegistry(path) as registry:
+            registry.add(values, order_id='PO-1')
+    return run
+
+
+def cases():
+    directory = tempfile.mkdtemp()
+    hex_strings = _hex_strings()
+
+    registry = TagRegistry()
+    registry.add(hex_strings)
+    gtins = [tag.gtin for tag in sample('sgtin-96', 100)]
+    uris = [tag.pure_identity_uri.rsplit('.', 1)[0] + '.*' for tag in sample('sgtin-96', 100)]
+
+    yield 'add.file', _load(directory, hex_strings), len(hex_strings)
+    yield 'add.memory', lambda: TagRegistry().add(hex_strings), len(hex_strings)
+    yield 'query.gtin', lambda: [list(registry.query(gtin=gtin)) for gtin in gtins], len(gtins)
+    yield 'query.uri', lambda: [list(registry.query(uri=uri)) for uri in uris], len(uris)
@@ -0,0 +1,130 @@
+"""
+Run benchmark suites, save results as JSON and compare them against a baseline.
+
+Each suite is a module in this package exposing ``cases()``, which yields
+``(name, function, operations)`` tuples. ``function`` is called with no arguments and performs
+``operations`` operations, results are reported as nanoseconds per operation.
+"""
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+import timeit
+
+SUITES = (
+    'schemes',
+    'imports',
+    'aio',
+    'registry',
+    'threads',
+)
+
+
+def run(pattern=None, repeat=5, suites=SUITES, stream=sys.stdout):
+    """
+    Run all benchmark cases whose name contains ``pattern``.
+
+    :return: Results keyed by case name.
+    :rtype: dict
+    """
+    results = {}
+
+    for suite in suites:
+        module = importlib.import_module('benchmarks.%s' % suite)
+
+        for name, function, operations in module.cases():
+            name = '%s.%s' % (suite, name)
+            if pattern and pattern not in name:
+                continue
+
+            timer = timeit.Timer(function, timer=time.perf_counter)
+            number, _ = timer.autorange()
+            timings = [t / number / operations * 1e9 for t in timer.repeat(repeat, number)]
+
+            results[name] = {
+                'best_ns': min(timings),
+                'mean_ns': sum(timings) / len(timings),
+            }
+            stream.write('{:<48} {:>12.1f} ns/op\n'.format(name, results[name]['best_ns']))
+
+    return results
+
+
+def compare(baseline, current, threshold=0.1):
+    """
+    Compare two result sets, using the best timing of each case.
+
+    :return: ``(name, baseline ns, current ns, relative change)`` tuples for every case
+        slower than ``threshold`` (a fraction, eg. ``0.1`` for 10%).
+    :rtype: list
+    """
+    regressions = []
+
+    for name, result in sorted(current.items()):
+        if name not in baseline:
+            continue
+
+        before = baseline[name]['best_ns']
+        after = result['best_ns']
+        change = (after - before) / before
+
+        if change > threshold:
+            regressions.append((name, before, after, change))
+
+    return regressions
+
+
+def _load(path):
+    with open(path) as results_file:
+        return json.load(results_file)['results']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    run_parser = subparsers.add_parser('run', help='Run benchmarks')
+    run_parser.add_argument('-k', dest='pattern', help='Only run cases containing this text')
+    run_parser.add_argument('-o', '--output', help='Save results as JSON')
+    run_parser.add_argument('--repeat', type=int, default=5, help='Timing repeats per case')
+    run_parser.add_argument('--suite', action='append', choices=SUITES, help='Suites to run')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare results to a baseline')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument(
+        '--threshold', type=float, default=0.1,
+        help='Relative slowdown reported as a regression (default: 0.1)'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run(args.pattern, args.repeat, args.suite or SUITES)
+        if args.output:
+            with open(args.output, 'w') as results_file:
+                json.dump({
+                    'python': platform.python_version(),
+                    'implementation': platform.python_implementation(),
+                    'machine': platform.machine(),
+                    # False on free-threaded builds running without the GIL.
+                    'gil': getattr(sys, '_is_gil_enabled', lambda: True)(),
+                    'results': results,
+                }, results_file, indent=2, sort_keys=True)
+        return 0
+
+    regressions = compare(_load(args.baseline), _load(args.current), args.threshold)
+    for name, before, after, change in regressions:
+        sys.stdout.write('{:<48} {:>10.1f} -> {:>10.1f} ns/op ({:+.0%})\n'.format(
+            name, before, after, change
+        ))
+
+    if regressions:
+        sys.stdout.write('%d regression(s) over %d%%\n' % (len(regressions), args.threshold * 100))
+        return 1
+
+    sys.stdout.write('No regressions\n')
+    return 0
@@ -0,0 +1,198 @@
+"""
+Encode, decode and representation benchmarks for every scheme and tag size.
+
+Inputs are generated from a fixed seed, with company prefix lengths, references and serial
+numbers spread across their valid ranges.
+"""
+import io
+import pickle
+import random
+import string
+
+from epc.schemes import GDTI, GIAI, GID, GRAI, GSRN, SGLN, SGTIN, SSCC
+from epc.utils import decode_epc
+from epc.utils.batch import BatchReader, encode_batch
+from epc.utils.jsonl import from_jsonl, to_jsonl
+from epc.utils.keys import decode_key, encode_keys
+from epc.utils.validation import try_decode, validate
+
+SEED = 20200831
+SAMPLE_SIZE = 200
+
+_serial_characters = string.ascii_letters + string.digits + '-'
+
+
+def _company_prefix(rng):
+    company_prefix_length = rng.randint(6, 12)
+    return '{:0{}d}'.format(rng.randrange(10 ** company_prefix_length), company_prefix_length)
+
+
+def _alphanumeric(rng, max_length):
+    return ''.join(rng.choice(_serial_characters) for _ in range(rng.randint(1, max_length)))
+
+
+def _gid(rng, size):
+    return GID().manager_number(rng.randrange(2 ** 28)).object_class(
+        rng.randrange(2 ** 24)).serial_number(rng.randrange(2 ** 36))
+
+
+def _sgtin(rng, size):
+    company_prefix = _company_prefix(rng)
+    tag = SGTIN().tag_size(size).filter(rng.choice((1, 2, 6))).company_prefix(company_prefix)
+    tag.item_reference(rng.randrange(10 ** (13 - len(company_prefix))))
+
+    if size == SGTIN.SIZE_96:
+        return tag.serial_number(rng.randrange(2 ** 38))
+    return tag.serial_number(_alphanumeric(rng, 16))
+
+
+def _sgln(rng, size):
+    company_prefix = _company_prefix(rng)
+    tag = SGLN().tag_size(size).company_prefix(company_prefix)
+    tag.location_reference(rng.randrange(10 ** (12 - len(company_prefix))))
+
+    if size == SGLN.SIZE_96:
+        return tag.extension(rng.randrange(2 ** 41))
+    return tag.extension(_alphanumeric(rng, 20))
+
+
+def _grai(rng, size):
+    company_prefix = _company_prefix(rng)
+    tag = GRAI().tag_size(size).company_prefix(company_prefix)
+    tag.asset_type(rng.randrange(10 ** (12 - len(company_prefix))))
+
+    if size == GRAI.SIZE_96:
+        return tag.serial_number(rng.randrange(1, 2 ** 38))
+    return tag.serial_number(_alphanumeric(rng, 16))
+
+
+def _giai(rng, size):
+    company_prefix = _company_prefix(rng)
+    tag = GIAI().tag_size(size).filter(rng.choice((0, 1))).company_prefix(company_prefix)
+
+    if size == GIAI.SIZE_96:
+        return tag.asset_reference(rng.randrange(10 ** 12))
+    return tag.asset_reference(_alphanumeric(rng, 30 - len(company_prefix)))
+
+
+def _sscc(rng, size):
+    company_prefix = _company_prefix(rng)
+    tag = SSCC().filter(rng.choice((2, 6))).company_prefix(company_prefix)
+    return tag.serial_reference(rng.randrange(10 ** (17 - len(company_prefix))))
+
+
+def _gdti(rng, size):
+    company_prefix = _company_prefix(rng)
+    tag = GDTI().tag_size(size).company_prefix(company_prefix)
+    tag.document_type(rng.randrange(10 ** (12 - len(company_prefix))))
+
+    if size == GDTI.SIZE_96:
+        return tag.serial_number(rng.randrange(2 ** 41))
+    return tag.serial_number('{:017d}'.format(rng.randrange(10 ** 17)))
+
+
+def _gsrn(rng, size):
+    company_prefix = _company_prefix(rng)
+    tag = GSRN().company_prefix(company_prefix)
+    return tag.service_reference(rng.randrange(10 ** (17 - len(company_prefix))))
+
+
+ENCODINGS = (
+    # Encoding, Scheme, Tag Size, Generator
+    ('gid-96', GID, GID.SIZE_96, _gid),
+    ('sgtin-96', SGTIN, SGTIN.SIZE_96, _sgtin),
+    ('sgtin-198', SGTIN, SGTIN.SIZE_198, _sgtin),
+    ('sgln-96', SGLN, SGLN.SIZE_96, _sgln),
+    ('sgln-195', SGLN, SGLN.SIZE_195, _sgln),
+    ('grai-96', GRAI, GRAI.SIZE_96, _grai),
+    ('grai-170', GRAI, GRAI.SIZE_170, _grai),
+    ('giai-96', GIAI, GIAI.SIZE_96, _giai),
+    ('giai-202', GIAI, GIAI.SIZE_202, _giai),
+    ('sscc-96', SSCC, SSCC.SIZE_96, _sscc),
+    ('gdti-96', GDTI, GDTI.SIZE_96, _gdti),
+    ('gdti-113', GDTI, GDTI.SIZE_113, _gdti),
+    ('gsrn-96', GSRN, GSRN.SIZE_96, _gsrn),
+)
+
+
+def sample(encoding, size=SAMPLE_SIZE):
+    """
+    Generate the fixed sample of tags for an encoding.
+
+    :return: List of tag objects.
+    :rtype: list
+    """
+    for name, _, tag_size, generator in ENCODINGS:
+        if name == encoding:
+            rng = random.Random('%s-%s' % (SEED, name))
+            return [generator(rng, tag_size) for _ in range(size)]
+
+    raise LookupError('Unknown encoding %s' % encoding)
+
+
+def _for_each(function, items):
+    def run():
+        for item in items:
+            function(item)
+    return run
+
+
+def _dict_pickle(tags):
+    # Pickle tags by their attributes, as before tags pickled as their encoded value.
+    output = io.BytesIO()
+    pickler = pickle.Pickler(output, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = {
+        type(tag): lambda tag: object.__reduce_ex__(tag, pickle.HIGHEST_PROTOCOL) for tag in tags
+    }
+    pickler.dump(tags)
+    return output.getvalue()
+
+
+def _decoder(scheme):
+    return lambda hex_string: scheme(epc=hex_string)
+
+
+def cases():
+    for name, scheme, _, _ in ENCODINGS:
+        tags = sample(name)
+        hex_strings = ['{:x}'.format(int(tag)) for tag in tags]
+        integers = [int(tag) for tag in tags]
+        keys = encode_keys(tags)
+        frame = encode_batch(integers)
+        jsonl = to_jsonl(tags)
+        pickled = pickle.dumps(tags, pickle.HIGHEST_PROTOCOL)
+        dict_pickled = _dict_pickle(tags)
+
+        operations = [
+            ('encode', _for_each(int, tags)),
+            ('decode', _for_each(_decoder(scheme), hex_strings)),
+            ('decode_epc', _for_each(decode_epc, hex_strings)),
+            ('from_int', _for_each(scheme.from_int, integers)),
+            ('validate', _for_each(validate, hex_strings)),
+            ('try_decode', _for_each(try_decode, hex_strings)),
+            ('pure_identity_uri', _for_each(lambda tag: tag.pure_identity_uri, tags)),
+            ('tag_uri', _for_each(lambda tag: tag.tag_uri, tags)),
+            # Uncached key computation, then set and sort operations on cached keys.
+            ('identity_key', _for_each(lambda tag: tag._build_identity_key(), tags)),
+            ('set', lambda tags=tags: set(tags)),
+            ('sort', lambda tags=tags: sorted(tags)),
+            ('encode_keys', lambda tags=tags: encode_keys(tags)),
+            ('decode_key', _for_each(decode_key, keys)),
+            ('encode_batch', lambda integers=integers: encode_batch(integers)),
+            ('read_batch', lambda frame=frame: BatchReader(frame).hex_strings()),
+            ('to_jsonl', lambda tags=tags: to_jsonl(tags)),
+            ('from_jsonl', lambda jsonl=jsonl: from_jsonl(jsonl)),
+            ('from_jsonl.trusted', lambda jsonl=jsonl: from_jsonl(jsonl, trusted=True)),
+            ('pickle', lambda tags=tags: pickle.dumps(tags, pickle.HIGHEST_PROTOCOL)),
+            ('unpickle', lambda pickled=pickled: pickle.loads(pickled)),
+            ('pickle.dict', lambda tags=tags: _dict_pickle(tags)),
+            ('unpickle.dict', lambda pickled=dict_pickled: pickle.loads(pickled)),
+        ]
+
+        if scheme is not GID:
+            operations.append(('barcode', _for_each(lambda tag: tag.barcode, tags)))
+        if scheme is SGTIN:
+            operations.append(('gtin', _for_each(lambda tag: tag.gtin, tags)))
+
+        for operation, function in operations:
+            yield '%s.%s' % (name, operation), function, len(tags)
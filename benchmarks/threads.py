@@ -0,0 +1,57 @@
+"""
+Thread scaling benchmarks: the same reads decoded by pools of 1 to 8 threads.
+
+With the GIL, more threads add contention and no throughput; on free-threaded builds the
+nanoseconds per read should fall as threads are added. The ``instrumented`` cases record
+metrics from every thread, to catch shared locks that stop the scaling.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import epc.utils
+from epc import instrumentation
+
+from benchmarks.schemes import ENCODINGS, sample
+
+READS = 20000
+THREADS = (1, 2, 4, 8)
+
+
+def _hex_strings():
+    hex_strings = []
+    for name, _, _, _ in ENCODINGS:
+        hex_strings.extend(
+            '{:0{}x}'.format(int(tag), tag._tag_size // 4)
+            for tag in sample(name, READS // len(ENCODINGS))
+        )
+    return hex_strings
+
+
+def _decode(hex_strings):
+    decode_epc = epc.utils.decode_epc
+    for hex_string in hex_strings:
+        decode_epc(hex_string).pure_identity_uri
+
+
+def _run(executor, chunks, instrumented=False):
+    def run():
+        if instrumented:
+            instrumentation.enable()
+        try:
+            list(executor.map(_decode, chunks))
+        finally:
+            if instrumented:
+                instrumentation.disable()
+                instrumentation.reset()
+    return run
+
+
+def cases():
+    hex_strings = _hex_strings()
+
+    for threads in THREADS:
+        executor = ThreadPoolExecutor(threads)
+        chunks = [hex_strings[i::threads] for i in range(threads)]
+
+        yield 'decode.threads-%d' % threads, _run(executor, chunks), len(hex_strings)
+        yield 'decode.instrumented.threads-%d' % threads, \
+            _run(executor, chunks, instrumented=True), len(hex_strings)
@@ -0,0 +1,11 @@
+import os
+import sys
+
+from epc.cli import main
+
+try:
+    sys.exit(main())
+except BrokenPipeError:
+    # Output closed early, eg. piped to head. Silence the error flushing stdout at exit.
+    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    sys.exit(1)
@@ -0,0 +1,235 @@
+"""
+asyncio adapters for decoding EPC payloads from sockets and other async sources.
+
+:class:`DecodePipeline` reads payloads from an :class:`asyncio.StreamReader` or any async
+iterable, groups them into micro-batches, and decodes each batch in the event loop or in an
+executor. Queues between the stages are bounded: when the consumer falls behind, the pipeline
+stops reading from the source, and a socket source pushes back on the sender through TCP flow
+control.
+
+Example::
+
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async with DecodePipeline(reader, batch_size=256) as pipeline:
+        async for batch in pipeline:
+            for payload, code, tag in batch:
+                ...
+"""
+import asyncio
+
+from epc.utils.validation import try_decode_epcs
+
+_END = object()
+
+
+class _Failure:
+    def __init__(self, exception):
+        self.exception = exception
+
+
+class DecodePipeline:
+    """
+    Async iterator of decoded micro-batches. Each batch is a list of ``(payload, code, tag)``
+    tuples, where ``code`` is an ``EPC_*`` result code from :mod:`epc.utils.validation` and
+    ``tag`` is ``None`` for invalid payloads.
+
+    Payloads are hex strings, one per item or line. Bytes are decoded as ASCII, surrounding
+    whitespace is stripped and blank payloads are skipped.
+
+    Use the pipeline as an async context manager, or call :meth:`aclose` when finished, to stop
+    reading from the source.
+
+    :param source: Payload source.
+    :type source: asyncio.StreamReader, async iterable
+
+    :param batch_size: Maximum payloads per batch. Defaults to ``256``.
+    :type batch_size: int, optional
+
+    :param max_delay: Seconds to wait for a batch to fill after its first payload arrives.
+        Defaults to ``0.005``.
+    :type max_delay: float, optional
+
+    :param executor: Executor to decode batches in, ``None`` decodes in the event loop.
+    :type executor: concurrent.futures.Executor, optional
+
+    :param max_pending: Maximum decoded batches waiting for the consumer. Defaults to ``4``.
+    :type max_pending: int, optional
+
+    :param decoder: Function taking a list of payloads and returning a tuple of tags and result
+        codes. Defaults to :func:`epc.utils.validation.try_decode_epcs`.
+    :type decoder: callable, optional
+    """
+
+    def __init__(self, source, batch_size=256, max_delay=0.005, executor=None, max_pending=4,
+                 decoder=try_decode_epcs):
+        if batch_size < 1 or max_pending < 1:
+            raise ValueError('batch_size and max_pending must be at least 1')
+
+        self.source = source
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.executor = executor
+        self.max_pending = max_pending
+        self.decoder = decoder
+
+        self._payloads = None
+        self._batches = None
+        self._tasks = ()
+        self._getter = None
+        self._finished = False
+
+    def _start(self):
+        self._payloads = asyncio.Queue(self.batch_size * self.max_pending)
+        self._batches = asyncio.Queue(self.max_pending)
+        self._tasks = (
+            asyncio.ensure_future(self._read()),
+            asyncio.ensure_future(self._decode()),
+        )
+
+    async def _read(self):
+        put = self._payloads.put
+
+        try:
+            async for payload in self.source:
+                if isinstance(payload, bytes):
+                    payload = payload.decode('ascii', 'replace')
+
+                payload = payload.strip()
+                if payload:
+                    await put(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await put(_Failure(e))
+        else:
+            await put(_END)
+
+    async def _next_payload(self, timeout):
+        # The pending get() is kept between calls rather than cancelled on timeout, so a
+        # payload that arrives as the timeout expires is never lost.
+        if self._getter is None:
+            self._getter = asyncio.ensure_future(self._payloads.get())
+
+        if timeout is not None:
+            done, _ = await asyncio.wait((self._getter,), timeout=timeout)
+            if not done:
+                return None
+
+        payload = await self._getter
+        self._getter = None
+        return payload
+
+    async def _decode(self):
+        loop = asyncio.get_event_loop()
+        end = None
+
+        try:
+            while end is None:
+                payload = await self._next_payload(None)
+                if payload is _END or isinstance(payload, _Failure):
+                    end = payload
+                    break
+
+                batch = [payload]
+                deadline = loop.time() + self.max_delay
+
+                while len(batch) < self.batch_size:
+                    try:
+                        payload = self._payloads.get_nowait()
+                    except asyncio.QueueEmpty:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        payload = await self._next_payload(remaining)
+                        if payload is None:
+                            break
+
+                    if payload is _END or isinstance(payload, _Failure):
+                        end = payload
+                        break
+                    batch.append(payload)
+
+                if self.executor is None:
+                    tags, codes = self.decoder(batch)
+                else:
+                    tags, codes = await loop.run_in_executor(self.executor, self.decoder, batch)
+
+                await self._batches.put(list(zip(batch, codes, tags)))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            end = _Failure(e)
+
+        await self._batches.put(end)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._finished:
+            raise StopAsyncIteration
+        if self._batches is None:
+            self._start()
+
+        batch = await self._batches.get()
+        if batch is _END:
+            await self.aclose()
+            raise StopAsyncIteration
+        if isinstance(batch, _Failure):
+            await self.aclose()
+            raise batch.exception
+
+        return batch
+
+    async def __aenter__(self):
+        if self._batches is None:
+            self._start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Stop the pipeline, cancelling any pending reads and decodes. Payloads that were read but
+        not yet returned are discarded. Calling this more than once has no effect.
+        """
+        self._finished = True
+
+        tasks = [task for task in self._tasks if not task.done()]
+        if self._getter is not None and not self._getter.done():
+            tasks.append(self._getter)
+
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def decode_stream(source, callback, **kwargs):
+    """
+    Decode all payloads from a source, calling ``callback`` with each batch.
+
+    :param source: Payload source.
+    :type source: asyncio.StreamReader, async iterable
+
+    :param callback: Function or coroutine function called with each batch of
+        ``(payload, code, tag)`` tuples.
+    :type callback: callable
+
+    Other keyword arguments are passed to :class:`DecodePipeline`.
+
+    :return: Number of payloads decoded.
+    :rtype: int
+    """
+    count = 0
+
+    async with DecodePipeline(source, **kwargs) as pipeline:
+        async for batch in pipeline:
+            count += len(batch)
+            result = callback(batch)
+            if asyncio.iscoroutine(result):
+                await result
+
+    return count
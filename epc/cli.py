@@ -0,0 +1,279 @@
+"""
+Command line tool for bulk conversion of EPC tag data.
+
+Input is read line by line from files or stdin, in chunks, so memory use doesn't grow with the
+input. Invalid lines are reported in the output (an empty line for the ``uri``, ``tag-uri``
+and ``hex`` formats, an ``error`` field otherwise) rather than stopping the run, and a summary
+with throughput is written to stderr at the end. With ``--workers``, each worker process reads
+its own byte ranges of input files (see :mod:`epc.utils.chunks`).
+
+Examples::
+
+    python -m epc decode reads.txt --format tag-uri
+    python -m epc encode --format hex < uris.txt
+    python -m epc translate scans.txt --from barcode --company-prefix-length 7 --format jsonl
+    python -m epc validate reads.txt --workers 4 > results.csv
+"""
+import argparse
+import csv
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+
+from epc.utils.chunks import iter_lines, plan_chunks
+from epc.utils.company_prefix import CompanyPrefixResolver
+from epc.utils.records import INPUT_FORMATS, tag_record
+from epc.utils.validation import EPC_RESULTS, validate
+
+FORMATS = ('uri', 'tag-uri', 'hex', 'jsonl', 'csv')
+VALIDATE_FORMATS = ('csv', 'jsonl')
+
+CSV_FIELDS = ('input', 'encoding', 'hex', 'uri', 'tag_uri', 'error')
+VALIDATE_CSV_FIELDS = ('input', 'code', 'result')
+
+_plain_fields = {
+    # Format: Record Field
+    'uri': 'uri',
+    'tag-uri': 'tag_uri',
+    'hex': 'hex',
+}
+
+# Approximate bytes per input line, to split files into ranges of about --chunk-size lines.
+_LINE_BYTES = 32
+
+# Options of the current process, set by _configure() in the parent and in each worker.
+_options = {}
+
+
+def _configure(options):
+    _options.clear()
+    _options.update(options)
+
+    if options.get('company_prefixes'):
+        _options['company_prefix_length'] = CompanyPrefixResolver.from_file(
+            options['company_prefixes'])
+
+
+def _validate_record(line):
+    code = validate(line)
+    return {'input': line, 'code': code, 'result': EPC_RESULTS[code][1]}
+
+
+def _format_records(records, output_format, fields):
+    if output_format == 'jsonl':
+        return ''.join(json.dumps(record) + '\n' for record in records)
+
+    if output_format == 'csv':
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerows([record.get(field, '') for field in fields] for record in records)
+        return output.getvalue()
+
+    field = _plain_fields[output_format]
+    return ''.join(record.get(field, '') + '\n' for record in records)
+
+
+def process_lines(lines):
+    """
+    Convert a chunk of input lines with the configured command and output format.
+
+    :return: Tuple of the formatted output, the number of lines that failed, and a count of
+        lines per result code for the ``validate`` command.
+    :rtype: tuple
+    """
+    command = _options['command']
+
+    if command == 'validate':
+        records = [_validate_record(line) for line in lines]
+        codes = {}
+        for record in records:
+            codes[record['code']] = codes.get(record['code'], 0) + 1
+
+        errors = len(records) - codes.get(0, 0)
+        return _format_records(records, _options['format'], VALIDATE_CSV_FIELDS), errors, codes
+
+    input_format = {'decode': 'hex', 'encode': 'uri'}.get(command, _options['input_format'])
+    company_prefix_length = _options.get('company_prefix_length')
+    records = [tag_record(line, input_format, company_prefix_length) for line in lines]
+    errors = sum(1 for record in records if 'error' in record)
+    return _format_records(records, _options['format'], CSV_FIELDS), errors, {}
+
+
+def _read_lines(paths, stdin):
+    for path in paths or ['-']:
+        if path == '-':
+            stream = stdin
+        else:
+            # UTF-8 like worker processes, which read ranges with epc.utils.chunks.
+            stream = open(path, 'r', buffering=1 << 20, encoding='utf-8')
+
+        try:
+            for line in stream:
+                line = line.strip()
+                if line:
+                    yield line
+        finally:
+            if stream is not stdin:
+                stream.close()
+
+
+def _chunks(lines, chunk_size):
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _process_chunk(lines):
+    return len(lines), process_lines(lines)
+
+
+def _process_range(path, start, end):
+    return _process_chunk(list(iter_lines(path, start, end)))
+
+
+def _tasks(paths, stdin, chunk_size, workers):
+    if workers > 1 and paths and all(os.path.isfile(path) for path in paths):
+        # Workers read their own ranges of the files, rather than lines sent by this process.
+        for path in paths:
+            for chunk in plan_chunks(path, chunk_bytes=chunk_size * _LINE_BYTES):
+                yield _process_range, (path, chunk.start, chunk.end)
+        return
+
+    for chunk in _chunks(_read_lines(paths, stdin), chunk_size):
+        yield _process_chunk, (chunk,)
+
+
+def _results(tasks, workers):
+    if workers <= 1:
+        for function, args in tasks:
+            yield function(*args)
+        return
+
+    # Keep a bounded number of tasks in flight, so input isn't read faster than it's written.
+    pool = multiprocessing.Pool(workers, initializer=_configure, initargs=(dict(_options),))
+    pending = deque()
+
+    try:
+        for function, args in tasks:
+            pending.append(pool.apply_async(function, args))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().get()
+
+        while pending:
+            yield pending.popleft().get()
+
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m epc', description='Convert EPC tag data in bulk.'
+    )
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    commands = (
+        ('decode', 'Decode hex tag data', FORMATS, 'uri'),
+        ('encode', 'Encode tag URIs or pure identity URIs', FORMATS, 'hex'),
+        ('translate', 'Convert hex, URIs or barcodes to another format', FORMATS, 'tag-uri'),
+        ('validate', 'Validate hex tag data', VALIDATE_FORMATS, 'csv'),
+    )
+
+    for command, description, formats, default_format in commands:
+        subparser = subparsers.add_parser(command, help=description, description=description)
+        subparser.add_argument(
+            'files', nargs='*', metavar='FILE', help='Input files, defaults to stdin'
+        )
+        subparser.add_argument(
+            '-f', '--format', choices=formats, default=default_format,
+            help='Output format (default: %s)' % default_format
+        )
+        subparser.add_argument(
+            '-w', '--workers', type=int, default=1, help='Worker processes (default: 1)'
+        )
+        subparser.add_argument(
+            '--chunk-size', type=int, default=10000, help='Lines per chunk (default: 10000)'
+        )
+        subparser.add_argument(
+            '--no-header', action='store_true', help="Don't write a CSV header row"
+        )
+        subparser.add_argument(
+            '--strict', action='store_true', help='Exit with status 1 if any line failed'
+        )
+        subparser.add_argument('-q', '--quiet', action='store_true', help='No summary')
+
+        if command == 'translate':
+            subparser.add_argument(
+                '--from', dest='input_format', choices=INPUT_FORMATS, default='auto',
+                help='Input format (default: auto). Auto-detected barcodes must be '
+                     'parenthesized or FNC1 separated.'
+            )
+            subparser.add_argument(
+                '--company-prefix-length', type=int,
+                help='Company prefix length of barcodes'
+            )
+            subparser.add_argument(
+                '--company-prefixes', metavar='FILE',
+                help="GS1 company prefix list (XML or CSV) to resolve barcodes' prefix lengths"
+            )
+
+    return parser
+
+
+def main(argv=None, stdin=None, stdout=None, stderr=None):
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    args = _parser().parse_args(argv)
+
+    _configure({
+        'command': args.command,
+        'format': args.format,
+        'input_format': getattr(args, 'input_format', None),
+        'company_prefix_length': getattr(args, 'company_prefix_length', None),
+        'company_prefixes': getattr(args, 'company_prefixes', None),
+    })
+
+    if args.format == 'csv' and not args.no_header:
+        fields = VALIDATE_CSV_FIELDS if args.command == 'validate' else CSV_FIELDS
+        stdout.write(','.join(fields) + '\n')
+
+    start = time.perf_counter()
+    total = errors = 0
+    codes = {}
+
+    tasks = _tasks(args.files, stdin, max(args.chunk_size, 1), args.workers)
+    for count, (output, chunk_errors, chunk_codes) in _results(tasks, args.workers):
+        stdout.write(output)
+        total += count
+        errors += chunk_errors
+        for code, code_count in chunk_codes.items():
+            codes[code] = codes.get(code, 0) + code_count
+
+    stdout.flush()
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        stderr.write('{:,} lines, {:,} failed in {:.2f}s ({:,.0f} lines/s)\n'.format(
+            total, errors, elapsed, total / elapsed if elapsed else 0
+        ))
+
+        if codes:
+            for code, description in EPC_RESULTS:
+                if codes.get(code):
+                    stderr.write('  {:>12,}  {}\n'.format(codes[code], description))
+
+    return 1 if args.strict and errors else 0
@@ -1,11 +1,46 @@
-from .integer import encode_int, decode_int
-from .partition import encode_partition, decode_partition
-from .string import encode_string, decode_string, is_encodable_string, is_decodeable_string, url_encode_string
-from .string_partition_table import encode_string_partition, decode_string_partition
-
-__all__ = (
-    'encode_int', 'decode_int',
-    'encode_partition', 'decode_partition',
-    'encode_string', 'decode_string', 'is_encodable_string', 'is_decodeable_string', 'url_encode_string',
-    'encode_string_partition', 'decode_string_partition'
-)
+import importlib
+import sys
+
+_modules = {
+    # Function: Module
+    'calc_check_digit': 'check_digit',
+    'is_valid_check_digit': 'check_digit',
+    'calc_check_digits': 'check_digit',
+    'validate_check_digits': 'check_digit',
+    'encode_int': 'integer',
+    'decode_int': 'integer',
+    'encode_partition': 'partition',
+    'decode_partition': 'partition',
+    'partition_layout': 'partition',
+    'encode_string': 'string',
+    'decode_string': 'string',
+    'is_encodable_string': 'string',
+    'is_decodeable_string': 'string',
+    'url_encode_string': 'string',
+    'encode_string_partition': 'string_partition_table',
+    'decode_string_partition': 'string_partition_table',
+}
+
+__all__ = tuple(_modules)
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ (PEP 562) requires Python 3.7, import eagerly.
+    for _name, _module in _modules.items():
+        globals()[_name] = getattr(importlib.import_module('.' + _module, __name__), _name)
+
+
+def __getattr__(name):
+    # Import encoding modules on first use, the character tables in .string are only loaded
+    # by schemes that encode strings.
+    try:
+        module = _modules[name]
+    except KeyError:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
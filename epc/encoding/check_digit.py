@@ -0,0 +1,145 @@
+"""
+The GS1 mod-10 check digit used by GTIN, GLN, GRAI, SSCC and other GS1 keys.
+
+Digits are weighted 3 and 1 alternately, starting with a weight of 3 on the rightmost digit
+before the check digit. The check digit is the amount needed to round the weighted sum up to
+the next multiple of ten.
+
+The array functions require NumPy, the rest of the module has no dependencies.
+"""
+# Weighted digit values, indexed by ASCII code so bytes can be mapped directly.
+_weight_1 = bytes(range(256)).translate(bytes.maketrans(b'0123456789', bytes(range(10))))
+_weight_3 = bytes(range(256)).translate(
+    bytes.maketrans(b'0123456789', bytes(3 * i for i in range(10)))
+)
+
+
+def _weighted_sum(digits):
+    data = digits.encode('ascii', 'replace')
+    if not data.isdigit():
+        raise ValueError('`%s` must only contain digits' % digits)
+
+    return sum(data[-1::-2].translate(_weight_3)) + sum(data[-2::-2].translate(_weight_1))
+
+
+def calc_check_digit(digits):
+    """
+    Calculate the check digit for a string of digits.
+
+    :param digits: GS1 key digits, without the check digit.
+    :type digits: str
+
+    :raises ValueError: Input contains non-digit characters.
+
+    :rtype: int
+    """
+    if not digits:
+        return 0
+    return -_weighted_sum(digits) % 10
+
+
+def is_valid_check_digit(digits):
+    """
+    Check the last digit of a GS1 key is its correct check digit.
+
+    :param digits: GS1 key digits, including the check digit.
+    :type digits: str
+
+    :rtype: bool
+    """
+    # Only ASCII digits, int() would also accept other Unicode digits.
+    check = ord(digits[-1]) - 48 if digits else -1
+    if len(digits) < 2 or not 0 <= check <= 9:
+        return False
+
+    try:
+        return (_weighted_sum(digits[:-1]) + check) % 10 == 0
+    except ValueError:
+        return False
+
+
+def calc_check_digits(digit_strings):
+    """
+    Calculate check digits for many GS1 keys.
+
+    :param digit_strings: GS1 key digit strings, without check digits.
+    :type digit_strings: iterable
+
+    :raises ValueError: Input contains non-digit characters.
+
+    :rtype: list
+    """
+    return [calc_check_digit(digits) for digits in digit_strings]
+
+
+def validate_check_digits(digit_strings):
+    """
+    Validate check digits for many GS1 keys.
+
+    :param digit_strings: GS1 key digit strings, including check digits.
+    :type digit_strings: iterable
+
+    :return: One boolean per input key.
+    :rtype: list
+    """
+    return [is_valid_check_digit(digits) for digits in digit_strings]
+
+
+def to_digit_array(digit_strings, width):
+    """
+    Convert digit strings to a two dimensional array of digits, one row per string. Strings
+    shorter than ``width`` are zero padded on the left, which doesn't change their check digit.
+
+    :param digit_strings: Digit strings.
+    :type digit_strings: iterable
+
+    :param width: Number of digits per row.
+    :type width: int
+
+    :raises ValueError: Input contains non-digit characters, or strings longer than ``width``.
+
+    :rtype: numpy.ndarray
+    """
+    import numpy
+
+    digit_strings = [digits.zfill(width) for digits in digit_strings]
+    if any(len(digits) != width for digits in digit_strings):
+        raise ValueError('Digit strings must be at most %d characters' % width)
+
+    strings = numpy.array(digit_strings, dtype='S%d' % width)
+    digits = strings.view('u1').reshape(len(strings), width) - ord('0')
+    if (digits > 9).any():
+        raise ValueError('Digit strings must only contain digits')
+
+    return digits
+
+
+def calc_check_digit_array(digits):
+    """
+    Calculate check digits for each row of a digit array, such as one returned by
+    :func:`to_digit_array`.
+
+    :param digits: Array of shape ``(rows, width)``, without check digits.
+    :type digits: numpy.ndarray
+
+    :rtype: numpy.ndarray
+    """
+    import numpy
+
+    width = digits.shape[-1]
+    weights = numpy.resize(numpy.array([3, 1], dtype='u4'), width)[::-1]
+    return (-(digits.astype('u4') @ weights).astype('i8') % 10).astype('u1')
+
+
+def validate_check_digit_array(digits):
+    """
+    Validate check digits for each row of a digit array, such as one returned by
+    :func:`to_digit_array`.
+
+    :param digits: Array of shape ``(rows, width)``, including check digits.
+    :type digits: numpy.ndarray
+
+    :return: Boolean array, one value per row.
+    :rtype: numpy.ndarray
+    """
+    return calc_check_digit_array(digits[:, :-1]) == digits[:, -1]
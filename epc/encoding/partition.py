@@ -58,3 +58,21 @@ def decode_partition(bin_string, c_length, d_length, start_pos=0):
     c = decode_int(bin_string[start_pos:c_end])
     d = decode_int(bin_string[c_end:d_end])
     return c, d
+
+
+def partition_layout(partition_table, tag_size, start_pos=14):
+    """
+    Precompute the shifts and masks that read the two partitioned values directly from a tag's
+    integer value, for each partition value in a partition table.
+
+    Each entry is ``(c shift, c mask, d shift, d mask)``, so that
+    ``c = tag_data >> c_shift & c_mask``.
+    """
+    layout = {}
+
+    for partition, (c_length, _, d_length) in partition_table.items():
+        c_shift = tag_size - start_pos - c_length
+        d_shift = c_shift - d_length
+        layout[partition] = (c_shift, (1 << c_length) - 1, d_shift, (1 << d_length) - 1)
+
+    return layout
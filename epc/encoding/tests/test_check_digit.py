@@ -0,0 +1,71 @@
+from unittest import TestCase, skipIf
+
+from epc.encoding import (
+    calc_check_digit, calc_check_digits, is_valid_check_digit, validate_check_digits
+)
+from epc.encoding.check_digit import (
+    calc_check_digit_array, to_digit_array, validate_check_digit_array
+)
+from epc.utils.upc import is_valid_upc
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+VALID_KEYS = (
+    '96385074',  # GTIN-8
+    '036000291452',  # GTIN-12
+    '4006381333931',  # GTIN-13
+    '00614141123452',  # GTIN-14
+    '0614141123452',  # GLN
+    '106141412345678908',  # SSCC
+)
+
+
+class CheckDigitTest(TestCase):
+    def test_check_digit(self):
+        """Test check digits for each GS1 key length"""
+        for key in VALID_KEYS:
+            self.assertEqual(calc_check_digit(key[:-1]), int(key[-1]))
+            self.assertTrue(is_valid_check_digit(key))
+            self.assertTrue(is_valid_upc(key) or len(key) not in (8, 12, 13, 14))
+
+        self.assertFalse(is_valid_check_digit('00614141123453'))
+        self.assertFalse(is_valid_check_digit('0061414112345A'))
+        self.assertFalse(is_valid_check_digit('0'))
+        self.assertFalse(is_valid_check_digit(''))
+        # Arabic-Indic and fullwidth digits, which int() accepts.
+        self.assertFalse(is_valid_check_digit('0061414112345\u0662'))
+        self.assertFalse(is_valid_check_digit('0061414112345\uff12'))
+        self.assertFalse(is_valid_check_digit('\u06600614141123452'))
+
+        with self.assertRaises(ValueError):
+            calc_check_digit('0061414112345A')
+
+    def test_batch(self):
+        """Test batch check digit calculation and validation"""
+        self.assertEqual(
+            calc_check_digits(key[:-1] for key in VALID_KEYS), [int(key[-1]) for key in VALID_KEYS]
+        )
+        self.assertEqual(
+            validate_check_digits(['00614141123452', '00614141123453']), [True, False]
+        )
+
+    @skipIf(numpy is None, 'NumPy is not installed')
+    def test_array(self):
+        """Test check digits over digit arrays"""
+        digits = to_digit_array(VALID_KEYS, 18)
+        self.assertEqual(digits.shape, (len(VALID_KEYS), 18))
+        self.assertTrue(validate_check_digit_array(digits).all())
+        self.assertEqual(
+            calc_check_digit_array(digits[:, :-1]).tolist(), [int(key[-1]) for key in VALID_KEYS]
+        )
+
+        digits[0, -1] = (digits[0, -1] + 1) % 10
+        self.assertFalse(validate_check_digit_array(digits)[0])
+
+        with self.assertRaises(ValueError):
+            to_digit_array(['0061414112345A'], 14)
+        with self.assertRaises(ValueError):
+            to_digit_array(['106141412345678908'], 14)
@@ -0,0 +1,338 @@
+"""
+Opt-in instrumentation of the decode, encode and rendering hot paths.
+
+Instrumentation is disabled by default and has no cost while disabled: :func:`enable` swaps
+timing wrappers in for the instrumented functions, and :func:`disable` puts the originals back.
+
+Instrumented operations, labelled with the scheme class name:
+
+* ``dispatch``: :func:`epc.utils.decode_epc`, header lookup plus decoding
+* ``header``: :func:`epc.utils.get_epc_header`
+* ``decode``: each scheme's ``decode_epc()``
+* ``encode``: each scheme's integer conversion
+* ``pure_identity_uri``, ``tag_uri``, ``barcode``, ``barcode_humanized`` and ``gtin``
+
+Failures are counted by reason: the tag data of a failed decode is checked with
+:func:`epc.utils.validation.validate` and labelled with its result code (``unknown_header``,
+``invalid_length``, ``invalid_partition``, ``invalid_character`` or ``invalid_value``), or
+``unimplemented_scheme`` for an encoding that isn't supported. Failures of the other
+operations, such as encoding a tag with missing or out of range components, are
+``invalid_value``.
+
+Calls made through a reference taken with ``from epc.utils import decode_epc`` before
+:func:`enable` is called aren't instrumented, use ``epc.utils.decode_epc`` instead.
+
+Metrics can be recorded from many threads. Each thread records into one of :data:`STRIPES`
+stripes with its own lock, so threads decoding in parallel (such as on free-threaded builds)
+rarely wait on each other, and :func:`snapshot` adds the stripes up.
+
+Example::
+
+    >>> from epc import instrumentation
+    >>> instrumentation.enable()
+    >>> print(instrumentation.to_prometheus())
+"""
+import functools
+import itertools
+import threading
+import time
+from bisect import bisect_left
+
+# Histogram bucket upper bounds in seconds.
+BUCKETS = (
+    1e-06, 2.5e-06, 5e-06, 1e-05, 2.5e-05, 5e-05, 0.0001, 0.00025, 0.0005, 0.001, 0.01, 0.1,
+)
+
+_properties = ('pure_identity_uri', 'tag_uri', 'barcode', 'barcode_humanized', 'gtin')
+_methods = (
+    # Method name, Operation name
+    ('decode_epc', 'decode'),
+    ('__int__', 'encode'),
+)
+
+# Operations whose first argument is the tag data.
+_decode_operations = frozenset(('dispatch', 'header', 'decode'))
+
+_reasons = {
+    # epc.utils.validation Result Code: Reason Label
+    1: 'unknown_header',
+    2: 'invalid_length',
+    3: 'invalid_partition',
+    4: 'invalid_filter',
+    5: 'invalid_character',
+    6: 'invalid_value',
+}
+
+# Number of lock stripes metrics are recorded in.
+STRIPES = 16
+
+_lock = threading.Lock()
+_patches = []
+
+
+class _Stripe:
+    __slots__ = ('lock', 'timings', 'errors')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (operation, scheme): [count, seconds sum, bucket counts...]
+        self.timings = {}
+        # (operation, scheme, reason): count
+        self.errors = {}
+
+
+_stripes = tuple(_Stripe() for _ in range(STRIPES))
+_stripe_ids = itertools.count()
+_local = threading.local()
+
+
+def _stripe():
+    # Threads are assigned stripes round robin on their first record.
+    try:
+        return _local.stripe
+    except AttributeError:
+        stripe = _local.stripe = _stripes[next(_stripe_ids) % STRIPES]
+        return stripe
+
+
+def _reason(operation, scheme, args):
+    # Classify a failure by validating its tag data, imported here so only failures load it.
+    if operation not in _decode_operations or not args:
+        return 'invalid_value'
+
+    from epc.utils import epc_encoding_map, epc_encoding_types
+    from epc.utils.validation import EPC_OK, EPC_UNKNOWN_HEADER, _check
+
+    try:
+        code, header = _check(args[0])
+    except (AttributeError, TypeError, ValueError):
+        return 'invalid_value'
+
+    if code == EPC_UNKNOWN_HEADER:
+        if epc_encoding_types.get(header, 'Reserved') not in ('Reserved', 'Unprogrammed'):
+            return 'unimplemented_scheme'
+    elif code == EPC_OK:
+        # Valid tag data for another scheme than the one decoding it.
+        if operation == 'decode' and epc_encoding_map[header].__name__ != scheme:
+            return 'unknown_header'
+        return 'invalid_value'
+
+    return _reasons[code]
+
+
+def _record(operation, scheme, elapsed, reason=None):
+    key = (operation, scheme)
+    bucket = bisect_left(BUCKETS, elapsed)
+    stripe = _stripe()
+
+    with stripe.lock:
+        timing = stripe.timings.get(key)
+        if timing is None:
+            timing = stripe.timings[key] = [0, 0.0] + [0] * (len(BUCKETS) + 1)
+
+        timing[0] += 1
+        timing[1] += elapsed
+        timing[2 + bucket] += 1
+
+        if reason is not None:
+            error_key = (operation, scheme, reason)
+            stripe.errors[error_key] = stripe.errors.get(error_key, 0) + 1
+
+
+def _instrument_method(function, operation):
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            result = function(self, *args, **kwargs)
+        except Exception:
+            scheme = type(self).__name__
+            _record(operation, scheme, perf_counter() - start, _reason(operation, scheme, args))
+            raise
+        _record(operation, type(self).__name__, perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+def _instrument_function(function, operation, scheme=None):
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception:
+            _record(operation, scheme or 'unknown', perf_counter() - start,
+                    _reason(operation, scheme, args))
+            raise
+        _record(operation, scheme or type(result).__name__, perf_counter() - start)
+        return result
+
+    return wrapper
+
+
+def _patch(owner, name, replacement):
+    _patches.append((owner, name, getattr(owner, name)))
+    setattr(owner, name, replacement)
+
+
+def _scheme_classes():
+    from epc import schemes
+    return [getattr(schemes, name) for name in schemes.__all__]
+
+
+def is_enabled():
+    """
+    :return: Whether instrumentation is currently enabled.
+    :rtype: bool
+    """
+    return bool(_patches)
+
+
+def enable():
+    """
+    Start recording metrics. Calling this when already enabled has no effect.
+    """
+    import epc.utils
+
+    with _lock:
+        if _patches:
+            return
+
+        _patch(epc.utils, 'decode_epc', _instrument_function(epc.utils.decode_epc, 'dispatch'))
+        _patch(epc.utils, 'get_epc_header', _instrument_function(
+            epc.utils.get_epc_header, 'header', scheme='all'))
+
+        for cls in _scheme_classes():
+            for name, operation in _methods:
+                if name in cls.__dict__:
+                    _patch(cls, name, _instrument_method(cls.__dict__[name], operation))
+
+            for name in _properties:
+                prop = cls.__dict__.get(name)
+                if isinstance(prop, property):
+                    _patch(cls, name, property(
+                        _instrument_method(prop.fget, name), prop.fset, prop.fdel, prop.__doc__
+                    ))
+
+
+def disable():
+    """
+    Stop recording metrics and restore the uninstrumented functions. Recorded metrics are kept
+    until :func:`reset` is called.
+    """
+    with _lock:
+        while _patches:
+            owner, name, original = _patches.pop()
+            setattr(owner, name, original)
+
+
+def reset():
+    """
+    Clear all recorded metrics.
+    """
+    for stripe in _stripes:
+        with stripe.lock:
+            stripe.timings.clear()
+            stripe.errors.clear()
+
+
+def snapshot():
+    """
+    Get a copy of the recorded metrics.
+
+    :return: Dictionary containing:
+
+        * ``enabled`` (bool)
+
+        * ``operations`` (list): one dict per operation and scheme, with ``operation``,
+          ``scheme``, ``count``, ``errors`` (by reason), ``seconds_sum`` and ``buckets``
+          (non-cumulative counts per bucket in :data:`BUCKETS`, plus one for larger values)
+    :rtype: dict
+    """
+    timings = {}
+    errors = {}
+    for stripe in _stripes:
+        with stripe.lock:
+            for key, timing in stripe.timings.items():
+                total = timings.get(key)
+                if total is None:
+                    timings[key] = list(timing)
+                else:
+                    timings[key] = [a + b for a, b in zip(total, timing)]
+            for key, count in stripe.errors.items():
+                errors[key] = errors.get(key, 0) + count
+
+    operations = []
+    for (operation, scheme), timing in sorted(timings.items()):
+        operations.append({
+            'operation': operation,
+            'scheme': scheme,
+            'count': timing[0],
+            'errors': {
+                reason: count for (error_operation, error_scheme, reason), count in errors.items()
+                if error_operation == operation and error_scheme == scheme
+            },
+            'seconds_sum': timing[1],
+            'buckets': timing[2:],
+        })
+
+    return {'enabled': is_enabled(), 'operations': operations}
+
+
+def to_prometheus(prefix='epc'):
+    """
+    Export the recorded metrics in the Prometheus text exposition format.
+
+    :param prefix: Metric name prefix. Defaults to ``epc``.
+    :type prefix: str, optional
+
+    :rtype: str
+    """
+    operations = snapshot()['operations']
+    lines = [
+        '# HELP {0}_operations_total Instrumented operations.'.format(prefix),
+        '# TYPE {0}_operations_total counter'.format(prefix),
+    ]
+
+    for entry in operations:
+        lines.append('{0}_operations_total{{operation="{1}",scheme="{2}"}} {3}'.format(
+            prefix, entry['operation'], entry['scheme'], entry['count']
+        ))
+
+    lines.extend([
+        '# HELP {0}_errors_total Failed operations, by reason.'.format(prefix),
+        '# TYPE {0}_errors_total counter'.format(prefix),
+    ])
+    for entry in operations:
+        for reason, count in sorted(entry['errors'].items()):
+            lines.append(
+                '{0}_errors_total{{operation="{1}",scheme="{2}",reason="{3}"}} {4}'.format(
+                    prefix, entry['operation'], entry['scheme'], reason, count
+                )
+            )
+
+    lines.extend([
+        '# HELP {0}_operation_seconds Operation duration.'.format(prefix),
+        '# TYPE {0}_operation_seconds histogram'.format(prefix),
+    ])
+    for entry in operations:
+        labels = 'operation="{}",scheme="{}"'.format(entry['operation'], entry['scheme'])
+        cumulative = 0
+
+        for bound, count in zip(BUCKETS + ('+Inf',), entry['buckets']):
+            cumulative += count
+            lines.append('{0}_operation_seconds_bucket{{{1},le="{2}"}} {3}'.format(
+                prefix, labels, bound, cumulative
+            ))
+
+        lines.append('{0}_operation_seconds_sum{{{1}}} {2!r}'.format(
+            prefix, labels, entry['seconds_sum']))
+        lines.append('{0}_operation_seconds_count{{{1}}} {2}'.format(
+            prefix, labels, entry['count']))
+
+    return '\n'.join(lines) + '\n'
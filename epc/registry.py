@@ -0,0 +1,288 @@
+"""
+Persistent registry of commissioned tags, on the standard library :mod:`sqlite3`.
+
+Each tag is stored once per pure identity, keyed by its :mod:`epc.utils.keys` canonical key,
+with its decoded fields in typed, indexed columns, so queries never decode hex::
+
+    registry = TagRegistry('tags.db')
+    registry.add(hex_strings, order_id='PO-1001')
+
+    for row in registry.query(gtin='00614141123452', serial_min=1000, serial_max=1999):
+        print(row['uri'], row['commissioned_at'], row['order_id'])
+
+Serial ranges are indexed by GTIN, or by company prefix and reference for every scheme.
+
+Tags are inserted with ``executemany`` in batches of ``batch_size`` rows, one transaction per
+batch. A registry can be shared by threads, which take turns on its connection.
+"""
+import sqlite3
+import threading
+import time
+
+from epc.schemes import SGTIN
+from epc.utils import decode_epc
+from epc.utils.keys import KEY_SIZE
+
+COLUMNS = (
+    # Column name, SQLite type
+    ('key', 'BLOB PRIMARY KEY'),
+    ('hex', 'TEXT NOT NULL'),
+    ('encoding', 'TEXT NOT NULL'),
+    ('filter', 'INTEGER NOT NULL'),
+    ('company_prefix', 'TEXT NOT NULL'),
+    ('reference', 'INTEGER NOT NULL'),
+    ('serial', 'INTEGER'),
+    ('serial_text', 'TEXT'),
+    ('gtin', 'TEXT'),
+    ('uri', 'TEXT NOT NULL'),
+    ('commissioned_at', 'REAL NOT NULL'),
+    ('order_id', 'TEXT'),
+)
+
+INDEXES = (
+    # Index name, Columns
+    ('tags_gtin', 'gtin, serial'),
+    ('tags_reference', 'company_prefix, reference, serial'),
+    ('tags_uri', 'uri'),
+    ('tags_order_id', 'order_id'),
+)
+
+# Largest serial number stored in the integer column, SQLite integers are signed 64 bit.
+_MAX_SERIAL = (1 << 63) - 1
+
+_INSERT = 'INSERT OR REPLACE INTO tags VALUES ({})'.format(', '.join('?' * len(COLUMNS)))
+
+
+def _serial_columns(serial):
+    # Numeric serials go in the integer column, matching identity keys: strings with leading
+    # zeros are alphanumeric.
+    if isinstance(serial, str):
+        if not serial.isdigit() or (serial[0] == '0' and len(serial) > 1):
+            return None, serial
+        serial = int(serial)
+
+    if serial > _MAX_SERIAL:
+        return None, str(serial)
+    return serial, None
+
+
+def _glob(pattern):
+    # Pure identity patterns use `*` for any value, escape GLOB's other special characters.
+    if pattern.startswith('urn:epc:idpat:'):
+        pattern = 'urn:epc:id:' + pattern[14:]
+    return pattern.replace('[', '[[]').replace('?', '[?]')
+
+
+class TagRegistry:
+    """
+    Registry of commissioned tags in a SQLite database, created if it doesn't exist.
+
+    Adding a tag with the pure identity of a registered tag replaces it. Methods can be called
+    from many threads, a lock serializes their use of the connection.
+
+    :param path: Database file, or ``:memory:``. Defaults to ``:memory:``.
+    :type path: str, optional
+
+    :param batch_size: Rows per insert transaction. Defaults to ``100000``.
+    :type batch_size: int, optional
+    """
+
+    def __init__(self, path=':memory:', batch_size=100000):
+        self.path = path
+        self.batch_size = batch_size
+
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        # A 64 MiB page cache keeps index pages of large loads in memory.
+        self._connection.execute('PRAGMA cache_size = -65536')
+
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode = WAL')
+            self._connection.execute('PRAGMA synchronous = NORMAL')
+
+        with self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS tags ({}) WITHOUT ROWID'.format(
+                ', '.join('{} {}'.format(name, column_type) for name, column_type in COLUMNS)
+            ))
+            for name, columns in INDEXES:
+                self._connection.execute(
+                    'CREATE INDEX IF NOT EXISTS {} ON tags ({})'.format(name, columns)
+                )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM tags').fetchone()[0]
+
+    def __contains__(self, tag):
+        return self.get(tag) is not None
+
+    @staticmethod
+    def _row(tag, commissioned_at, order_id):
+        # Keep the value of decoded input, rather than encoding the tag again.
+        if isinstance(tag, str):
+            value = int(tag, 16)
+            tag = decode_epc(value)
+        elif isinstance(tag, int):
+            value = tag
+            tag = decode_epc(value)
+        else:
+            value = int(tag)
+
+        key = tag.identity_key()
+        (prefix_attribute, _), (reference_attribute, _), (serial_attribute, _) = \
+            tag._identity_fields
+        company_prefix_length = getattr(tag, '_company_prefix_length', None)
+        company_prefix = getattr(tag, prefix_attribute)
+        serial, serial_text = _serial_columns(getattr(tag, serial_attribute))
+
+        return (
+            key.to_bytes(KEY_SIZE, 'big'),
+            '{:0{}x}'.format(value, tag._tag_size // 4),
+            tag.encoding,
+            getattr(tag, '_tag_filter', 0),
+            '{:0{}d}'.format(company_prefix, company_prefix_length or 0),
+            getattr(tag, reference_attribute) if reference_attribute else 0,
+            serial,
+            serial_text,
+            tag.gtin if isinstance(tag, SGTIN) else None,
+            tag.pure_identity_uri,
+            commissioned_at,
+            order_id,
+        )
+
+    def add(self, tags, commissioned_at=None, order_id=None):
+        """
+        Add tags to the registry.
+
+        A batch that fails to decode is rolled back, batches added before it are kept.
+
+        :param tags: Tag objects, or hex strings or integers to decode.
+        :type tags: iterable
+
+        :param commissioned_at: Unix timestamp the tags were commissioned at. Defaults to now.
+        :type commissioned_at: float, optional
+
+        :param order_id: Order the tags were commissioned for.
+        :type order_id: str, optional
+
+        :raises ValueError: Unable to decode a tag.
+        :raises NotImplementedError: Scheme not implemented for a tag.
+        :raises AttributeError: If any components of a tag are missing.
+
+        :return: Number of tags added.
+        :rtype: int
+        """
+        if commissioned_at is None:
+            commissioned_at = time.time()
+
+        row = self._row
+        count = 0
+        batch = []
+
+        for tag in tags:
+            batch.append(row(tag, commissioned_at, order_id))
+            if len(batch) >= self.batch_size:
+                count += self._insert(batch)
+                batch = []
+
+        if batch:
+            count += self._insert(batch)
+
+        return count
+
+    def _insert(self, rows):
+        with self._lock, self._connection:
+            self._connection.executemany(_INSERT, rows)
+        return len(rows)
+
+    def get(self, tag):
+        """
+        Get the registered row of a tag's pure identity.
+
+        :param tag: Tag object, or hex string or integer to decode.
+        :type tag: :class:`epc.schemes.base.EpcScheme`, str, int
+
+        :return: The row, or ``None`` if the tag isn't registered.
+        :rtype: sqlite3.Row
+        """
+        if isinstance(tag, (str, int)):
+            tag = decode_epc(tag)
+
+        key = tag.identity_key().to_bytes(KEY_SIZE, 'big')
+        with self._lock:
+            return self._connection.execute('SELECT * FROM tags WHERE key = ?', (key,)).fetchone()
+
+    def query(self, gtin=None, company_prefix=None, reference=None, serial_min=None,
+              serial_max=None, uri=None, order_id=None, limit=None):
+        """
+        Find registered tags matching all of the given conditions, in no particular order.
+
+        :param gtin: GTIN-14 of SGTIN tags.
+        :type gtin: str, optional
+
+        :param company_prefix: Company prefix digits (GID manager number).
+        :type company_prefix: str, optional
+
+        :param reference: Item reference, location reference, asset type, document type or
+            GID object class, ``0`` for schemes without one. Matches tags of any scheme with
+            the reference, use ``uri`` to choose the scheme.
+        :type reference: int, optional
+
+        :param serial_min: Lowest numeric serial number. Indexed together with ``gtin``, or
+            with ``company_prefix`` and ``reference``.
+        :type serial_min: int, optional
+
+        :param serial_max: Highest numeric serial number. Indexed together with ``gtin``, or
+            with ``company_prefix`` and ``reference``.
+        :type serial_max: int, optional
+
+        :param uri: Pure identity URI, with ``*`` matching any value, or a pure identity
+            pattern URI such as ``urn:epc:idpat:sgtin:0614141.812345.*``.
+        :type uri: str, optional
+
+        :param order_id: Order the tags were commissioned for.
+        :type order_id: str, optional
+
+        :param limit: Maximum rows returned.
+        :type limit: int, optional
+
+        :return: Iterator of rows, with a value for each of :data:`COLUMNS`. The rows are
+            fetched before returning, so other threads can use the registry meanwhile.
+        :rtype: iterator
+        """
+        conditions = []
+        parameters = []
+
+        for condition, value in (
+            ('gtin = ?', gtin),
+            ('company_prefix = ?', company_prefix),
+            ('reference = ?', reference),
+            ('serial >= ?', serial_min),
+            ('serial <= ?', serial_max),
+            ('uri GLOB ?', _glob(uri) if uri is not None else None),
+            ('order_id = ?', order_id),
+        ):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+
+        sql = 'SELECT * FROM tags'
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        if limit is not None:
+            sql += ' LIMIT ?'
+            parameters.append(limit)
+
+        with self._lock:
+            return iter(self._connection.execute(sql, parameters).fetchall())
@@ -0,0 +1,479 @@
+from epc.encoding import calc_check_digit, encode_int, encode_partition, partition_layout
+
+from .base import EpcScheme
+
+_gdti_partition_table = {
+    # Partition Value: (Company Prefix Length (bits),
+    #                   Company Prefix Length (digits),
+    #                   Document Type Length (bits))
+    0: (40, 12, 1),
+    1: (37, 11, 4),
+    2: (34, 10, 7),
+    3: (30, 9, 11),
+    4: (27, 8, 14),
+    5: (24, 7, 17),
+    6: (20, 6, 21),
+}
+
+_gdti_prefix_table = {
+    # Company Prefix Length (digits): (Partition Value,
+    #                                  Document Type Length (bits)
+    #                                  Document Type Length (digits))
+    12: (0, 1, 0),
+    11: (1, 4, 1),
+    10: (2, 7, 2),
+    9: (3, 11, 3),
+    8: (4, 14, 4),
+    7: (5, 17, 5),
+    6: (6, 21, 6),
+}
+
+_gdti_serial_bit_lengths = {
+    # Tag Size: Serial Number Length (bits)
+    96: 41,
+    128: 58,
+}
+
+_gdti_layouts = {
+    # Tag Size: {Partition Value: (Company Prefix Shift, Mask, Document Type Shift, Mask)}
+    96: partition_layout(_gdti_partition_table, 96),
+    128: partition_layout(_gdti_partition_table, 128),
+}
+
+
+class GDTI(EpcScheme):
+    """
+    The Global Document Type Identifier EPC scheme is used to assign a unique identity to a
+    specific document, such as land registration papers, an insurance policy, and others.
+
+    General syntax:
+    urn:epc:id:gdti:CompanyPrefix.DocumentType.SerialNumber
+
+    Example:
+    urn:epc:id:gdti:0614141.12345.400
+    """
+    GDTI_96 = 'gdti-96'
+    GDTI_113 = 'gdti-113'
+    ENCODINGS = (
+        GDTI_96, GDTI_113
+    )
+
+    HEADER_96 = 0x2C
+    HEADER_113 = 0x3A
+    HEADER_BARCODE = '253'
+    HEADERS = (
+        HEADER_96, HEADER_113
+    )
+
+    FILTER_ALL = 0
+    FILTER_TRAVEL_DOCUMENT = 1
+    FILTER_RESERVED_2 = 2
+    FILTER_RESERVED_3 = 3
+    FILTER_RESERVED_4 = 4
+    FILTER_RESERVED_5 = 5
+    FILTER_RESERVED_6 = 6
+    FILTER_RESERVED_7 = 7
+    FILTERS = (
+        (FILTER_ALL, 'All Others'),
+        (FILTER_TRAVEL_DOCUMENT, 'Travel Document'),
+        (FILTER_RESERVED_2, 'Reserved'),
+        (FILTER_RESERVED_3, 'Reserved'),
+        (FILTER_RESERVED_4, 'Reserved'),
+        (FILTER_RESERVED_5, 'Reserved'),
+        (FILTER_RESERVED_6, 'Reserved'),
+        (FILTER_RESERVED_7, 'Reserved'),
+    )
+
+    SIZE_96 = 96
+    SIZE_113 = 128  # While the size is really 113, set to 128 because we need a multiple of 16.
+    TAG_SIZES = (
+        SIZE_96, SIZE_113
+    )
+
+    _company_prefix = None
+    _company_prefix_length = None
+    _document_type = None
+    _document_type_length = None
+    _serial = None
+
+    _identity_fields = (
+        ('_company_prefix', 'company_prefix'),
+        ('_document_type', 'document_type'),
+        ('_serial', 'serial_number'),
+    )
+    _serial_bits_96 = _gdti_serial_bit_lengths[96]
+
+    def __init__(self, *args, **kwargs):
+        self._tag_size = self.SIZE_96
+        self._tag_filter = self.FILTER_ALL
+        super().__init__(*args, **kwargs)
+
+    def __int__(self):
+        self.check_fields()
+
+        partition, type_bit_length, type_digits = _gdti_prefix_table[self._company_prefix_length]
+        prefix_bit_length = _gdti_partition_table[partition][0]
+
+        content = encode_partition(
+            partition,
+            self._company_prefix, prefix_bit_length,
+            self._document_type, type_bit_length, d_digits=type_digits
+        )
+
+        serial_bit_length = _gdti_serial_bit_lengths[self._tag_size]
+        if self._tag_size == self.SIZE_96:
+            header = self.HEADER_96
+            serial = self._serial
+        elif self._tag_size == self.SIZE_113:
+            # Numeric string encoding, a leading 1 keeps the serial number's leading zeros.
+            header = self.HEADER_113
+            serial = int('1' + self._serial)
+
+        if serial.bit_length() > serial_bit_length:
+            raise AttributeError('Serial number must fit in %d bits' % serial_bit_length)
+
+        return int('{header:08b}{tag_filter:03b}{content}{serial}{padding}'.format(
+            header=header, tag_filter=self._tag_filter, content=content,
+            serial=encode_int(serial, serial_bit_length),
+            padding=('0' * 15 if self._tag_size == self.SIZE_113 else ''),
+        ), 2)
+
+    @property
+    def pure_identity_uri(self):
+        """
+        :return: The tag's pure identity URI.
+        :rtype: str
+        """
+        self.check_fields()
+
+        return 'urn:epc:id:gdti:' \
+               '{_company_prefix:0{_company_prefix_length}d}.{document_type}.{_serial}'.format(
+                    document_type=self.values['document_type'], **self.__dict__
+                )
+
+    @property
+    def tag_uri(self):
+        """
+        :return: The tag's URI.
+        :rtype: str
+        """
+        self.check_fields()
+
+        return 'urn:epc:tag:{encoding}:{_tag_filter}.' \
+               '{_company_prefix:0{_company_prefix_length}d}.{document_type}.{_serial}'.format(
+                    encoding=self.encoding, document_type=self.values['document_type'],
+                    **self.__dict__
+                )
+
+    @property
+    def gdti(self):
+        """
+        The GDTI key, without the serial number: the GS1 Company Prefix, the document type and
+        a check digit.
+
+        :return: The 13 digit GDTI key of the tag.
+        :rtype: str
+        """
+        self.check_fields()
+
+        values = self.values
+        gdti = values['company_prefix'] + values['document_type']
+        return gdti + str(calc_check_digit(gdti))
+
+    @property
+    def barcode(self):
+        """
+        :return: The barcode representation of the tag.
+        :rtype: str
+        """
+        return '{header}{gdti}{serial}'.format(
+            header=self.HEADER_BARCODE, gdti=self.gdti, serial=self._serial
+        )
+
+    @property
+    def barcode_humanized(self):
+        """
+        :return: A human readable barcode representation of the tag.
+        :rtype: str
+        """
+        return '({header}) {gdti}{serial}'.format(
+            header=self.HEADER_BARCODE, gdti=self.gdti, serial=self._serial
+        )
+
+    @property
+    def encoding(self):
+        encoding = None
+        if self._tag_size == self.SIZE_96:
+            encoding = self.GDTI_96
+        elif self._tag_size == self.SIZE_113:
+            encoding = self.GDTI_113
+        return encoding
+
+    @property
+    def values(self):
+        """
+        :return: Dictionary containing:
+
+            * ``size`` (int): the tag's size in bits
+
+            * ``filter`` (int)
+
+            * ``company_prefix`` (str)
+
+            * ``document_type`` (str)
+
+            * ``serial_number`` (int *or* str)
+        """
+        if self._document_type_length > 0:
+            document_type = '{:0{}d}'.format(self._document_type, self._document_type_length)
+        else:
+            document_type = ''
+
+        return {
+            'size': self._tag_size,
+            'filter': self._tag_filter,
+            'company_prefix': '{:0{}d}'.format(self._company_prefix, self._company_prefix_length),
+            'document_type': document_type,
+            'serial_number': self._serial,
+        }
+
+    def filter(self, tag_filter):
+        """
+        The filter value is additional control information that may be included in the EPC memory
+        bank of a Gen 2 tag, allowing an RFID reader to select or deselect the tags corresponding
+        to certain physical objects.
+
+        Allowed values for GDTI tags:
+
+        +-------+------------------------+-----------------+
+        | Value | Constant               | Description     |
+        +=======+========================+=================+
+        | 0     | FILTER_ALL             | All Others      |
+        +-------+------------------------+-----------------+
+        | 1     | FILTER_TRAVEL_DOCUMENT | Travel Document |
+        +-------+------------------------+-----------------+
+        | 2-7   | FILTER_RESERVED_*      | Reserved        |
+        +-------+------------------------+-----------------+
+
+        :param tag_filter: The filter value, defaults to ``FILTER_ALL``.
+        :type tag_filter: int
+
+        :raises AttributeError: Filter must be between 0 and 7.
+
+        :return: The GDTI tag object.
+        :rtype: :class:`epc.schemes.GDTI`
+        """
+        if not (tag_filter >= 0 and tag_filter <= 7):
+            raise AttributeError('Filter must be between 0 and 7 (inclusive)')
+
+        self._tag_filter = tag_filter
+        self._identity = self._strict_identity = None
+        return self
+
+    def company_prefix(self, company_prefix, company_prefix_length=None):
+        """
+        The GS1 Company Prefix, assigned by GS1 to a managing entity. The Company Prefix is the
+        same as the GS1 Company Prefix digits within a GS1 GDTI key.
+
+        Length corresponds to the number of digits in the company prefix.
+
+        :param company_prefix: GS1 company prefix.
+        :type company_prefix: str, int
+
+        :param company_prefix_length: Number of digits in the company prefix.
+            Required when ``company_prefix`` is an int.
+        :type company_prefix_length: int, optional
+
+        :return: The GDTI tag object.
+        :rtype: :class:`epc.schemes.GDTI`
+        """
+        if isinstance(company_prefix, str):
+            company_prefix_length = len(company_prefix)
+            company_prefix = int(company_prefix)
+        elif isinstance(company_prefix, int):
+            if company_prefix_length is None:
+                raise AttributeError(
+                    'company_prefix_length must be provided if the company prefix is an integer'
+                )
+
+        if not (company_prefix_length >= 6 and company_prefix_length <= 12):
+            raise AttributeError('company_prefix_length must be between 6 and 12 (inclusive)')
+
+        self._company_prefix = company_prefix
+        self._company_prefix_length = company_prefix_length
+        self._document_type_length = _gdti_prefix_table[self._company_prefix_length][2]
+        self._identity = self._strict_identity = None
+        return self
+
+    def document_type(self, document_type):
+        """
+        The Document Type, assigned by the managing entity to a particular class of document.
+
+        :param document_type: The document type
+        :type document_type: int, str
+
+        :raises AttributeError: Unable to convert input to an integer.
+
+        :return: The GDTI tag object.
+        :rtype: :class:`epc.schemes.GDTI`
+        """
+        if isinstance(document_type, str):
+            try:
+                document_type = int(document_type)
+            except ValueError:
+                raise AttributeError('document_type must be an integer')
+
+        self._document_type = document_type
+        self._identity = self._strict_identity = None
+        return self
+
+    def serial_number(self, serial_number):
+        """
+        The Serial Number, assigned by the managing entity to an individual document. GDTI-96
+        serial numbers are integers, GDTI-113 serial numbers are strings of up to 17 digits and
+        may have leading zeros.
+
+        :param serial_number: The serial number
+        :type serial_number: int, str
+
+        :raises AttributeError: Serial number invalid for the tag size.
+
+        :return: The GDTI tag object.
+        :rtype: :class:`epc.schemes.GDTI`
+        """
+        if self._tag_size == self.SIZE_96:
+            if isinstance(serial_number, str):
+                try:
+                    serial_number = int(serial_number)
+                except ValueError:
+                    raise AttributeError('serial_number must be an integer')
+        elif self._tag_size == self.SIZE_113:
+            serial_number = str(serial_number)
+            if not serial_number.isdigit() or len(serial_number) > 17:
+                raise AttributeError('serial_number must be between 1 and 17 digits')
+
+        self._serial = serial_number
+        self._identity = self._strict_identity = None
+        return self
+
+    def decode_epc(self, hex_string):
+        """
+        Decode an encoded tag and populate this object's values from it.
+
+        :param hex_string: Tag data encoded as a hexadecimal string, or as an integer.
+        :type hex_string: str, int
+
+        :raises ValueError: EPC scheme header does not match input.
+        :raises ValueError: Partition does not match allowed values.
+        :raises ValueError: Supplied ``hex_string`` bit length invalid.
+        """
+        tag_data = self.read_tag_data(hex_string)
+        tag_size = self._tag_size
+
+        # Verify header, it must match the tag size
+        header = tag_data >> (tag_size - 8)
+        if header != self.HEADERS[self.TAG_SIZES.index(tag_size)]:
+            raise ValueError(
+                'Header `{:#04x}` does not match allowed values: ({}).'.format(
+                    header, ', '.join('{:#04x}'.format(h) for h in self.HEADERS)
+                )
+            )
+
+        # Read tag filter, every 3 bit value is allowed
+        self._tag_filter = tag_data >> (tag_size - 11) & 0x7
+
+        # Read partition
+        partition = tag_data >> (tag_size - 14) & 0x7
+        layout = _gdti_layouts[tag_size].get(partition)
+        if layout is None:
+            raise ValueError('Partition `%s` does not match allowed values: %s' % (
+                partition, _gdti_partition_table.keys()
+            ))
+
+        # Decode partition elements from their precomputed positions
+        prefix_shift, prefix_mask, type_shift, type_mask = layout
+        self._company_prefix_length = _gdti_partition_table[partition][1]
+        self._document_type_length = _gdti_prefix_table[self._company_prefix_length][2]
+        self._company_prefix = tag_data >> prefix_shift & prefix_mask
+        self._document_type = tag_data >> type_shift & type_mask
+
+        # Decode serial, which follows the partition elements
+        serial = tag_data >> type_shift - _gdti_serial_bit_lengths[tag_size]
+        serial &= (1 << _gdti_serial_bit_lengths[tag_size]) - 1
+
+        if tag_size == self.SIZE_96:
+            self._serial = serial
+        elif tag_size == self.SIZE_113:
+            serial = str(serial)
+            if serial[0] != '1' or len(serial) == 1:
+                raise ValueError('Serial number `%s` is not a valid numeric string' % serial)
+            self._serial = serial[1:]
+
+    def decode_barcode(self, barcode, company_prefix_length):
+        """
+        Decode a barcode and populate this object's values from it. Serial numbers that are too
+        long for GDTI-96, or have leading zeros, use the GDTI-113 encoding.
+
+        :param hex_string: Barcode
+        :type hex_string: str
+
+        :param company_prefix_length: Number of digits of the company prefix length, or a
+            resolver returning it, such as
+            :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+        :type company_prefix_length: int, callable
+
+        :raises ValueError: Expected barcode header does not match input.
+        :raises AttributeError: Invalid check digit.
+        :raises AttributeError: Invalid barcode length, or wrong company prefix.
+        """
+        if barcode[:3] != self.HEADER_BARCODE:
+            raise ValueError(
+                'Barcode header does not match expected value: %s' % self.HEADER_BARCODE
+            )
+
+        self._decode_elements({'253': barcode[3:]}, company_prefix_length)
+
+    def _decode_elements(self, elements, company_prefix_length):
+        # Populate this object's values from the GDTI (253) data of a GS1 element string, the
+        # document type followed by the serial number.
+        gdti = elements['253'][:13]
+        serial_number = elements['253'][13:]
+        if len(gdti) != 13 or not gdti.isdigit() or not serial_number.isdigit():
+            raise AttributeError('Invalid barcode length, or non-numeric GDTI')
+
+        company_prefix_length = self.resolve_company_prefix_length(company_prefix_length, gdti)
+        if company_prefix_length not in _gdti_prefix_table:
+            raise AttributeError('company_prefix_length must be between 6 and 12 (inclusive)')
+
+        check_digit = int(gdti[12])
+        valid_check_digit = calc_check_digit(gdti[:12])
+        if check_digit != valid_check_digit:
+            raise AttributeError('Invalid check digit (found %s, expected %s)' % (
+                check_digit, valid_check_digit))
+
+        if (serial_number[0] == '0' and len(serial_number) > 1) or \
+                int(serial_number).bit_length() > _gdti_serial_bit_lengths[self.SIZE_96]:
+            self._tag_size = self.SIZE_113
+
+        self.company_prefix(gdti[:company_prefix_length], company_prefix_length)
+        self.document_type(gdti[company_prefix_length:12] or 0)
+        self.serial_number(serial_number)
+
+    def check_fields(self):
+        """
+        Checks to make sure all components of the tag are present, including ``size``,
+        ``filter``, ``company_prefix``, ``document_type`` and ``serial_number``.
+
+        :raises AttributeError: If any components of the tag are missing.
+        """
+        super().check_fields()
+        if self._tag_size is None:
+            raise AttributeError('Tag size not specified')
+        if self._tag_filter is None:
+            raise AttributeError('Tag filter not specified')
+        if self._company_prefix is None:
+            raise AttributeError('Company prefix not specified')
+        if self._document_type is None:
+            raise AttributeError('Document type not specified')
+        if self._serial is None:
+            raise AttributeError('Serial number not specified')
@@ -1,7 +1,7 @@
 from epc.encoding import (
-    decode_int, decode_partition, encode_partition,
-    is_encodable_string, url_encode_string,
-    decode_string_partition, encode_string_partition
+    decode_string, encode_int, encode_partition,
+    is_encodable_string, partition_layout, url_encode_string,
+    encode_string_partition
 )
 
 from .base import EpcScheme
@@ -59,6 +59,13 @@ _giai_202_prefix_table = {
 }
 
 
+_giai_layouts = {
+    # Tag Size: (Partition Table, Partition Layout)
+    96: (_giai_96_partition_table, partition_layout(_giai_96_partition_table, 96)),
+    208: (_giai_202_partition_table, partition_layout(_giai_202_partition_table, 208)),
+}
+
+
 class GIAI(EpcScheme):
     """
     The Global Individual Asset Identifier EPC scheme is used to assign a unique identity
@@ -79,9 +86,9 @@ class GIAI(EpcScheme):
     :param barcode: GIAI barcode data
     :type barcode: str, optional
 
-    :param company_prefix_length: Number of digits in the company prefix.
-        Required when specifying a barcode.
-    :type company_prefix_length: int, optional
+    :param company_prefix_length: Number of digits in the company prefix, or a resolver
+        returning it. Required when specifying a barcode.
+    :type company_prefix_length: int, callable, optional
     """
     GIAI_96 = 'giai-96'
     GIAI_202 = 'giai-202'
@@ -129,6 +136,15 @@ class GIAI(EpcScheme):
     _company_prefix_length = None
     _asset_reference = None
 
+    _identity_fields = (
+        ('_company_prefix', 'company_prefix'),
+        (None, None),
+        ('_asset_reference', 'asset_reference'),
+    )
+    _serial_bits_96 = {
+        length: bits for length, (_, bits, _) in _giai_96_prefix_table.items()
+    }
+
     def __init__(self, *args, **kwargs):
         self._tag_size = self.SIZE_96
         self._tag_filter = self.FILTER_ALL
@@ -287,6 +303,7 @@ class GIAI(EpcScheme):
             raise AttributeError('Filter must be between 0 and 7 (inclusive)')
 
         self._tag_filter = tag_filter
+        self._identity = self._strict_identity = None
         return self
 
     def company_prefix(self, company_prefix, company_prefix_length=None):
@@ -320,6 +337,7 @@ class GIAI(EpcScheme):
 
         self._company_prefix = company_prefix
         self._company_prefix_length = company_prefix_length
+        self._identity = self._strict_identity = None
         return self
 
     def asset_reference(self, asset_reference):
@@ -343,23 +361,25 @@ class GIAI(EpcScheme):
             is_encodable_string(asset_reference, raise_exception=True)
 
         self._asset_reference = asset_reference
+        self._identity = self._strict_identity = None
         return self
 
     def decode_epc(self, hex_string):
         """
         Decode an encoded tag and populate this object's values from it.
 
-        :param hex_string: Tag data encoded as a hexadecimal string.
-        :type hex_string: str
+        :param hex_string: Tag data encoded as a hexadecimal string, or as an integer.
+        :type hex_string: str, int
 
         :raises ValueError: EPC scheme header does not match input.
         :raises ValueError: Filter does not match allowed values.
         :raises ValueError: Supplied ``hex_string`` bit length invalid.
         """
-        tag_binary = super().decode_epc(hex_string)
+        tag_data = self.read_tag_data(hex_string)
+        tag_size = self._tag_size
 
         # Verify header
-        header = decode_int(tag_binary[0:8])
+        header = tag_data >> (tag_size - 8)
         if header not in self.HEADERS:
             raise ValueError(
                 'Header `{:#04x}` does not match allowed values: ({}).'.format(
@@ -367,35 +387,30 @@ class GIAI(EpcScheme):
                 )
             )
 
-        # Read tag filter
-        tag_filter = decode_int(tag_binary[8:11])
-        if not any(tag_filter in f for f in self.FILTERS):
-            raise ValueError('Filter `%s` does not match allowed values: %s' % (
-                tag_filter, self.FILTERS
-            ))
-        self._tag_filter = tag_filter
+        # Read tag filter, every 3 bit value is allowed
+        self._tag_filter = tag_data >> (tag_size - 11) & 0x7
 
         # Read partition
-        partition = decode_int(tag_binary[11:14])
-        if partition not in _giai_96_partition_table.keys():
+        partition = tag_data >> (tag_size - 14) & 0x7
+        partition_table, layouts = _giai_layouts[tag_size]
+        layout = layouts.get(partition)
+        if layout is None:
             raise ValueError('Partition `%s` does not match allowed values: %s' % (
                 partition, _giai_96_partition_table.keys()
             ))
 
-        # Read tag size, determine positions of elements
-        if self._tag_size == self.SIZE_96:
-            prefix_bit_length, self._company_prefix_length, asset_bit_length = \
-                _giai_96_partition_table[partition]
-            decoder = decode_partition
-        elif self._tag_size == self.SIZE_202:
-            prefix_bit_length, self._company_prefix_length, asset_bit_length = \
-                _giai_202_partition_table[partition]
-            decoder = decode_string_partition
-
-        # Decode partition elements
-        self._company_prefix, self._asset_reference = decoder(
-            tag_binary, prefix_bit_length, asset_bit_length, start_pos=14
-        )
+        # Decode partition elements from their precomputed positions
+        prefix_shift, prefix_mask, asset_shift, asset_mask = layout
+        self._company_prefix_length = partition_table[partition][1]
+        self._company_prefix = tag_data >> prefix_shift & prefix_mask
+        asset_reference = tag_data >> asset_shift & asset_mask
+
+        if tag_size == self.SIZE_96:
+            self._asset_reference = asset_reference
+        elif tag_size == self.SIZE_202:
+            self._asset_reference = decode_string(
+                encode_int(asset_reference, partition_table[partition][2])
+            )
 
     def decode_barcode(self, barcode, company_prefix_length):
         """
@@ -404,8 +419,10 @@ class GIAI(EpcScheme):
         :param hex_string: Barcode
         :type hex_string: str
 
-        :param company_prefix_length: Number of digits of the company prefix length
-        :type company_prefix_length: int
+        :param company_prefix_length: Number of digits of the company prefix length, or a
+            resolver returning it, such as
+            :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+        :type company_prefix_length: int, callable
 
         :raises ValueError: Expected barcode header does not match input.
         :raises AttributeError: Invalid barcode length, or wrong company prefix.
@@ -415,9 +432,16 @@ class GIAI(EpcScheme):
                 'Barcode header does not match expected value: %s' % self.HEADER_BARCODE
             )
 
+        self._decode_elements({'8004': barcode[4:]}, company_prefix_length)
+
+    def _decode_elements(self, elements, company_prefix_length):
+        # Populate this object's values from the GIAI (8004) data of a GS1 element string.
+        giai = elements['8004']
+        company_prefix_length = self.resolve_company_prefix_length(company_prefix_length, giai)
+
         try:
-            company_prefix = barcode[4:4 + company_prefix_length]
-            asset_reference = barcode[company_prefix_length + 4:]
+            company_prefix = giai[:company_prefix_length]
+            asset_reference = giai[company_prefix_length:]
             asset_reference = int(asset_reference)
         except IndexError:
             raise AttributeError('Invalid barcode length, or wrong company_prefix_length specified')
@@ -1,5 +1,3 @@
-from epc.encoding import decode_int
-
 from .base import EpcScheme
 
 
@@ -37,6 +35,12 @@ class GID(EpcScheme):
     _object_class = None
     _serial_number = None
 
+    _identity_fields = (
+        ('_manager_number', 'manager_number'),
+        ('_object_class', 'object_class'),
+        ('_serial_number', 'serial_number'),
+    )
+
     def __init__(self, *args, **kwargs):
         self._tag_size = self.SIZE_96
         super().__init__(*args, **kwargs)
@@ -145,6 +149,7 @@ class GID(EpcScheme):
             )
 
         self._manager_number = manager_number
+        self._identity = self._strict_identity = None
         return self
 
     def object_class(self, object_class):
@@ -176,6 +181,7 @@ class GID(EpcScheme):
             )
 
         self._object_class = object_class
+        self._identity = self._strict_identity = None
         return self
 
     def serial_number(self, serial_number):
@@ -207,22 +213,23 @@ class GID(EpcScheme):
             )
 
         self._serial_number = serial_number
+        self._identity = self._strict_identity = None
         return self
 
     def decode_epc(self, hex_string):
         """
         Decode an encoded tag and populate this object's values from it.
 
-        :param hex_string: Tag data encoded as a hexadecimal string.
-        :type hex_string: str
+        :param hex_string: Tag data encoded as a hexadecimal string, or as an integer.
+        :type hex_string: str, int
 
         :raises ValueError: EPC scheme header does not match input.
         :raises ValueError: Supplied ``hex_string`` bit length invalid.
         """
-        tag_binary = super().decode_epc(hex_string)
+        tag_data = self.read_tag_data(hex_string)
 
         # Verify header
-        header = decode_int(tag_binary[0:8])
+        header = tag_data >> 88
         if header != self.HEADER_96:
             raise ValueError(
                 'Header `{:#04x}` does not match allowed values: ({:#04x}).'.format(
@@ -231,9 +238,9 @@ class GID(EpcScheme):
             )
 
         # Decode values
-        self._manager_number = decode_int(tag_binary[8:36])
-        self._object_class = decode_int(tag_binary[36:60])
-        self._serial_number = decode_int(tag_binary[60:96])
+        self._manager_number = tag_data >> 60 & 0xfffffff
+        self._object_class = tag_data >> 36 & 0xffffff
+        self._serial_number = tag_data & 0xfffffffff
 
     def decode_barcode(self, *args, **kwargs):
         raise NotImplementedError('This epc scheme does not support barcodes')
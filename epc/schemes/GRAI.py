@@ -1,6 +1,6 @@
 from epc.encoding import (
-    decode_int, encode_int, decode_partition, encode_partition,
-    decode_string, encode_string, is_encodable_string, url_encode_string
+    calc_check_digit, encode_int, encode_partition, decode_string, encode_string,
+    is_encodable_string, partition_layout, url_encode_string
 )
 
 from .base import EpcScheme
@@ -32,6 +32,13 @@ _grai_prefix_table = {
 }
 
 
+_grai_layouts = {
+    # Tag Size: Partition Layout
+    96: partition_layout(_grai_partition_table, 96),
+    176: partition_layout(_grai_partition_table, 176),
+}
+
+
 class GRAI(EpcScheme):
     """
     The Global Returnable Asset Identifier EPC scheme is used to assign a unique identity to a
@@ -90,6 +97,13 @@ class GRAI(EpcScheme):
     _asset_type_length = None
     _serial = None
 
+    _identity_fields = (
+        ('_company_prefix', 'company_prefix'),
+        ('_asset_type', 'asset_type'),
+        ('_serial', 'serial_number'),
+    )
+    _serial_bits_96 = 38
+
     def __init__(self, *args, **kwargs):
         self._tag_size = self.SIZE_96
         self._tag_filter = self.FILTER_ALL
@@ -269,6 +283,7 @@ class GRAI(EpcScheme):
             raise AttributeError('Filter must be between 0 and 7 (inclusive)')
 
         self._tag_filter = tag_filter
+        self._identity = self._strict_identity = None
         return self
 
     def company_prefix(self, company_prefix, company_prefix_length=None):
@@ -302,6 +317,7 @@ class GRAI(EpcScheme):
         self._company_prefix = company_prefix
         self._company_prefix_length = company_prefix_length
         self._asset_type_length = _grai_prefix_table[self._company_prefix_length][2]
+        self._identity = self._strict_identity = None
         return self
 
     def asset_type(self, asset_type):
@@ -323,6 +339,7 @@ class GRAI(EpcScheme):
                 raise AttributeError('asset_type must be an integer')
 
         self._asset_type = asset_type
+        self._identity = self._strict_identity = None
         return self
 
     def serial_number(self, serial_number):
@@ -356,23 +373,25 @@ class GRAI(EpcScheme):
             raise AttributeError('Invalid type for serial_number')
 
         self._serial = serial_number
+        self._identity = self._strict_identity = None
         return self
 
     def decode_epc(self, hex_string):
         """
         Decode an encoded tag and populate this object's values from it.
 
-        :param hex_string: Tag data encoded as a hexadecimal string.
-        :type hex_string: str
+        :param hex_string: Tag data encoded as a hexadecimal string, or as an integer.
+        :type hex_string: str, int
 
         :raises ValueError: EPC scheme header does not match input.
         :raises ValueError: Filter does not match allowed values.
         :raises ValueError: Supplied ``hex_string`` bit length invalid.
         """
-        tag_binary = super().decode_epc(hex_string)
+        tag_data = self.read_tag_data(hex_string)
+        tag_size = self._tag_size
 
         # Verify header
-        header = decode_int(tag_binary[0:8])
+        header = tag_data >> (tag_size - 8)
         if header not in self.HEADERS:
             raise ValueError(
                 'Header `{:#04x}` does not match allowed values: ({}).'.format(
@@ -380,39 +399,29 @@ class GRAI(EpcScheme):
                 )
             )
 
-        # Read tag filter
-        tag_filter = decode_int(tag_binary[8:11])
-        if not any(tag_filter in f for f in self.FILTERS):
-            raise ValueError('Filter `%s` does not match allowed values: %s' % (
-                tag_filter, self.FILTERS
-            ))
-        self._tag_filter = tag_filter
+        # Read tag filter, every 3 bit value is allowed
+        self._tag_filter = tag_data >> (tag_size - 11) & 0x7
 
         # Read partition value
-        partition = decode_int(tag_binary[11:14])
-        if partition not in _grai_partition_table.keys():
+        partition = tag_data >> (tag_size - 14) & 0x7
+        layout = _grai_layouts[tag_size].get(partition)
+        if layout is None:
             raise ValueError('Partition `%s` does not match allowed values: %s' % (
                 partition, _grai_partition_table.keys()
             ))
 
-        # Read tag size, determine positions of elements
-        prefix_bit_length, self._company_prefix_length, type_bit_length = \
-            _grai_partition_table[partition]
+        # Decode partition elements from their precomputed positions
+        prefix_shift, prefix_mask, type_shift, type_mask = layout
+        self._company_prefix_length = _grai_partition_table[partition][1]
         self._asset_type_length = _grai_prefix_table[self._company_prefix_length][2]
+        self._company_prefix = tag_data >> prefix_shift & prefix_mask
+        self._asset_type = tag_data >> type_shift & type_mask
 
-        # Decode partition elements
-        self._company_prefix, self._asset_type = decode_partition(
-            tag_binary, prefix_bit_length, type_bit_length, start_pos=14
-        )
-
-        # Decode serial
-        serial_start = 58
-        if self._tag_size == self.SIZE_96:
-            serial_length = 38
-            self._serial = decode_int(tag_binary[serial_start:serial_start + serial_length])
-        elif self._tag_size == self.SIZE_170:
-            serial_length = 112
-            self._serial = decode_string(tag_binary[serial_start:serial_start + serial_length])
+        # Decode serial, from bit 58
+        if tag_size == self.SIZE_96:
+            self._serial = tag_data & 0x3fffffffff
+        elif tag_size == self.SIZE_170:
+            self._serial = decode_string(encode_int(tag_data >> 6 & (1 << 112) - 1, 112))
 
     def decode_barcode(self, barcode, company_prefix_length):
         """
@@ -421,8 +430,10 @@ class GRAI(EpcScheme):
         :param hex_string: Barcode
         :type hex_string: str
 
-        :param company_prefix_length: Number of digits of the company prefix length
-        :type company_prefix_length: int
+        :param company_prefix_length: Number of digits of the company prefix length, or a
+            resolver returning it, such as
+            :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+        :type company_prefix_length: int, callable
 
         :raises ValueError: Expected barcode header does not match input.
         :raises AttributeError: Invalid barcode length, or wrong company prefix.
@@ -432,28 +443,38 @@ class GRAI(EpcScheme):
                 'Barcode header does not match expected value: %s' % self.HEADER_BARCODE
             )
 
-        company_prefix_end = company_prefix_length + 5
+        self._decode_elements({'8003': barcode[4:]}, company_prefix_length)
+
+    def _decode_elements(self, elements, company_prefix_length):
+        # Populate this object's values from the GRAI (8003) data of a GS1 element string, a
+        # zero, the asset type and its check digit, then the serial number.
+        grai = elements['8003']
+        company_prefix_length = self.resolve_company_prefix_length(
+            company_prefix_length, grai[1:])
+        company_prefix_end = company_prefix_length + 1
         asset_type_length = _grai_prefix_table[company_prefix_length][2]
         asset_type_end = asset_type_length + company_prefix_end
         check_digit_end = asset_type_end + 1
 
         try:
-            company_prefix = barcode[5:company_prefix_end]
+            company_prefix = grai[1:company_prefix_end]
 
             if asset_type_length > 0:
-                asset_type = int(barcode[company_prefix_end:asset_type_end])
+                asset_type = int(grai[company_prefix_end:asset_type_end])
                 asset_type = '{:0{}d}'.format(asset_type, asset_type_length)
             else:
                 asset_type = 0
 
-            check_digit = int(barcode[asset_type_end:check_digit_end])
+            check_digit = int(grai[asset_type_end:check_digit_end])
+            valid_check_digit = self.calc_check_digit(
+                company_prefix, asset_type if asset_type_length > 0 else '')
 
-            if check_digit != self.calc_check_digit(company_prefix, asset_type):
+            if check_digit != valid_check_digit:
                 raise AttributeError('Invalid check digit (found %s, expected %s)' % (
-                    check_digit, self.calc_check_digit(company_prefix, asset_type)
+                    check_digit, valid_check_digit
                 ))
 
-            serial_number = barcode[check_digit_end:]
+            serial_number = grai[check_digit_end:]
         except IndexError:
             raise AttributeError('Invalid barcode length, or wrong company_prefix_length specified')
         except ValueError:
@@ -470,17 +491,7 @@ class GRAI(EpcScheme):
         self.serial_number(serial_number)
 
     def calc_check_digit(self, company_prefix, asset_type):
-        check_string = str(company_prefix) + str(asset_type)
-        evens = []
-        odds = []
-
-        for i, char in enumerate(check_string):
-            if (i + 1) % 2 == 0:
-                evens.append(int(char))
-            else:
-                odds.append(int(char))
-
-        return (10 - (((3 * sum(evens)) + sum(odds)) % 10)) % 10
+        return calc_check_digit(str(company_prefix) + str(asset_type))
 
     def check_fields(self):
         """
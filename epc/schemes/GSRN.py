@@ -0,0 +1,384 @@
+from epc.encoding import calc_check_digit, encode_int, encode_partition, partition_layout
+
+from .base import EpcScheme
+
+_gsrn_partition_table = {
+    # Partition Value: (Company Prefix Length (bits),
+    #                   Company Prefix Length (digits),
+    #                   Service Reference Length (bits))
+    0: (40, 12, 18),
+    1: (37, 11, 21),
+    2: (34, 10, 24),
+    3: (30, 9, 28),
+    4: (27, 8, 31),
+    5: (24, 7, 34),
+    6: (20, 6, 38),
+}
+
+_gsrn_prefix_table = {
+    # Company Prefix Length (digits): (Partition Value,
+    #                                  Service Reference Length (bits),
+    #                                  Service Reference Length (digits))
+    12: (0, 18, 5),
+    11: (1, 21, 6),
+    10: (2, 24, 7),
+    9: (3, 28, 8),
+    8: (4, 31, 9),
+    7: (5, 34, 10),
+    6: (6, 38, 11),
+}
+
+# Partition Value: (Company Prefix Shift, Mask, Service Reference Shift, Mask)
+_gsrn_layout = partition_layout(_gsrn_partition_table, 96)
+
+
+class GSRN(EpcScheme):
+    """
+    The Global Service Relation Number EPC scheme is used to assign a unique identity to a
+    service relation, such as a loyalty scheme membership or a patient's hospital admission.
+
+    General syntax:
+    urn:epc:id:gsrn:CompanyPrefix.ServiceReference
+
+    Example:
+    urn:epc:id:gsrn:0614141.1234567890
+    """
+    GSRN_96 = 'gsrn-96'
+    ENCODINGS = (
+        GSRN_96,
+    )
+
+    HEADER_96 = 0x2D
+    HEADER_BARCODE = '8018'
+    HEADERS = (
+        HEADER_96,
+    )
+
+    FILTER_ALL = 0
+    FILTER_RESERVED_1 = 1
+    FILTER_RESERVED_2 = 2
+    FILTER_RESERVED_3 = 3
+    FILTER_RESERVED_4 = 4
+    FILTER_RESERVED_5 = 5
+    FILTER_RESERVED_6 = 6
+    FILTER_RESERVED_7 = 7
+    FILTERS = (
+        (FILTER_ALL, 'All Others'),
+        (FILTER_RESERVED_1, 'Reserved'),
+        (FILTER_RESERVED_2, 'Reserved'),
+        (FILTER_RESERVED_3, 'Reserved'),
+        (FILTER_RESERVED_4, 'Reserved'),
+        (FILTER_RESERVED_5, 'Reserved'),
+        (FILTER_RESERVED_6, 'Reserved'),
+        (FILTER_RESERVED_7, 'Reserved'),
+    )
+
+    SIZE_96 = 96
+    TAG_SIZES = (
+        SIZE_96,
+    )
+
+    _company_prefix = None
+    _company_prefix_length = None
+    _service_reference = None
+    _service_reference_length = None
+
+    _identity_fields = (
+        ('_company_prefix', 'company_prefix'),
+        (None, None),
+        ('_service_reference', 'service_reference'),
+    )
+
+    def __init__(self, *args, **kwargs):
+        self._tag_size = self.SIZE_96
+        self._tag_filter = self.FILTER_ALL
+        super().__init__(*args, **kwargs)
+
+    def __int__(self):
+        self.check_fields()
+
+        partition, reference_bit_length, reference_digits = \
+            _gsrn_prefix_table[self._company_prefix_length]
+        prefix_bit_length = _gsrn_partition_table[partition][0]
+
+        content = encode_partition(
+            partition,
+            self._company_prefix, prefix_bit_length,
+            self._service_reference, reference_bit_length, d_digits=reference_digits
+        )
+
+        return int('{header:08b}{tag_filter:03b}{content}{reserved}'.format(
+            header=self.HEADER_96, tag_filter=self._tag_filter, content=content,
+            reserved=encode_int(0, 24)
+        ), 2)
+
+    @property
+    def pure_identity_uri(self):
+        """
+        :return: The tag's pure identity URI.
+        :rtype: str
+        """
+        self.check_fields()
+
+        return 'urn:epc:id:gsrn:' \
+               '{_company_prefix:0{_company_prefix_length}d}.' \
+               '{_service_reference:0{_service_reference_length}d}'.format(**self.__dict__)
+
+    @property
+    def tag_uri(self):
+        """
+        :return: The tag's URI.
+        :rtype: str
+        """
+        self.check_fields()
+
+        return 'urn:epc:tag:{encoding}:{_tag_filter}.' \
+               '{_company_prefix:0{_company_prefix_length}d}.' \
+               '{_service_reference:0{_service_reference_length}d}'.format(
+                    encoding=self.encoding, **self.__dict__
+                )
+
+    @property
+    def gsrn(self):
+        """
+        The 18 digit GSRN: the GS1 Company Prefix, the service reference and a check digit.
+
+        :return: The GSRN representation of the tag.
+        :rtype: str
+        """
+        self.check_fields()
+
+        gsrn = '{_company_prefix:0{_company_prefix_length}d}' \
+               '{_service_reference:0{_service_reference_length}d}'.format(**self.__dict__)
+        return gsrn + str(calc_check_digit(gsrn))
+
+    @property
+    def barcode(self):
+        """
+        :return: The barcode representation of the tag.
+        :rtype: str
+        """
+        return '{header}{gsrn}'.format(header=self.HEADER_BARCODE, gsrn=self.gsrn)
+
+    @property
+    def barcode_humanized(self):
+        """
+        :return: A human readable barcode representation of the tag.
+        :rtype: str
+        """
+        return '({header}) {gsrn}'.format(header=self.HEADER_BARCODE, gsrn=self.gsrn)
+
+    @property
+    def encoding(self):
+        encoding = None
+        if self._tag_size == self.SIZE_96:
+            encoding = self.GSRN_96
+        return encoding
+
+    @property
+    def values(self):
+        """
+        :return: Dictionary containing:
+
+            * ``size`` (int): the tag's size in bits
+
+            * ``filter`` (int)
+
+            * ``company_prefix`` (str)
+
+            * ``service_reference`` (str)
+        """
+        return {
+            'size': self._tag_size,
+            'filter': self._tag_filter,
+            'company_prefix': '{:0{}d}'.format(self._company_prefix, self._company_prefix_length),
+            'service_reference': '{:0{}d}'.format(
+                self._service_reference, self._service_reference_length),
+        }
+
+    def filter(self, tag_filter):
+        """
+        The filter value is additional control information that may be included in the EPC memory
+        bank of a Gen 2 tag, allowing an RFID reader to select or deselect the tags corresponding
+        to certain physical objects.
+
+        Allowed values for GSRN tags:
+
+        +-------+-------------------+--------------+
+        | Value | Constant          | Description  |
+        +=======+===================+==============+
+        | 0     | FILTER_ALL        | All Others   |
+        +-------+-------------------+--------------+
+        | 1-7   | FILTER_RESERVED_* | Reserved     |
+        +-------+-------------------+--------------+
+
+        :param tag_filter: The filter value, defaults to ``FILTER_ALL``.
+        :type tag_filter: int
+
+        :raises AttributeError: Filter must be between 0 and 7.
+
+        :return: The GSRN tag object.
+        :rtype: :class:`epc.schemes.GSRN`
+        """
+        if not (tag_filter >= 0 and tag_filter <= 7):
+            raise AttributeError('Filter must be between 0 and 7 (inclusive)')
+
+        self._tag_filter = tag_filter
+        self._identity = self._strict_identity = None
+        return self
+
+    def company_prefix(self, company_prefix, company_prefix_length=None):
+        """
+        The GS1 Company Prefix, assigned by GS1 to a managing entity. The Company Prefix is the
+        same as the GS1 Company Prefix digits within a GS1 GSRN key.
+
+        Length corresponds to the number of digits in the company prefix.
+
+        :param company_prefix: GS1 company prefix.
+        :type company_prefix: str, int
+
+        :param company_prefix_length: Number of digits in the company prefix.
+            Required when ``company_prefix`` is an int.
+        :type company_prefix_length: int, optional
+
+        :return: The GSRN tag object.
+        :rtype: :class:`epc.schemes.GSRN`
+        """
+        if isinstance(company_prefix, str):
+            company_prefix_length = len(company_prefix)
+            company_prefix = int(company_prefix)
+        elif isinstance(company_prefix, int):
+            if company_prefix_length is None:
+                raise AttributeError(
+                    'company_prefix_length must be provided if the company prefix is an integer'
+                )
+
+        if not (company_prefix_length >= 6 and company_prefix_length <= 12):
+            raise AttributeError('company_prefix_length must be between 6 and 12 (inclusive)')
+
+        self._company_prefix = company_prefix
+        self._company_prefix_length = company_prefix_length
+        self._service_reference_length = _gsrn_prefix_table[self._company_prefix_length][2]
+        self._identity = self._strict_identity = None
+        return self
+
+    def service_reference(self, service_reference):
+        """
+        The Service Reference, assigned uniquely by the managing entity to a specific service
+        relation.
+
+        :param service_reference: The service reference
+        :type service_reference: int, str
+
+        :raises AttributeError: Unable to convert input to an integer.
+
+        :return: The GSRN tag object.
+        :rtype: :class:`epc.schemes.GSRN`
+        """
+        if isinstance(service_reference, str):
+            try:
+                service_reference = int(service_reference)
+            except ValueError:
+                raise AttributeError('service_reference must be an integer')
+
+        self._service_reference = service_reference
+        self._identity = self._strict_identity = None
+        return self
+
+    def decode_epc(self, hex_string):
+        """
+        Decode an encoded tag and populate this object's values from it.
+
+        :param hex_string: Tag data encoded as a hexadecimal string, or as an integer.
+        :type hex_string: str, int
+
+        :raises ValueError: EPC scheme header does not match input.
+        :raises ValueError: Filter does not match allowed values.
+        :raises ValueError: Supplied ``hex_string`` bit length invalid.
+        """
+        tag_data = self.read_tag_data(hex_string)
+
+        # Verify header
+        header = tag_data >> 88
+        if header not in self.HEADERS:
+            raise ValueError(
+                'Header `{:#04x}` does not match allowed values: ({}).'.format(
+                    header, ', '.join('{:#04x}'.format(h) for h in self.HEADERS)
+                )
+            )
+
+        # Read tag filter, every 3 bit value is allowed
+        self._tag_filter = tag_data >> 85 & 0x7
+
+        # Read partition
+        partition = tag_data >> 82 & 0x7
+        if partition not in _gsrn_layout:
+            raise ValueError('Partition `%s` does not match allowed values: %s' % (
+                partition, _gsrn_layout.keys()
+            ))
+
+        # Decode partition elements from their precomputed positions
+        prefix_shift, prefix_mask, reference_shift, reference_mask = _gsrn_layout[partition]
+        self._company_prefix_length = _gsrn_partition_table[partition][1]
+        self._service_reference_length = _gsrn_prefix_table[self._company_prefix_length][2]
+        self._company_prefix = tag_data >> prefix_shift & prefix_mask
+        self._service_reference = tag_data >> reference_shift & reference_mask
+
+    def decode_barcode(self, barcode, company_prefix_length):
+        """
+        Decode a barcode and populate this object's values from it.
+
+        :param hex_string: Barcode
+        :type hex_string: str
+
+        :param company_prefix_length: Number of digits of the company prefix length, or a
+            resolver returning it, such as
+            :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+        :type company_prefix_length: int, callable
+
+        :raises ValueError: Expected barcode header does not match input.
+        :raises AttributeError: Invalid check digit.
+        :raises AttributeError: Invalid barcode length, or wrong company prefix.
+        """
+        if barcode[:4] != self.HEADER_BARCODE:
+            raise ValueError(
+                'Barcode header does not match expected value: %s' % self.HEADER_BARCODE
+            )
+
+        self._decode_elements({'8018': barcode[4:]}, company_prefix_length)
+
+    def _decode_elements(self, elements, company_prefix_length):
+        # Populate this object's values from the GSRN (8018) data of a GS1 element string.
+        gsrn = elements['8018']
+        if len(gsrn) != 18 or not gsrn.isdigit():
+            raise AttributeError('Invalid barcode length, or non-numeric GSRN')
+
+        company_prefix_length = self.resolve_company_prefix_length(company_prefix_length, gsrn)
+        if company_prefix_length not in _gsrn_prefix_table:
+            raise AttributeError('company_prefix_length must be between 6 and 12 (inclusive)')
+
+        check_digit = int(gsrn[17])
+        valid_check_digit = calc_check_digit(gsrn[:17])
+        if check_digit != valid_check_digit:
+            raise AttributeError('Invalid check digit (found %s, expected %s)' % (
+                check_digit, valid_check_digit))
+
+        self.company_prefix(gsrn[:company_prefix_length], company_prefix_length)
+        self.service_reference(gsrn[company_prefix_length:17])
+
+    def check_fields(self):
+        """
+        Checks to make sure all components of the tag are present, including ``size``,
+        ``filter``, ``company_prefix`` and ``service_reference``.
+
+        :raises AttributeError: If any components of the tag are missing.
+        """
+        super().check_fields()
+        if self._tag_size is None:
+            raise AttributeError('Tag size not specified')
+        if self._tag_filter is None:
+            raise AttributeError('Tag filter not specified')
+        if self._company_prefix is None:
+            raise AttributeError('Company prefix not specified')
+        if self._service_reference is None:
+            raise AttributeError('Service reference not specified')
@@ -1,6 +1,6 @@
 from epc.encoding import (
-    decode_int, encode_int, decode_partition, encode_partition,
-    decode_string, encode_string, is_encodable_string, url_encode_string
+    calc_check_digit, encode_int, encode_partition, decode_string, encode_string,
+    is_encodable_string, partition_layout, url_encode_string
 )
 
 from .base import EpcScheme
@@ -31,6 +31,12 @@ _sgln_prefix_table = {
     6: (6, 21, 6),
 }
 
+_sgln_layouts = {
+    # Tag Size: Partition Layout
+    96: partition_layout(_sgln_partition_table, 96),
+    208: partition_layout(_sgln_partition_table, 208),
+}
+
 
 class SGLN(EpcScheme):
     """
@@ -92,6 +98,13 @@ class SGLN(EpcScheme):
     _location_reference_length = None
     _extension = None
 
+    _identity_fields = (
+        ('_company_prefix', 'company_prefix'),
+        ('_location_reference', 'location_reference'),
+        ('_extension', 'extension'),
+    )
+    _serial_bits_96 = 41
+
     def __init__(self, *args, **kwargs):
         self._tag_size = self.SIZE_96
         self._tag_filter = self.FILTER_ALL
@@ -275,6 +288,7 @@ class SGLN(EpcScheme):
             raise AttributeError('Filter must be between 0 and 7 (inclusive)')
 
         self._tag_filter = tag_filter
+        self._identity = self._strict_identity = None
         return self
 
     def company_prefix(self, company_prefix, company_prefix_length=None):
@@ -309,6 +323,7 @@ class SGLN(EpcScheme):
         self._company_prefix = company_prefix
         self._company_prefix_length = company_prefix_length
         self._location_reference_length = _sgln_prefix_table[self._company_prefix_length][2]
+        self._identity = self._strict_identity = None
         return self
 
     def location_reference(self, location_reference):
@@ -331,6 +346,7 @@ class SGLN(EpcScheme):
                 raise AttributeError('location_reference must be an integer')
 
         self._location_reference = location_reference
+        self._identity = self._strict_identity = None
         return self
 
     def extension(self, extension):
@@ -357,23 +373,25 @@ class SGLN(EpcScheme):
                 is_encodable_string(extension, raise_exception=True)
 
         self._extension = extension
+        self._identity = self._strict_identity = None
         return self
 
     def decode_epc(self, hex_string):
         """
         Decode an encoded tag and populate this object's values from it.
 
-        :param hex_string: Tag data encoded as a hexadecimal string.
-        :type hex_string: str
+        :param hex_string: Tag data encoded as a hexadecimal string, or as an integer.
+        :type hex_string: str, int
 
         :raises ValueError: EPC scheme header does not match input.
         :raises ValueError: Filter does not match allowed values.
         :raises ValueError: Supplied ``hex_string`` bit length invalid.
         """
-        tag_binary = super().decode_epc(hex_string)
+        tag_data = self.read_tag_data(hex_string)
+        tag_size = self._tag_size
 
         # Verify header
-        header = decode_int(tag_binary[0:8])
+        header = tag_data >> (tag_size - 8)
         if header not in self.HEADERS:
             raise ValueError(
                 'Header `{:#04x}` does not match allowed values: ({}).'.format(
@@ -381,37 +399,31 @@ class SGLN(EpcScheme):
                 )
             )
 
-        # Read tag filter
-        tag_filter = decode_int(tag_binary[8:11])
-        if not any(tag_filter in f for f in self.FILTERS):
-            raise ValueError('Filter `%s` does not match allowed values: %s' % (
-                tag_filter, self.FILTERS
-            ))
-        self._tag_filter = tag_filter
+        # Read tag filter, every 3 bit value is allowed
+        self._tag_filter = tag_data >> (tag_size - 11) & 0x7
 
         # Read partition
-        partition = decode_int(tag_binary[11:14])
-        if partition not in _sgln_partition_table.keys():
+        partition = tag_data >> (tag_size - 14) & 0x7
+        layout = _sgln_layouts[tag_size].get(partition)
+        if layout is None:
             raise ValueError('Partition `%s` does not match allowed values: %s' % (
                 partition, _sgln_partition_table.keys()
             ))
 
-        # Read tag size, determine positions of elements
-        prefix_bit_length, self._company_prefix_length, location_reference_bit_length = \
-            _sgln_partition_table[partition]
-
+        # Decode partition elements from their precomputed positions
+        prefix_shift, prefix_mask, reference_shift, reference_mask = layout
+        self._company_prefix_length = _sgln_partition_table[partition][1]
         self._location_reference_length = _sgln_prefix_table[self._company_prefix_length][2]
+        self._company_prefix = tag_data >> prefix_shift & prefix_mask
+        self._location_reference = tag_data >> reference_shift & reference_mask
 
-        # Decode partition elements
-        self._company_prefix, self._location_reference = decode_partition(
-            tag_binary, prefix_bit_length, location_reference_bit_length, start_pos=14
-        )
-
-        # Decode extension
-        if self._tag_size == self.SIZE_96:
-            self._extension = decode_int(tag_binary[55:])
-        elif self._tag_size == self.SIZE_195:
-            self._extension = decode_string(tag_binary[55:])
+        # Decode extension, from bit 55 to the end
+        extension_length = tag_size - 55
+        extension = tag_data & (1 << extension_length) - 1
+        if tag_size == self.SIZE_96:
+            self._extension = extension
+        elif tag_size == self.SIZE_195:
+            self._extension = decode_string(encode_int(extension, extension_length))
 
     def decode_barcode(self, barcode, company_prefix_length):
         """
@@ -420,8 +432,10 @@ class SGLN(EpcScheme):
         :param hex_string: Barcode
         :type hex_string: str
 
-        :param company_prefix_length: Number of digits of the company prefix length
-        :type company_prefix_length: int
+        :param company_prefix_length: Number of digits of the company prefix length, or a
+            resolver returning it, such as
+            :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+        :type company_prefix_length: int, callable
 
         :raises ValueError: Expected barcode header does not match input.
         :raises AttributeError: Invalid barcode length, or wrong company prefix.
@@ -431,20 +445,27 @@ class SGLN(EpcScheme):
                 'Barcode header does not match expected value: %s' % self.HEADER_BARCODE
             )
 
-        company_prefix_end = company_prefix_length + 3
+        # The extension (254) follows the GLN (414) and its check digit.
+        self._decode_elements({'414': barcode[3:16], '254': barcode[19:]}, company_prefix_length)
+
+    def _decode_elements(self, elements, company_prefix_length):
+        # Populate this object's values from the GLN (414) and extension (254) data of a GS1
+        # element string. The extension defaults to 0.
+        gln = elements['414']
+        company_prefix_length = self.resolve_company_prefix_length(company_prefix_length, gln)
         location_reference_length = _sgln_prefix_table[company_prefix_length][2]
-        location_reference_end = location_reference_length + company_prefix_end
+        location_reference_end = location_reference_length + company_prefix_length
         check_digit_end = location_reference_end + 1
 
         try:
-            company_prefix = barcode[3:company_prefix_end]
+            company_prefix = gln[:company_prefix_length]
 
             if location_reference_length > 0:
-                location_reference = int(barcode[company_prefix_end:location_reference_end])
+                location_reference = int(gln[company_prefix_length:location_reference_end])
             else:
                 location_reference = 0
 
-            check_digit = int(barcode[location_reference_end:check_digit_end])
+            check_digit = int(gln[location_reference_end:check_digit_end])
 
             self.company_prefix(company_prefix, company_prefix_length)
             self.location_reference(location_reference)
@@ -453,13 +474,12 @@ class SGLN(EpcScheme):
                 raise AttributeError('Invalid check digit (found %s, expected %s)' % (
                     check_digit, self.calc_check_digit()
                 ))
-
-            extension = barcode[check_digit_end + 3:]
         except IndexError:
             raise AttributeError('Invalid barcode length, or wrong company_prefix_length specified')
         except ValueError:
             raise AttributeError('Invalid asset reference in barcode')
 
+        extension = elements.get('254', '0')
         try:
             extension = int(extension)
         except ValueError:
@@ -471,19 +491,15 @@ class SGLN(EpcScheme):
         self.extension(extension)
 
     def calc_check_digit(self):
-        check_string = \
-            '{_company_prefix:0{_company_prefix_length}d}' \
-            '{_location_reference:0{_location_reference_length}d}'.format(**self.__dict__)
-        evens = []
-        odds = []
-
-        for i, char in enumerate(check_string):
-            if (i + 1) % 2 == 0:
-                evens.append(int(char))
-            else:
-                odds.append(int(char))
+        if self._location_reference_length > 0:
+            location_reference = '{:0{}d}'.format(
+                self._location_reference, self._location_reference_length)
+        else:
+            location_reference = ''
 
-        return (10 - (((3 * sum(evens)) + sum(odds)) % 10)) % 10
+        return calc_check_digit('{:0{}d}{}'.format(
+            self._company_prefix, self._company_prefix_length, location_reference
+        ))
 
     def check_fields(self):
         """
@@ -1,6 +1,6 @@
 from epc.encoding import (
-    decode_int, encode_int, decode_partition, encode_partition,
-    decode_string, encode_string, is_encodable_string, url_encode_string
+    calc_check_digit, encode_int, encode_partition, decode_string, encode_string,
+    is_encodable_string, partition_layout, url_encode_string
 )
 
 from .base import EpcScheme
@@ -31,6 +31,12 @@ _sgtin_prefix_table = {
     6: (6, 24, 7),
 }
 
+_sgtin_layouts = {
+    # Tag Size: Partition Layout
+    96: partition_layout(_sgtin_partition_table, 96),
+    208: partition_layout(_sgtin_partition_table, 208),
+}
+
 
 class SGTIN(EpcScheme):
     """
@@ -88,6 +94,13 @@ class SGTIN(EpcScheme):
     _item_reference_length = None
     _serial = None
 
+    _identity_fields = (
+        ('_company_prefix', 'company_prefix'),
+        ('_item_reference', 'item_reference'),
+        ('_serial', 'serial_number'),
+    )
+    _serial_bits_96 = 38
+
     def __init__(self, *args, **kwargs):
         self._tag_size = self.SIZE_96
         self._tag_filter = self.FILTER_ALL
@@ -294,6 +307,7 @@ class SGTIN(EpcScheme):
             raise AttributeError('Filter must be between 0 and 7 (inclusive)')
 
         self._tag_filter = tag_filter
+        self._identity = self._strict_identity = None
         return self
 
     def company_prefix(self, company_prefix, company_prefix_length=None):
@@ -327,6 +341,7 @@ class SGTIN(EpcScheme):
         self._company_prefix = company_prefix
         self._company_prefix_length = company_prefix_length
         self._item_reference_length = _sgtin_prefix_table[self._company_prefix_length][2]
+        self._identity = self._strict_identity = None
         return self
 
     def item_reference(self, item_reference):
@@ -353,6 +368,7 @@ class SGTIN(EpcScheme):
                 raise AttributeError('item_reference must be an integer')
 
         self._item_reference = item_reference
+        self._identity = self._strict_identity = None
         return self
 
     def serial_number(self, serial_number):
@@ -385,23 +401,25 @@ class SGTIN(EpcScheme):
             raise AttributeError('Invalid type for serial_number')
 
         self._serial = serial_number
+        self._identity = self._strict_identity = None
         return self
 
     def decode_epc(self, hex_string):
         """
         Decode an encoded tag and populate this object's values from it.
 
-        :param hex_string: Tag data encoded as a hexadecimal string.
-        :type hex_string: str
+        :param hex_string: Tag data encoded as a hexadecimal string, or as an integer.
+        :type hex_string: str, int
 
         :raises ValueError: EPC scheme header does not match input.
         :raises ValueError: Filter does not match allowed values.
         :raises ValueError: Supplied ``hex_string`` bit length invalid.
         """
-        tag_binary = super().decode_epc(hex_string)
+        tag_data = self.read_tag_data(hex_string)
+        tag_size = self._tag_size
 
         # Verify header
-        header = decode_int(tag_binary[0:8])
+        header = tag_data >> (tag_size - 8)
         if header not in self.HEADERS:
             raise ValueError(
                 'Header `{:#04x}` does not match allowed values: ({}).'.format(
@@ -409,39 +427,29 @@ class SGTIN(EpcScheme):
                 )
             )
 
-        # Read tag filter
-        tag_filter = decode_int(tag_binary[8:11])
-        if not any(tag_filter in f for f in self.FILTERS):
-            raise ValueError('Filter `%s` does not match allowed values: %s' % (
-                tag_filter, self.FILTERS
-            ))
-        self._tag_filter = tag_filter
+        # Read tag filter, every 3 bit value is allowed
+        self._tag_filter = tag_data >> (tag_size - 11) & 0x7
 
         # Read partition value
-        partition = decode_int(tag_binary[11:14])
-        if partition not in _sgtin_partition_table.keys():
+        partition = tag_data >> (tag_size - 14) & 0x7
+        layout = _sgtin_layouts[tag_size].get(partition)
+        if layout is None:
             raise ValueError('Partition `%s` does not match allowed values: %s' % (
                 partition, _sgtin_partition_table.keys()
             ))
 
-        # Read tag size, determine positions of elements
-        prefix_bit_length, self._company_prefix_length, type_bit_length = \
-            _sgtin_partition_table[partition]
+        # Decode partition elements from their precomputed positions
+        prefix_shift, prefix_mask, reference_shift, reference_mask = layout
+        self._company_prefix_length = _sgtin_partition_table[partition][1]
         self._item_reference_length = _sgtin_prefix_table[self._company_prefix_length][2]
+        self._company_prefix = tag_data >> prefix_shift & prefix_mask
+        self._item_reference = tag_data >> reference_shift & reference_mask
 
-        # Decode partition elements
-        self._company_prefix, self._item_reference = decode_partition(
-            tag_binary, prefix_bit_length, type_bit_length, start_pos=14
-        )
-
-        # Decode serial
-        serial_start = 58
-        if self._tag_size == self.SIZE_96:
-            serial_length = 38
-            self._serial = decode_int(tag_binary[serial_start:serial_start + serial_length])
-        elif self._tag_size == self.SIZE_198:
-            serial_length = 140
-            self._serial = decode_string(tag_binary[serial_start:serial_start + serial_length])
+        # Decode serial, from bit 58
+        if tag_size == self.SIZE_96:
+            self._serial = tag_data & 0x3fffffffff
+        elif tag_size == self.SIZE_198:
+            self._serial = decode_string(encode_int(tag_data >> 10 & (1 << 140) - 1, 140))
 
     def decode_gtin(self, gtin, company_prefix_length, serial_number=0):
         """
@@ -451,8 +459,10 @@ class SGTIN(EpcScheme):
         :param gtin: Global trade item number
         :type gtin: str
 
-        :param company_prefix_length: Number of digits of the company prefix length
-        :type company_prefix_length: int
+        :param company_prefix_length: Number of digits of the company prefix length, or a
+            resolver returning it, such as
+            :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+        :type company_prefix_length: int, callable
 
         :param serial_number: Serial number to set on the tag. Defaults to `0`.
         :type serial_number: int, str, optional
@@ -469,6 +479,7 @@ class SGTIN(EpcScheme):
             # Zero pad GTIN-13 and 12 formats
             gtin = gtin.zfill(14)
 
+        company_prefix_length = self.resolve_company_prefix_length(company_prefix_length, gtin[1:])
         company_prefix_end = company_prefix_length + 1
         item_reference_length = _sgtin_prefix_table[company_prefix_length][2]
         item_reference_end = item_reference_length + company_prefix_end - 1
@@ -512,8 +523,10 @@ class SGTIN(EpcScheme):
         :param hex_string: Barcode
         :type hex_string: str
 
-        :param company_prefix_length: Number of digits of the company prefix length
-        :type company_prefix_length: int
+        :param company_prefix_length: Number of digits of the company prefix length, or a
+            resolver returning it, such as
+            :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+        :type company_prefix_length: int, callable
 
         :raises ValueError: Expected barcode header does not match input
         :raises AttributeError: Invalid check digit
@@ -525,36 +538,46 @@ class SGTIN(EpcScheme):
                 'Barcode header does not match expected value: %s' % self.HEADER_BARCODE
             )
 
-        company_prefix_end = company_prefix_length + 3
+        # The serial number (21) follows the GTIN (01) and its check digit.
+        self._decode_elements({'01': barcode[2:16], '21': barcode[18:]}, company_prefix_length)
+
+    def _decode_elements(self, elements, company_prefix_length):
+        # Populate this object's values from the GTIN (01) and serial number (21) data of a GS1
+        # element string.
+        if '21' not in elements:
+            raise ValueError('GTIN (01) requires a serial number (21)')
+
+        gtin = elements['01']
+        company_prefix_length = self.resolve_company_prefix_length(company_prefix_length, gtin[1:])
+        company_prefix_end = company_prefix_length + 1
         item_reference_length = _sgtin_prefix_table[company_prefix_length][2]
         item_reference_end = item_reference_length + company_prefix_end - 1
         check_digit_end = item_reference_end + 1
 
         try:
-            indicator_digit = int(barcode[2:3])
-            company_prefix = barcode[3:company_prefix_end]
+            indicator_digit = int(gtin[0:1])
+            company_prefix = gtin[1:company_prefix_end]
 
             if item_reference_length > 1:
-                item_reference = int(barcode[company_prefix_end:item_reference_end])
+                item_reference = int(gtin[company_prefix_end:item_reference_end])
                 item_reference = '{}{:0{}d}'.format(
                     indicator_digit, item_reference, item_reference_length - 1)
             else:
                 item_reference = str(indicator_digit)
 
-            check_digit = int(barcode[item_reference_end:check_digit_end])
+            check_digit = int(gtin[item_reference_end:check_digit_end])
             valid_check_digit = self.calc_check_digit(
                 indicator_digit, company_prefix, item_reference[1:])
 
             if check_digit != valid_check_digit:
                 raise AttributeError('Invalid check digit (found %s, expected %s)' % (
                     check_digit, valid_check_digit))
-
-            serial_number = barcode[check_digit_end + 2:]
         except IndexError:
             raise AttributeError('Invalid barcode length, or wrong company_prefix_length specified')
         except ValueError:
             raise AttributeError('Invalid item_reference in barcode')
 
+        serial_number = elements['21']
         try:
             serial_number = int(serial_number)
         except ValueError:
@@ -566,19 +589,7 @@ class SGTIN(EpcScheme):
         self.serial_number(serial_number)
 
     def calc_check_digit(self, indicator_digit, company_prefix, item_reference):
-        check_string = str(indicator_digit) + str(company_prefix) + str(item_reference)
-        evens = []
-        odds = []
-
-        for i, char in enumerate(check_string):
-            if (i + 2) % 2 == 0:
-                # The GTIN check digit calculation digit position is offset by 1,
-                # hence we add 2 to i, unlike other schemes.
-                evens.append(int(char))
-            else:
-                odds.append(int(char))
-
-        return (10 - (((3 * sum(evens)) + sum(odds)) % 10)) % 10
+        return calc_check_digit(str(indicator_digit) + str(company_prefix) + str(item_reference))
 
     def check_fields(self):
         """
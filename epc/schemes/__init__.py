@@ -1,9 +1,41 @@
-from .GID import GID
-from .GIAI import GIAI
-from .GRAI import GRAI
-from .SGLN import SGLN
-from .SGTIN import SGTIN
+import importlib
+import sys
+import types
 
 __all__ = (
-    'GID', 'GIAI', 'GRAI', 'SGLN', 'SGTIN'
+    'GDTI', 'GID', 'GIAI', 'GRAI', 'GSRN', 'SGLN', 'SGTIN', 'SSCC'
 )
+
+
+class _SchemesModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a scheme's module binds the module to the package under the scheme's name,
+        # keep the scheme class bound instead.
+        if name in __all__ and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _SchemesModule
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ (PEP 562) requires Python 3.7, import schemes eagerly.
+    from .GDTI import GDTI  # noqa: F401
+    from .GID import GID  # noqa: F401
+    from .GIAI import GIAI  # noqa: F401
+    from .GRAI import GRAI  # noqa: F401
+    from .GSRN import GSRN  # noqa: F401
+    from .SGLN import SGLN  # noqa: F401
+    from .SGTIN import SGTIN  # noqa: F401
+    from .SSCC import SSCC  # noqa: F401
+
+
+def __getattr__(name):
+    # Import each scheme on first access.
+    if name in __all__:
+        return getattr(importlib.import_module('.' + name, __name__), name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
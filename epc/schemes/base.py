@@ -1,5 +1,32 @@
 from epc.encoding import encode_int
 
+_UINT64_MASK = (1 << 64) - 1
+
+# Bits given to each field of an identity key, see EpcScheme.identity_key().
+_KEY_PREFIX_BITS = 64
+_KEY_REFERENCE_BITS = 64
+_KEY_SERIAL_BITS = 256
+
+
+def _serial_key(serial):
+    # Numeric serials match whether they're stored as an int (96 bit encodings) or a string
+    # (large encodings), unless the string has leading zeros. The low bit keeps numbers and
+    # strings apart.
+    if isinstance(serial, int):
+        return serial << 1
+    if serial.isdigit() and (serial[0] != '0' or len(serial) == 1):
+        return int(serial) << 1
+    return int.from_bytes(serial.encode('utf-8'), 'big') << 1 | 1
+
+
+def _unpickle(cls, tag_data, serial=None):
+    # Rebuild a tag pickled by EpcScheme.__reduce_ex__(), with its serial number if it was set
+    # as another type than the decoder gives.
+    tag = cls(epc=tag_data)
+    if serial is not None:
+        setattr(tag, cls._identity_fields[2][0], serial)
+    return tag
+
 
 class EpcScheme:
     """
@@ -7,6 +34,11 @@ class EpcScheme:
 
     To implement a new scheme, an __int__ method that represents the EPC in an integer
     format must be implemented that can be written into EPC memory portion of an RFID tag.
+
+    Tags compare, hash and sort by their pure identity (see :meth:`identity_key`), so two tags
+    with the same pure identity URI are equal regardless of their filter and size. Tags missing
+    components compare and hash by object identity, and can't be sorted. Changing a tag that is
+    used as a set member or dict key breaks the set or dict, as with any mutable value.
     """
     ENCODINGS = ()
     HEADERS = ()
@@ -16,6 +48,35 @@ class EpcScheme:
 
     _tag_size = None
 
+    # (Attribute, Setter) of the Company Prefix, Reference and Serial making up the pure
+    # identity, set on each scheme implementation. Schemes without a reference have
+    # (None, None) in its place.
+    _identity_fields = None
+
+    # Bits of the serial number in the 96 bit encoding, or a dict of bits by company prefix
+    # length, set on schemes with a larger encoding for other serial numbers.
+    _serial_bits_96 = None
+
+    # Cached identity keys, reset by every setter.
+    _identity = None
+    _strict_identity = None
+
+    @classmethod
+    def _identity_size(cls, serial, company_prefix_length=None):
+        # Tag size of a pure identity: 96 bits, or the largest size for serial numbers the 96
+        # bit encoding can't hold (alphanumeric, with leading zeros, or too large).
+        if isinstance(serial, str):
+            if not serial.isdigit() or (serial[0] == '0' and len(serial) > 1):
+                return cls.TAG_SIZES[-1]
+            serial = int(serial)
+
+        bits = cls._serial_bits_96
+        if isinstance(bits, dict):
+            bits = bits.get(company_prefix_length)
+        if bits is not None and serial >> bits:
+            return cls.TAG_SIZES[-1]
+        return cls.TAG_SIZES[0]
+
     def __init__(self, epc=None, barcode=None, company_prefix_length=None):
         if epc is not None:
             self.decode_epc(epc)
@@ -37,6 +98,141 @@ class EpcScheme:
         except AttributeError:
             return '<%s>' % self.__class__.__module__
 
+    def __reduce_ex__(self, protocol):
+        # Pickle (and copy) as the encoded value, decoded again when unpickled. The header
+        # identifies the scheme and size of registered schemes. Tags that can't be encoded yet
+        # pickle their attributes.
+        from epc.utils import decode_epc, epc_encoding_map
+
+        try:
+            tag_data = self.identity_key(strict=True)
+        except (AttributeError, TypeError, ValueError):
+            return super().__reduce_ex__(protocol)
+
+        # Decoders give integer serial numbers for 96 bit encodings and strings otherwise, such
+        # as '12' for an SGTIN-198 serial number set as 12. Keep the type it was set as.
+        serial = getattr(self, self._identity_fields[2][0])
+        if isinstance(serial, int) != (self._tag_size == 96):
+            return _unpickle, (self.__class__, tag_data, serial)
+
+        if epc_encoding_map.get(tag_data >> (self._tag_size - 8)) is self.__class__:
+            return decode_epc, (tag_data,)
+        return _unpickle, (self.__class__, tag_data)
+
+    def _comparison_key(self):
+        # Identity key, or None for a tag missing components. Reads the cached key directly,
+        # keys are never 0.
+        try:
+            return self._identity or self.identity_key()
+        except AttributeError:
+            return None
+
+    # Tags missing components compare and hash by object identity, and don't order.
+    def __eq__(self, other):
+        if not isinstance(other, EpcScheme):
+            return NotImplemented
+        key, other_key = self._comparison_key(), other._comparison_key()
+        if key is None or other_key is None:
+            return self is other
+        return key == other_key
+
+    def __ne__(self, other):
+        if not isinstance(other, EpcScheme):
+            return NotImplemented
+        key, other_key = self._comparison_key(), other._comparison_key()
+        if key is None or other_key is None:
+            return self is not other
+        return key != other_key
+
+    def __lt__(self, other):
+        if not isinstance(other, EpcScheme):
+            return NotImplemented
+        key, other_key = self._comparison_key(), other._comparison_key()
+        if key is None or other_key is None:
+            return NotImplemented
+        return key < other_key
+
+    def __le__(self, other):
+        if not isinstance(other, EpcScheme):
+            return NotImplemented
+        key, other_key = self._comparison_key(), other._comparison_key()
+        if key is None or other_key is None:
+            return NotImplemented
+        return key <= other_key
+
+    def __gt__(self, other):
+        if not isinstance(other, EpcScheme):
+            return NotImplemented
+        key, other_key = self._comparison_key(), other._comparison_key()
+        if key is None or other_key is None:
+            return NotImplemented
+        return key > other_key
+
+    def __ge__(self, other):
+        if not isinstance(other, EpcScheme):
+            return NotImplemented
+        key, other_key = self._comparison_key(), other._comparison_key()
+        if key is None or other_key is None:
+            return NotImplemented
+        return key >= other_key
+
+    def __hash__(self):
+        key = self._comparison_key()
+        if key is None:
+            return object.__hash__(self)
+        return hash(key)
+
+    def identity_key(self, strict=False):
+        """
+        Integer identifying the tag, computed once and cached until the tag is changed.
+
+        The default key identifies the tag's pure identity: the scheme, company prefix,
+        reference and serial number, ignoring the filter and size. A numeric serial number of a
+        large encoding has the same key as the equal 96 bit serial number. Keys order tags by
+        scheme, company prefix, reference and then serial number.
+
+        The strict key is the tag's encoded value, which also identifies its filter and size.
+        Use it as a dict or set key to tell apart tags that only differ in those, such as
+        ``{tag.identity_key(strict=True) for tag in tags}``.
+
+        :param strict: Include the filter and tag size. Defaults to ``False``.
+        :type strict: bool, optional
+
+        :raises AttributeError: If any components of the tag are missing.
+
+        :rtype: int
+        """
+        if strict:
+            key = self._strict_identity
+            if key is None:
+                key = self._strict_identity = self.__int__()
+            return key
+
+        key = self._identity
+        if key is None:
+            key = self._identity = self._build_identity_key()
+        return key
+
+    def _build_identity_key(self):
+        self.check_fields()
+
+        (prefix_attribute, _), (reference_attribute, _), (serial_attribute, _) = \
+            self._identity_fields
+        company_prefix = getattr(self, prefix_attribute)
+        reference = getattr(self, reference_attribute) if reference_attribute else 0
+
+        if company_prefix >> _KEY_PREFIX_BITS or reference >> _KEY_REFERENCE_BITS:
+            raise AttributeError('Tag values are out of range')
+
+        serial = _serial_key(getattr(self, serial_attribute))
+        if serial >> _KEY_SERIAL_BITS:
+            raise AttributeError('Tag values are out of range')
+
+        key = self.HEADERS[0] << 4 | (getattr(self, '_company_prefix_length', None) or 0)
+        key = key << _KEY_PREFIX_BITS | company_prefix
+        key = key << _KEY_REFERENCE_BITS | reference
+        return key << _KEY_SERIAL_BITS | serial
+
     @property
     def pure_identity_uri(self):
         raise NotImplementedError
@@ -78,6 +274,7 @@ class EpcScheme:
             )
 
         self._tag_size = tag_size
+        self._strict_identity = None
         return self
 
     def check_fields(self):
@@ -103,13 +300,33 @@ class EpcScheme:
 
     def decode_epc(self, hex_string):
         """
-        Decode an EPC hex string and populate the values in the scheme.
+        Decode an EPC hex string or integer and populate the values in the scheme.
 
         This function returns a binary string of the tag for parsing.
 
         You must override this method on each scheme implementation.
         """
-        tag_data = int(hex_string, 16)
+        tag_data = self.read_tag_data(hex_string)
+        return encode_int(tag_data, self._tag_size)
+
+    def read_tag_data(self, hex_string):
+        """
+        Read an EPC hex string as an integer, and set the tag size from its length.
+
+        :param hex_string: Tag data encoded as a hexadecimal string, or as an integer.
+        :type hex_string: str, int
+
+        :raises ValueError: Supplied ``hex_string`` bit length invalid.
+
+        :rtype: int
+        """
+        if isinstance(hex_string, int):
+            if hex_string < 0:
+                raise ValueError('Tag data must be a positive integer')
+            tag_data = hex_string
+        else:
+            tag_data = int(hex_string, 16)
+
         tag_length = tag_data.bit_length()
 
         # Pad the length to multiples of 16, per the EPC Tag Data Standard
@@ -122,10 +339,85 @@ class EpcScheme:
             ))
 
         self._tag_size = tag_length
-        return encode_int(tag_data, tag_length)
+        self._identity = self._strict_identity = None
+        return tag_data
+
+    def to_parts(self):
+        """
+        Split the tag's integer value into two unsigned 64 bit integers, for storage in a pair
+        of ``uint64`` columns. Tags of up to 128 bits can be split.
+
+        :raises ValueError: Tag is longer than 128 bits.
+
+        :return: Tuple of the high and low 64 bits.
+        :rtype: tuple
+        """
+        if self._tag_size > 128:
+            raise ValueError('Tags of %s bits cannot be split into two 64 bit parts' % (
+                self._tag_size
+            ))
+
+        tag_data = self.__int__()
+        return tag_data >> 64, tag_data & _UINT64_MASK
+
+    @classmethod
+    def from_int(cls, tag_data):
+        """
+        Decode a tag from its integer value, without converting it to hex.
+
+        :param tag_data: Tag data as an integer.
+        :type tag_data: int
+
+        :raises ValueError: Tag data invalid for the scheme.
+
+        :return: The tag object.
+        """
+        return cls(epc=tag_data)
+
+    @classmethod
+    def from_parts(cls, high, low):
+        """
+        Decode a tag from the two 64 bit integers returned by :meth:`to_parts`.
+
+        :param high: High 64 bits of the tag data.
+        :type high: int
+
+        :param low: Low 64 bits of the tag data.
+        :type low: int
+
+        :raises ValueError: Tag data invalid for the scheme.
+
+        :return: The tag object.
+        """
+        return cls(epc=(high << 64) | (low & _UINT64_MASK))
 
     def decode_barcode(self, barcode, company_prefix_length):
         """
         Decode a barcode string and populate values in the scheme.
         """
         raise NotImplementedError
+
+    @staticmethod
+    def resolve_company_prefix_length(company_prefix_length, gs1_key):
+        """
+        Get the number of digits in the company prefix of a GS1 key.
+
+        :param company_prefix_length: Number of digits in the company prefix, or a callable
+            such as :class:`epc.utils.company_prefix.CompanyPrefixResolver` that returns it.
+        :type company_prefix_length: int, callable
+
+        :param gs1_key: GS1 key digits, starting at the company prefix.
+        :type gs1_key: str
+
+        :raises AttributeError: Unable to resolve the company prefix length.
+
+        :rtype: int
+        """
+        if not callable(company_prefix_length):
+            return company_prefix_length
+
+        resolved_length = company_prefix_length(gs1_key)
+        if resolved_length is None or not (resolved_length >= 6 and resolved_length <= 12):
+            raise AttributeError('Unable to resolve company_prefix_length for %s' % gs1_key)
+
+        return resolved_length
@@ -0,0 +1,210 @@
+import copy
+import pickle
+
+from unittest import TestCase
+
+from epc.schemes import GDTI, GID, GSRN, SGLN, SGTIN, SSCC
+from epc.utils import decode_epc, get_epc_header
+from epc.utils.validation import EPC_OK, EPC_UNKNOWN_HEADER, try_decode, validate
+
+
+class IntegerTest(TestCase):
+    hex_strings = (
+        '3074257bf7194e4000001a85',
+        '3274257bf46072000000162e',
+        '350000001000001000000001',
+        '3174257bf4499602d2000000',
+        '3a34257bf46072b1a2bc2ec500008000',
+    )
+
+    def test_from_int(self):
+        """Test tags decoded from integers match tags decoded from hex"""
+        for hex_string in self.hex_strings:
+            tag = decode_epc(int(hex_string, 16))
+            self.assertEqual(tag.tag_uri, decode_epc(hex_string).tag_uri)
+            self.assertEqual(type(tag).from_int(int(hex_string, 16)).tag_uri, tag.tag_uri)
+
+        self.assertEqual(get_epc_header(0x3074257bf7194e4000001a85), 0x30)
+        self.assertEqual(get_epc_header(0), 0)
+
+        with self.assertRaises(ValueError):
+            SGTIN.from_int(0x3274257bf46072000000162e)
+        with self.assertRaises(ValueError):
+            SGTIN.from_int(-0x3074257bf7194e4000001a85)
+
+    def test_parts(self):
+        """Test splitting tags into two 64 bit integers and back"""
+        for hex_string in self.hex_strings:
+            tag = decode_epc(hex_string)
+            high, low = tag.to_parts()
+            self.assertLess(high, 1 << 64)
+            self.assertLess(low, 1 << 64)
+            self.assertEqual(type(tag).from_parts(high, low).tag_uri, tag.tag_uri)
+
+        high, low = SGTIN(epc='3074257bf7194e4000001a85').to_parts()
+        self.assertEqual((high, low), (0x3074257b, 0xf7194e4000001a85))
+        self.assertEqual(GID.from_parts(0x35000000, 0x1000001000000001).pure_identity_uri,
+                         'urn:epc:id:gid:1.1.1')
+        self.assertEqual(GDTI.from_parts(*GDTI(epc=self.hex_strings[4]).to_parts()).encoding,
+                         GDTI.GDTI_113)
+
+        # Large encodings don't fit in 128 bits.
+        tag = SGLN().tag_size(SGLN.SIZE_195).company_prefix('0614141').location_reference(
+            12345).extension('ext')
+        with self.assertRaises(ValueError):
+            tag.to_parts()
+
+    def test_validate(self):
+        """Test validating integers"""
+        self.assertEqual(validate(0x3174257bf4499602d2000000), EPC_OK)
+        self.assertEqual(validate(0x2f74257bf7194e4000001a85), EPC_UNKNOWN_HEADER)
+        self.assertIsInstance(try_decode(0x3174257bf4499602d2000000)[1], SSCC)
+
+
+class EqualityTest(TestCase):
+    def test_equality(self):
+        """Test tags compare by pure identity, ignoring filter and size"""
+        tag = SGTIN().filter(1).company_prefix('0614141').item_reference(812345).serial_number(6789)
+        same = SGTIN(epc='3074257bf7194e4000001a85')
+        large = SGTIN().tag_size(SGTIN.SIZE_198).company_prefix('0614141').item_reference(
+            812345).serial_number('6789')
+
+        self.assertEqual(tag, same)
+        self.assertEqual(tag, large)
+        self.assertEqual(hash(tag), hash(large))
+        self.assertEqual(len({tag, same, large}), 1)
+        self.assertNotEqual(tag.identity_key(strict=True), same.identity_key(strict=True))
+        self.assertNotEqual(tag, 'urn:epc:id:sgtin:0614141.812345.6789')
+
+        # Leading zeros make a different serial number.
+        self.assertNotEqual(tag, large.serial_number('06789'))
+        self.assertNotEqual(tag, SGTIN().company_prefix('061414').item_reference(
+            8123450).serial_number(6789))
+        self.assertNotEqual(
+            SSCC().company_prefix('0614141').serial_reference(1),
+            GSRN().company_prefix('0614141').service_reference(1)
+        )
+
+    def test_cache(self):
+        """Test cached keys are reset when a tag changes"""
+        tag = GID(epc='350000001000001000000001')
+        key = tag.identity_key()
+        strict_key = tag.identity_key(strict=True)
+
+        tag.serial_number(2)
+        self.assertNotEqual(tag.identity_key(), key)
+        self.assertNotEqual(tag.identity_key(strict=True), strict_key)
+
+        tag.decode_epc('350000001000001000000001')
+        self.assertEqual(tag.identity_key(), key)
+
+        tag = SGTIN(epc='3074257bf7194e4000001a85')
+        key = tag.identity_key(strict=True)
+        tag.filter(SGTIN.FILTER_POS)
+        self.assertNotEqual(tag.identity_key(strict=True), key)
+
+    def test_ordering(self):
+        """Test tags sort by scheme, company prefix, reference and serial number"""
+        tags = [
+            SGTIN().company_prefix('0614141').item_reference(812345).serial_number(10),
+            SGTIN().company_prefix('0614141').item_reference(812345).serial_number(9),
+            SGTIN().company_prefix('0614141').item_reference(812344).serial_number(11),
+            GID().manager_number(1).object_class(1).serial_number(1),
+        ]
+
+        self.assertEqual(sorted(tags), [tags[2], tags[1], tags[0], tags[3]])
+        self.assertLess(tags[1], tags[0])
+        self.assertGreaterEqual(tags[0], tags[1])
+        with self.assertRaises(TypeError):
+            tags[0] < 1
+
+    def test_incomplete(self):
+        """Test tags missing components compare and hash by object identity"""
+        tag = SGTIN().company_prefix('0614141')
+        complete = SGTIN(epc='3074257bf7194e4000001a85')
+
+        self.assertNotEqual(SGTIN(), SGTIN())
+        self.assertEqual(tag, tag)
+        self.assertFalse(tag != tag)
+        self.assertNotEqual(tag, complete)
+        self.assertNotIn(SGTIN(), [tag, complete])
+        self.assertIn(tag, [complete, tag])
+        self.assertEqual(len({SGTIN(), SGTIN(), tag, tag, complete}), 4)
+
+        with self.assertRaises(TypeError):
+            tag < complete
+
+
+class PickleTest(TestCase):
+    hex_strings = (
+        '3074257bf7194e4000001a85',
+        '3674257bf6b7a659b2c2bf100000000000000000000000000000',
+        '3274257bf46072000000162e',
+        '39180000400002c4000000000000000000000000000000000000',
+        '3374257bf40c0e400000162e',
+        '37180000400000588000000000000000000000000000',
+        '3474257bf4000000000015e9',
+        '3818000058800000000000000000000000000000000000000000',
+        '350000001000001000000001',
+        '3174257bf4499602d2000000',
+        '2c74257bf46072000000162e',
+        '3a34257bf46072b1a2bc2ec500008000',
+        '2d14257bf4607200000004d2',
+    )
+
+    def test_pickle(self):
+        """Test tags pickle as their encoded value and unpickle to equal tags"""
+        for hex_string in self.hex_strings:
+            tag = decode_epc(hex_string)
+            for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+                copy = pickle.loads(pickle.dumps(tag, protocol))
+                self.assertIs(type(copy), type(tag))
+                self.assertEqual(copy.tag_uri, tag.tag_uri)
+                self.assertEqual(int(copy), int(tag))
+
+        tag = decode_epc('3074257bf7194e4000001a85')
+        self.assertEqual(tag.__reduce_ex__(4), (decode_epc, (int(tag),)))
+        self.assertLess(len(pickle.dumps(tag)), len(pickle.dumps(tag.__dict__)))
+
+    def test_copy(self):
+        """Test copies of tags are equal, independent tags"""
+        tag = decode_epc('3074257bf7194e4000001a85')
+        for tag_copy in (copy.copy(tag), copy.deepcopy(tag)):
+            self.assertIsNot(tag_copy, tag)
+            self.assertEqual(tag_copy.identity_key(strict=True), tag.identity_key(strict=True))
+
+            tag_copy.serial_number(1)
+            self.assertNotEqual(tag_copy, tag)
+
+    def test_serial_type(self):
+        """Test serial numbers keep the type they were set as"""
+        tag = SGTIN().company_prefix('0614141').item_reference(12345).filter(
+            SGTIN.FILTER_POS).tag_size(SGTIN.SIZE_198).serial_number(12)
+
+        for tag_copy in (copy.copy(tag), copy.deepcopy(tag), pickle.loads(pickle.dumps(tag))):
+            self.assertEqual(tag_copy.values, tag.values)
+            self.assertEqual(tag_copy.values['serial_number'], 12)
+            self.assertEqual(tag_copy.identity_key(strict=True), tag.identity_key(strict=True))
+
+        tag.serial_number('12')
+        self.assertEqual(copy.copy(tag).values['serial_number'], '12')
+
+    def test_subclass(self):
+        """Test subclasses of schemes are kept when unpickled"""
+        class_name = 'PickledSGTIN'
+        cls = type(class_name, (SGTIN,), {'__module__': __name__})
+        globals()[class_name] = cls
+        try:
+            tag = cls(epc='3074257bf7194e4000001a85')
+            tag_copy = pickle.loads(pickle.dumps(tag))
+            self.assertIs(type(tag_copy), cls)
+            self.assertEqual(tag_copy.tag_uri, tag.tag_uri)
+        finally:
+            del globals()[class_name]
+
+    def test_incomplete(self):
+        """Test tags missing components pickle their attributes"""
+        tag = SGTIN().company_prefix('0614141').item_reference(812345)
+        tag_copy = pickle.loads(pickle.dumps(tag))
+        self.assertIs(type(tag_copy), SGTIN)
+        self.assertEqual(tag_copy.__dict__, tag.__dict__)
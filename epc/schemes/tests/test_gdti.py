@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+from epc.schemes import GDTI
+
+
+class GDTITest(TestCase):
+    def test_96_encode(self):
+        """Test GDTI-96 encoding"""
+        epc = GDTI().filter(GDTI.FILTER_RESERVED_3)
+        epc.company_prefix('0614141').document_type(12345).serial_number(400)
+
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:gdti:0614141.12345.400')
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:gdti-96:3.0614141.12345.400')
+        self.assertEqual(hex(epc), '0x2c74257bf460720000000190')
+
+        epc.filter(GDTI.FILTER_ALL).company_prefix('061414112345').document_type(0)
+        epc.serial_number(1)
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:gdti:061414112345..1')
+        self.assertEqual(hex(epc), '0x2c00393243f1640000000001')
+
+        with self.assertRaises(AttributeError):
+            int(epc.serial_number(1 << 41))
+
+    def test_96_decode(self):
+        """Test GDTI-96 decoding"""
+        epc = GDTI(epc='2c74257bf460720000000190')
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:gdti:0614141.12345.400')
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:gdti-96:3.0614141.12345.400')
+
+        epc = GDTI(epc='2c00393243f1640000000001')
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:gdti:061414112345..1')
+
+    def test_113_encode(self):
+        """Test GDTI-113 encoding"""
+        epc = GDTI().tag_size(GDTI.SIZE_113).filter(GDTI.FILTER_TRAVEL_DOCUMENT)
+        epc.company_prefix('0614141').document_type(12345).serial_number('00000000000000001')
+
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:gdti-113:1.0614141.12345.00000000000000001')
+        self.assertEqual(hex(epc), '0x3a34257bf46072b1a2bc2ec500008000')
+
+        epc.serial_number('99999999999999999')
+        self.assertEqual(hex(epc), '0x3a34257bf460736345785d89ffff8000')
+
+        with self.assertRaises(AttributeError):
+            epc.serial_number('1A')
+        with self.assertRaises(AttributeError):
+            epc.serial_number('1' * 18)
+
+    def test_113_decode(self):
+        """Test GDTI-113 decoding"""
+        epc = GDTI(epc='3a34257bf46072b1a2bc2ec500008000')
+        self.assertEqual(
+            epc.pure_identity_uri, 'urn:epc:id:gdti:0614141.12345.00000000000000001'
+        )
+        self.assertEqual(epc.encoding, GDTI.GDTI_113)
+
+        # The numeric string must start with the 1 digit prepended when encoding.
+        with self.assertRaises(ValueError):
+            GDTI(epc='3a34257bf46072000000000000000000')
+        # Header and tag size must match.
+        with self.assertRaises(ValueError):
+            GDTI(epc='2c34257bf46072b1a2bc2ec500008000')
+
+    def test_barcode(self):
+        """Test GDTI barcode encoding and decoding"""
+        epc = GDTI(epc='2c74257bf460720000000190')
+        self.assertEqual(epc.gdti, '0614141123452')
+        self.assertEqual(epc.barcode, '2530614141123452400')
+        self.assertEqual(epc.barcode_humanized, '(253) 0614141123452400')
+
+        epc = GDTI(barcode='2530614141123452400', company_prefix_length=7)
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:gdti-96:0.0614141.12345.400')
+
+        # Leading zeros in the serial number need GDTI-113.
+        epc = GDTI(barcode='2530614141123452006847', company_prefix_length=7)
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:gdti-113:0.0614141.12345.006847')
+
+        with self.assertRaises(AttributeError):
+            GDTI(barcode='2530614141123453400', company_prefix_length=7)
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from epc.schemes import GSRN
+
+
+class GSRNTest(TestCase):
+    def test_96_encode(self):
+        """Test GSRN-96 encoding"""
+        epc = GSRN().filter(GSRN.FILTER_RESERVED_3)
+        epc.company_prefix('0614141').service_reference(1234567890)
+
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:gsrn:0614141.1234567890')
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:gsrn-96:3.0614141.1234567890')
+        self.assertEqual(hex(epc), '0x2d74257bf4499602d2000000')
+
+        epc.filter(GSRN.FILTER_ALL).company_prefix('061414112345').service_reference(5)
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:gsrn:061414112345.00005')
+        self.assertEqual(hex(epc), '0x2d00393243f1640005000000')
+
+    def test_96_decode(self):
+        """Test GSRN-96 decoding"""
+        epc = GSRN(epc='2d74257bf4499602d2000000')
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:gsrn:0614141.1234567890')
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:gsrn-96:3.0614141.1234567890')
+
+        epc = GSRN(epc='2d00393243f1640005000000')
+        self.assertEqual(epc.values, {
+            'size': 96, 'filter': 0, 'company_prefix': '061414112345', 'service_reference': '00005'
+        })
+
+        with self.assertRaises(ValueError):
+            GSRN(epc='3174257bf4499602d2000000')
+
+    def test_barcode(self):
+        """Test GSRN barcode encoding and decoding"""
+        epc = GSRN(epc='2d74257bf4499602d2000000')
+        self.assertEqual(epc.gsrn, '061414112345678902')
+        self.assertEqual(epc.barcode, '8018061414112345678902')
+        self.assertEqual(epc.barcode_humanized, '(8018) 061414112345678902')
+
+        epc = GSRN(barcode='8018061414112345678902', company_prefix_length=7)
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:gsrn:0614141.1234567890')
+
+        with self.assertRaises(AttributeError):
+            GSRN(barcode='8018061414112345678903', company_prefix_length=7)
@@ -0,0 +1,61 @@
+from unittest import TestCase
+
+from epc.schemes import SSCC
+
+
+class SSCCTest(TestCase):
+    def test_96_encode(self):
+        """Test SSCC-96 encoding"""
+        epc = SSCC().filter(SSCC.FILTER_UNIT_LOAD).company_prefix(1, 6).serial_reference(1)
+
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:sscc:000001.00000000001')
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:sscc-96:6.000001.00000000001')
+        self.assertEqual(hex(epc), '0x31d800004000000001000000')
+
+        epc.filter(SSCC.FILTER_RESERVED_3).company_prefix('0614141').serial_reference(1234567890)
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:sscc:0614141.1234567890')
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:sscc-96:3.0614141.1234567890')
+        self.assertEqual(hex(epc), '0x3174257bf4499602d2000000')
+
+        epc.company_prefix('061414112345').serial_reference('00001')
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:sscc:061414112345.00001')
+        self.assertEqual(hex(epc), '0x3160393243f1640001000000')
+
+    def test_96_decode(self):
+        """Test SSCC-96 decoding"""
+        epc = SSCC(epc='3174257bf4499602d2000000')
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:sscc:0614141.1234567890')
+        self.assertEqual(epc.tag_uri, 'urn:epc:tag:sscc-96:3.0614141.1234567890')
+        self.assertEqual(epc.values, {
+            'size': 96, 'filter': 3, 'company_prefix': '0614141', 'serial_reference': '1234567890'
+        })
+
+        epc = SSCC(epc='31c0393243f1640001000000')
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:sscc:061414112345.00001')
+
+        with self.assertRaises(ValueError):
+            SSCC(epc='3074257bf4499602d2000000')
+        with self.assertRaises(ValueError):
+            SSCC(epc='317e257bf4499602d2000000')
+
+    def test_barcode_encode(self):
+        """Test SSCC barcode encoding"""
+        epc = SSCC(epc='3174257bf4499602d2000000')
+        self.assertEqual(epc.sscc, '106141412345678908')
+        self.assertEqual(epc.barcode, '00106141412345678908')
+        self.assertEqual(epc.barcode_humanized, '(00) 106141412345678908')
+
+    def test_barcode_decode(self):
+        """Test SSCC barcode decoding"""
+        epc = SSCC(barcode='00106141412345678908', company_prefix_length=7)
+        self.assertEqual(hex(epc), '0x3114257bf4499602d2000000')
+
+        epc = SSCC(barcode='00006141411234500019', company_prefix_length=12)
+        self.assertEqual(epc.pure_identity_uri, 'urn:epc:id:sscc:061414112345.00001')
+
+        with self.assertRaises(AttributeError):
+            SSCC(barcode='00106141412345678909', company_prefix_length=7)
+        with self.assertRaises(AttributeError):
+            SSCC(barcode='0010614141234567890', company_prefix_length=7)
+        with self.assertRaises(ValueError):
+            SSCC(barcode='01106141412345678908', company_prefix_length=7)
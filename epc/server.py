@@ -0,0 +1,364 @@
+"""
+HTTP/JSON service exposing batch decode, encode and translate endpoints, using only the
+standard library. Run with ``python -m epc.server``.
+
+Endpoints:
+
+* ``POST /decode``: hex strings to tags
+* ``POST /encode``: tag URIs or pure identity URIs to tags
+* ``POST /translate``: hex strings, URIs or barcode element strings to tags
+* ``GET /metrics``: Prometheus metrics, including :mod:`epc.instrumentation` when enabled
+* ``GET /health``
+
+Batch endpoints take a JSON object with a ``values`` list, and optionally a
+``company_prefix_length`` for ``/translate`` barcodes::
+
+    {"values": ["3074257bf7194e4000001a85", "urn:epc:id:gid:31231.11.12"]}
+
+and return one result per value, in order, as produced by :func:`epc.utils.records.tag_record`::
+
+    {"results": [{"input": "3074257bf7194e4000001a85", "encoding": "sgtin-96",
+                  "hex": "...", "uri": "...", "tag_uri": "..."}, ...]}
+
+Values that fail to decode have an ``error`` message instead. Results are kept in a cache
+shared by all connections. Large batches are decoded in the event loop's default executor, so
+other connections are still served meanwhile. Connections are kept alive between requests
+(HTTP/1.1).
+"""
+import argparse
+import asyncio
+import functools
+import json
+import time
+
+from epc import instrumentation
+from epc.utils.records import tag_record
+
+_input_formats = {
+    # Path: Input Format
+    '/decode': 'hex',
+    '/encode': 'uri',
+    '/translate': 'auto',
+}
+
+_reasons = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    411: 'Length Required',
+    413: 'Payload Too Large',
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message=None):
+        super().__init__(message or _reasons[status])
+        self.status = status
+
+
+class DecodeServer:
+    """
+    Decode service, serving connections on an asyncio event loop.
+
+    :param host: Address to listen on. Defaults to ``127.0.0.1``.
+    :type host: str, optional
+
+    :param port: Port to listen on, ``0`` picks a free port. Defaults to ``8080``.
+    :type port: int, optional
+
+    :param cache_size: Maximum cached results. Defaults to ``65536``.
+    :type cache_size: int, optional
+
+    :param max_batch_size: Maximum values per request. Defaults to ``10000``.
+    :type max_batch_size: int, optional
+
+    :param max_body_size: Maximum request body in bytes. Defaults to 4 MiB.
+    :type max_body_size: int, optional
+
+    :param keep_alive_timeout: Seconds an idle connection is kept open. Defaults to ``30``.
+    :type keep_alive_timeout: float, optional
+
+    :param executor_batch_size: Batches of at least this many values are decoded in the event
+        loop's default executor instead of the event loop. Defaults to ``256``.
+    :type executor_batch_size: int, optional
+    """
+
+    def __init__(self, host='127.0.0.1', port=8080, cache_size=65536, max_batch_size=10000,
+                 max_body_size=4 * 1024 * 1024, keep_alive_timeout=30, executor_batch_size=256):
+        self.host = host
+        self.port = port
+        self.max_batch_size = max_batch_size
+        self.max_body_size = max_body_size
+        self.keep_alive_timeout = keep_alive_timeout
+        self.executor_batch_size = executor_batch_size
+
+        self._record = functools.lru_cache(maxsize=cache_size)(tag_record)
+        self._server = None
+        self._writers = set()
+
+        self.connections = 0
+        self.connections_total = 0
+        # (path, status): [count, seconds sum]
+        self.requests = {}
+        # path: count
+        self.values = {}
+
+    async def start(self):
+        """
+        Start listening. The bound port is available as :attr:`port` afterwards.
+        """
+        self._server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    def close(self):
+        """
+        Stop listening for new connections, and close open connections.
+        """
+        self._server.close()
+        for writer in self._writers:
+            writer.close()
+
+    async def wait_closed(self):
+        """
+        Wait until the server and all its connections are closed.
+        """
+        await self._server.wait_closed()
+        while self.connections:
+            await asyncio.sleep(0.001)
+
+    async def handle(self, reader, writer):
+        """
+        Serve requests on a connection until the client closes it or it's idle for longer than
+        ``keep_alive_timeout``.
+        """
+        self.connections += 1
+        self.connections_total += 1
+        self._writers.add(writer)
+
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b'\r\n\r\n'), self.keep_alive_timeout
+                    )
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    self._respond(writer, 413, {'error': 'Headers too large'}, False)
+                    break
+
+                start = time.perf_counter()
+                method, path, version, headers = self._parse_head(head)
+                keep_alive = self._keep_alive(version, headers)
+
+                try:
+                    body = await self._read_body(reader, headers)
+                except HTTPError as e:
+                    status, response = e.status, {'error': str(e)}
+                    # The body wasn't read, so the next request can't be found.
+                    keep_alive = False
+                else:
+                    try:
+                        status, response = await self.dispatch(method, path, body)
+                    except HTTPError as e:
+                        status, response = e.status, {'error': str(e)}
+
+                self._respond(writer, status, response, keep_alive)
+                await writer.drain()
+                self._count(path, status, time.perf_counter() - start)
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+            self.connections -= 1
+
+    @staticmethod
+    def _parse_head(head):
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, path, version = lines[0].split(' ', 2)
+        except ValueError:
+            method, path, version = '', '', 'HTTP/1.0'
+
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        return method, path.split('?', 1)[0], version, headers
+
+    @staticmethod
+    def _keep_alive(version, headers):
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.1':
+            return connection != 'close'
+        return connection == 'keep-alive'
+
+    async def _read_body(self, reader, headers):
+        if 'chunked' in headers.get('transfer-encoding', '').lower():
+            raise HTTPError(411, 'Chunked request bodies are not supported')
+
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise HTTPError(400, 'Invalid Content-Length')
+
+        if length > self.max_body_size:
+            raise HTTPError(413)
+        if length <= 0:
+            return b''
+        return await reader.readexactly(length)
+
+    async def dispatch(self, method, path, body):
+        """
+        Handle one request.
+
+        :return: Tuple of the HTTP status and the response, a dict encoded as JSON or a str
+            sent as plain text.
+        :rtype: tuple
+        """
+        if path == '/health':
+            return 200, {'status': 'ok'}
+        if path == '/metrics':
+            return 200, self.metrics()
+
+        input_format = _input_formats.get(path)
+        if input_format is None:
+            raise HTTPError(404)
+        if method != 'POST':
+            raise HTTPError(405)
+
+        try:
+            request = json.loads(body.decode('utf-8'))
+            values = request['values']
+            company_prefix_length = request.get('company_prefix_length')
+        except (AttributeError, KeyError, TypeError, ValueError):
+            raise HTTPError(400, 'Expected a JSON object with a `values` list')
+
+        if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+            raise HTTPError(400, '`values` must be a list of strings')
+        if company_prefix_length is not None and not isinstance(company_prefix_length, int):
+            raise HTTPError(400, '`company_prefix_length` must be an integer')
+        if len(values) > self.max_batch_size:
+            raise HTTPError(413, 'At most %d values per request' % self.max_batch_size)
+
+        self.values[path] = self.values.get(path, 0) + len(values)
+
+        if len(values) < self.executor_batch_size:
+            results = self._records(values, input_format, company_prefix_length)
+        else:
+            results = await asyncio.get_event_loop().run_in_executor(
+                None, self._records, values, input_format, company_prefix_length
+            )
+        return 200, {'results': results}
+
+    def _records(self, values, input_format, company_prefix_length):
+        record = self._record
+        return [record(value, input_format, company_prefix_length) for value in values]
+
+    @staticmethod
+    def _respond(writer, status, response, keep_alive):
+        if isinstance(response, str):
+            content_type = 'text/plain; version=0.0.4'
+            body = response.encode('utf-8')
+        else:
+            content_type = 'application/json'
+            body = json.dumps(response).encode('utf-8')
+
+        writer.write(
+            'HTTP/1.1 {} {}\r\nContent-Type: {}\r\nContent-Length: {}\r\n'
+            'Connection: {}\r\n\r\n'.format(
+                status, _reasons[status], content_type, len(body),
+                'keep-alive' if keep_alive else 'close'
+            ).encode('latin-1') + body
+        )
+
+    def _count(self, path, status, elapsed):
+        if path not in _input_formats and path not in ('/metrics', '/health'):
+            path = 'other'
+
+        request = self.requests.get((path, status))
+        if request is None:
+            request = self.requests[(path, status)] = [0, 0.0]
+        request[0] += 1
+        request[1] += elapsed
+
+    def metrics(self, prefix='epc_server'):
+        """
+        :return: Server metrics and :mod:`epc.instrumentation` metrics in the Prometheus text
+            exposition format.
+        :rtype: str
+        """
+        cache = self._record.cache_info()
+        lines = [
+            '# TYPE {0}_requests_total counter'.format(prefix),
+        ]
+        for (path, status), (count, _) in sorted(self.requests.items()):
+            lines.append('{0}_requests_total{{path="{1}",status="{2}"}} {3}'.format(
+                prefix, path, status, count))
+
+        lines.append('# TYPE {0}_request_seconds_sum counter'.format(prefix))
+        for (path, status), (_, seconds) in sorted(self.requests.items()):
+            lines.append('{0}_request_seconds_sum{{path="{1}",status="{2}"}} {3!r}'.format(
+                prefix, path, status, seconds))
+
+        lines.append('# TYPE {0}_values_total counter'.format(prefix))
+        for path, count in sorted(self.values.items()):
+            lines.append('{0}_values_total{{path="{1}"}} {2}'.format(prefix, path, count))
+
+        lines.extend([
+            '# TYPE {0}_cache_hits_total counter'.format(prefix),
+            '{0}_cache_hits_total {1}'.format(prefix, cache.hits),
+            '# TYPE {0}_cache_misses_total counter'.format(prefix),
+            '{0}_cache_misses_total {1}'.format(prefix, cache.misses),
+            '# TYPE {0}_cache_size gauge'.format(prefix),
+            '{0}_cache_size {1}'.format(prefix, cache.currsize),
+            '# TYPE {0}_connections gauge'.format(prefix),
+            '{0}_connections {1}'.format(prefix, self.connections),
+            '# TYPE {0}_connections_total counter'.format(prefix),
+            '{0}_connections_total {1}'.format(prefix, self.connections_total),
+        ])
+
+        return '\n'.join(lines) + '\n' + instrumentation.to_prometheus()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m epc.server', description='Serve EPC decode endpoints over HTTP.'
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Default: 127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080, help='Default: 8080')
+    parser.add_argument('--cache-size', type=int, default=65536, help='Default: 65536')
+    parser.add_argument('--max-batch-size', type=int, default=10000, help='Default: 10000')
+    parser.add_argument(
+        '--instrument', action='store_true', help='Enable epc.instrumentation metrics'
+    )
+    args = parser.parse_args(argv)
+
+    if args.instrument:
+        instrumentation.enable()
+
+    server = DecodeServer(
+        args.host, args.port, cache_size=args.cache_size, max_batch_size=args.max_batch_size
+    )
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(server.start())
+    print('Serving on http://{}:{}'.format(server.host, server.port))
+
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        loop.run_until_complete(server.wait_closed())
+        loop.close()
+
+
+if __name__ == '__main__':
+    main()
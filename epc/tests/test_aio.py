@@ -0,0 +1,107 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from epc.aio import DecodePipeline, decode_stream
+from epc.utils.validation import EPC_INVALID_CHARACTER, EPC_OK
+
+HEX = '3074257bf7194e4000001a85'
+
+
+class Source:
+    def __init__(self, items, delay=0, error=None):
+        self.items = iter(items)
+        self.delay = delay
+        self.error = error
+        self.read = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        try:
+            item = next(self.items)
+        except StopIteration:
+            if self.error is not None:
+                raise self.error
+            raise StopAsyncIteration
+        self.read += 1
+        return item
+
+
+class DecodePipelineTest(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_decode(self):
+        """Test payloads are decoded in batches, in order"""
+        async def collect():
+            batches = []
+            async for batch in DecodePipeline(Source([HEX, b'zz\n', ' ', HEX] * 5), batch_size=3):
+                batches.append(batch)
+            return batches
+
+        batches = self.run_async(collect())
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 3, 3, 3])
+
+        payload, code, tag = batches[0][0]
+        self.assertEqual((payload, code), (HEX, EPC_OK))
+        self.assertEqual(tag.pure_identity_uri, 'urn:epc:id:sgtin:0614141.812345.6789')
+        self.assertEqual(batches[0][1], ('zz', EPC_INVALID_CHARACTER, None))
+
+    def test_max_delay(self):
+        """Test partial batches are released after max_delay"""
+        sizes = []
+        count = self.run_async(decode_stream(
+            Source([HEX] * 6, delay=0.02), lambda batch: sizes.append(len(batch)),
+            batch_size=100, max_delay=0.001
+        ))
+        self.assertEqual(count, 6)
+        self.assertEqual(sizes, [1] * 6)
+
+    def test_executor(self):
+        """Test decoding in an executor, with a stream reader source"""
+        async def decode():
+            reader = asyncio.StreamReader()
+            reader.feed_data((HEX + '\n').encode() * 10)
+            reader.feed_eof()
+
+            with ThreadPoolExecutor(1) as executor:
+                return await decode_stream(reader, lambda batch: None, executor=executor)
+
+        self.assertEqual(self.run_async(decode()), 10)
+
+    def test_back_pressure(self):
+        """Test reading stops when the consumer falls behind, and close cancels reads"""
+        source = Source([HEX] * 1000)
+
+        async def consume_one():
+            pipeline = DecodePipeline(source, batch_size=10, max_pending=2)
+            async with pipeline:
+                async for batch in pipeline:
+                    await asyncio.sleep(0.01)
+                    break
+            return pipeline
+
+        pipeline = self.run_async(consume_one())
+        self.assertLess(source.read, 100)
+        self.assertTrue(all(task.done() for task in pipeline._tasks))
+
+    def test_source_error(self):
+        """Test source errors are raised to the consumer"""
+        async def consume():
+            async for batch in DecodePipeline(Source([HEX], error=ConnectionResetError())):
+                pass
+
+        with self.assertRaises(ConnectionResetError):
+            self.run_async(consume())
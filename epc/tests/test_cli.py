@@ -0,0 +1,101 @@
+import io
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from epc.cli import main
+
+HEX = ['3074257bf7194e4000001a85', '3500079ff00000b00000000c', 'not hex']
+URIS = ['urn:epc:id:sgtin:0614141.812345.6789', 'urn:epc:id:gid:31231.11.12', '']
+TAG_URIS = ['urn:epc:tag:sgtin-96:3.0614141.812345.6789', 'urn:epc:tag:gid-96:31231.11.12']
+
+
+def run(argv, lines):
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    status = main(argv, io.StringIO('\n'.join(lines) + '\n'), stdout, stderr)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+class CommandLineTest(TestCase):
+    def test_decode(self):
+        """Test decoding hex to each output format"""
+        status, output, summary = run(['decode'], HEX)
+        self.assertEqual(status, 0)
+        self.assertEqual(output.splitlines(), URIS)
+        self.assertIn('3 lines, 1 failed', summary)
+
+        _, output, _ = run(['decode', '-f', 'jsonl', '-q'], HEX)
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(records[1]['tag_uri'], 'urn:epc:tag:gid-96:31231.11.12')
+        self.assertEqual(records[2], {
+            'input': 'not hex',
+            'error': 'Non-hexadecimal input, or a character that cannot be decoded',
+        })
+
+        _, output, _ = run(['decode', '-f', 'csv', '-q'], HEX)
+        lines = output.splitlines()
+        self.assertEqual(lines[0], 'input,encoding,hex,uri,tag_uri,error')
+        self.assertEqual(lines[2].split(',')[:3], [HEX[1], 'gid-96', HEX[1]])
+
+        self.assertEqual(run(['decode', '--strict'], HEX)[0], 1)
+
+    def test_encode(self):
+        """Test encoding URIs to hex"""
+        _, output, _ = run(['encode'], TAG_URIS)
+        self.assertEqual(output.splitlines(), HEX[:2])
+
+    def test_translate(self):
+        """Test converting mixed input formats, including barcodes"""
+        lines = [HEX[1], TAG_URIS[0], '(01) 80614141123458 (21) 6789']
+
+        _, output, _ = run(['translate', '--company-prefix-length', '7', '-f', 'uri'], lines)
+        self.assertEqual(output.splitlines(), [URIS[1], URIS[0], URIS[0]])
+
+        _, output, _ = run(['translate', '-f', 'jsonl'], lines[2:])
+        self.assertIn('company prefix length is required', json.loads(output)['error'])
+
+    def test_validate(self):
+        """Test validation output and summary"""
+        _, output, summary = run(['validate', '--no-header'], HEX)
+        self.assertEqual(output.splitlines()[2], 'not hex,5,"Non-hexadecimal input, or a '
+                                                 'character that cannot be decoded"')
+        self.assertIn('2  Valid', summary)
+
+    def test_workers(self):
+        """Test output order is kept with a process pool"""
+        lines = HEX * 50
+        _, expected, _ = run(['decode', '-q'], lines)
+        _, output, _ = run(['decode', '-q', '--workers', '2', '--chunk-size', '7'], lines)
+        self.assertEqual(output, expected)
+
+    def test_file_workers(self):
+        """Test workers reading ranges of input files keep the output order"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        paths = [os.path.join(directory, name) for name in ('a.txt', 'b.txt')]
+        for path, lines in zip(paths, (HEX * 40, HEX[::-1] * 30)):
+            with open(path, 'w') as f:
+                f.write('\n'.join(lines) + '\n\n')
+
+        _, expected, _ = run(['decode', '-q', '-f', 'jsonl'] + paths, [])
+        status, output, summary = run(
+            ['decode', '--workers', '2', '--chunk-size', '7', '-f', 'jsonl'] + paths, []
+        )
+        self.assertEqual(output, expected)
+        self.assertEqual(len(output.splitlines()), 210)
+        self.assertIn('210 lines, 70 failed', summary)
+
+        # Carriage return line endings, read with universal newlines by both.
+        with open(paths[0], 'w', newline='') as f:
+            f.write('\r'.join(HEX * 10) + '\r\n' + '\r\n'.join(HEX * 10))
+
+        _, expected, _ = run(['decode', '-q', '-f', 'jsonl', paths[0]], [])
+        _, output, _ = run(
+            ['decode', '-q', '--workers', '2', '--chunk-size', '7', '-f', 'jsonl', paths[0]], []
+        )
+        self.assertEqual(output, expected)
+        self.assertEqual(len(output.splitlines()), 60)
@@ -0,0 +1,61 @@
+import json
+import subprocess
+import sys
+from unittest import TestCase, skipIf
+
+# Seconds allowed for `import epc.utils`, cumulative time of the import in a fresh interpreter as
+# reported by `-X importtime`, with plenty of slack for slow machines.
+IMPORT_TIME_BUDGET = 0.1
+
+# Fresh interpreters timed, the fastest run counts so a busy machine doesn't fail the test.
+IMPORT_TIME_RUNS = 3
+
+_probe = '''
+import json, sys
+import epc.utils
+loaded = sorted(name for name in sys.modules if name.startswith('epc'))
+epc.utils.decode_epc('3500079ff00000b00000000c')
+decoded = sorted(name for name in sys.modules if name.startswith('epc'))
+print(json.dumps({'loaded': loaded, 'decoded': decoded}))
+'''
+
+
+class ImportTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        output = subprocess.check_output([sys.executable, '-c', _probe])
+        cls.result = json.loads(output.decode())
+
+    @skipIf(sys.version_info < (3, 7), '-X importtime requires Python 3.7')
+    def test_import_budget(self):
+        """Test importing epc.utils stays within the startup budget"""
+        times = []
+        for _ in range(IMPORT_TIME_RUNS):
+            output = subprocess.check_output(
+                [sys.executable, '-X', 'importtime', '-c', 'import epc.utils'],
+                stderr=subprocess.STDOUT
+            )
+            # Lines are `import time: self [us] | cumulative | imported package`.
+            for line in output.decode().splitlines():
+                fields = line.split('|')
+                if len(fields) == 3 and fields[2].strip() == 'epc.utils':
+                    times.append(int(fields[1]) / 1e6)
+
+        self.assertEqual(len(times), IMPORT_TIME_RUNS)
+        self.assertLess(min(times), IMPORT_TIME_BUDGET)
+
+    def test_lazy_schemes(self):
+        """Test schemes and encodings are only imported when used"""
+        self.assertEqual(self.result['loaded'], ['epc', 'epc.schemes', 'epc.utils'])
+        self.assertIn('epc.schemes.GID', self.result['decoded'])
+        self.assertNotIn('epc.schemes.SGTIN', self.result['decoded'])
+        self.assertNotIn('epc.encoding.string', self.result['decoded'])
+
+    def test_scheme_attributes(self):
+        """Test scheme classes stay bound after importing their modules directly"""
+        import epc.schemes.SGLN  # noqa: F401
+        from epc import schemes
+        from epc.schemes.SGLN import SGLN
+
+        self.assertIs(schemes.SGLN, SGLN)
+        self.assertIn('SGTIN', dir(schemes))
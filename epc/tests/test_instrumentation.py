@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+import epc.utils
+from epc import instrumentation
+from epc.schemes import SGTIN
+
+
+class InstrumentationTest(TestCase):
+    def setUp(self):
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def _operations(self):
+        return {
+            (entry['operation'], entry['scheme']): entry
+            for entry in instrumentation.snapshot()['operations']
+        }
+
+    def test_disabled(self):
+        """Test nothing is patched or recorded while disabled"""
+        original = SGTIN.__dict__['decode_epc']
+        instrumentation.enable()
+        instrumentation.disable()
+
+        self.assertIs(SGTIN.__dict__['decode_epc'], original)
+        epc.utils.decode_epc('301800004000004000000001')
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual(instrumentation.snapshot()['operations'], [])
+
+    def test_enabled(self):
+        """Test operation counts, timings and errors are recorded"""
+        instrumentation.enable()
+        instrumentation.enable()
+
+        tag = epc.utils.decode_epc('301800004000004000000001')
+        self.assertEqual(tag.pure_identity_uri, 'urn:epc:id:sgtin:000001.0000001.1')
+        self.assertEqual(hex(tag), '0x301800004000004000000001')
+
+        with self.assertRaises(ValueError):
+            SGTIN(epc='341401388000000000000001')
+        with self.assertRaises(NotImplementedError):
+            epc.utils.decode_epc('3f1401388000000000000001')
+        with self.assertRaises(NotImplementedError):
+            epc.utils.decode_epc('2f1401388000000000000001')
+        with self.assertRaises(ValueError):
+            epc.utils.decode_epc('301f')
+        with self.assertRaises(ValueError):
+            epc.utils.decode_epc('301c00004000004000000001')
+        with self.assertRaises(AttributeError):
+            int(SGTIN().company_prefix('0614141'))
+
+        operations = self._operations()
+        self.assertEqual(operations[('dispatch', 'SGTIN')]['count'], 1)
+        self.assertEqual(operations[('header', 'all')]['count'], 5)
+        self.assertEqual(operations[('decode', 'SGTIN')]['count'], 4)
+        self.assertEqual(operations[('decode', 'SGTIN')]['errors'], {
+            'unknown_header': 1, 'invalid_length': 1, 'invalid_partition': 1,
+        })
+        self.assertEqual(operations[('dispatch', 'unknown')]['errors'], {
+            'unknown_header': 1, 'unimplemented_scheme': 1, 'invalid_length': 1,
+            'invalid_partition': 1,
+        })
+        self.assertEqual(operations[('encode', 'SGTIN')]['errors'], {'invalid_value': 1})
+        self.assertEqual(operations[('pure_identity_uri', 'SGTIN')]['count'], 1)
+        self.assertEqual(operations[('encode', 'SGTIN')]['count'], 2)
+        self.assertEqual(sum(operations[('decode', 'SGTIN')]['buckets']), 4)
+
+    def test_prometheus(self):
+        """Test Prometheus text export"""
+        instrumentation.enable()
+        epc.utils.decode_epc('301800004000004000000001')
+
+        lines = instrumentation.to_prometheus().splitlines()
+        self.assertIn('# TYPE epc_operation_seconds histogram', lines)
+        self.assertIn('epc_operations_total{operation="decode",scheme="SGTIN"} 1', lines)
+        self.assertIn(
+            'epc_operation_seconds_bucket{operation="decode",scheme="SGTIN",le="+Inf"} 1', lines
+        )
+        self.assertIn('epc_operation_seconds_count{operation="decode",scheme="SGTIN"} 1', lines)
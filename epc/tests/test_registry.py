@@ -0,0 +1,122 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from epc.registry import TagRegistry
+from epc.schemes import SGTIN
+from epc.utils import decode_epc
+
+TAGS = [
+    '3074257bf7194e4000001a85',
+    '3034257bf7194e4000001a85',
+    '3074257bf7194e4000001a86',
+    '3618000040000050a24a993a852a95ac5ab97b062c8000000000',
+    '3474257bf7194e4000001a85',
+    '3514257bf7194e4000001a85',
+]
+
+
+class TagRegistryTest(TestCase):
+    def setUp(self):
+        self.registry = TagRegistry(batch_size=2)
+        self.registry.add(TAGS, commissioned_at=1600000000.0, order_id='PO-1')
+
+    def tearDown(self):
+        self.registry.close()
+
+    def uris(self, **kwargs):
+        return sorted(row['uri'] for row in self.registry.query(**kwargs))
+
+    def test_add(self):
+        """Test adding tags and replacing tags of the same pure identity"""
+        # The first two tags only differ in filter.
+        self.assertEqual(len(self.registry), 5)
+        self.assertIn(TAGS[0], self.registry)
+        self.assertNotIn('3074257bf7194e4000001a87', self.registry)
+
+        row = self.registry.get(decode_epc(TAGS[0]))
+        self.assertEqual(row['hex'], TAGS[1])
+        self.assertEqual(row['encoding'], 'sgtin-96')
+        self.assertEqual(row['filter'], 1)
+        self.assertEqual(row['company_prefix'], '0614141')
+        self.assertEqual(row['reference'], 812345)
+        self.assertEqual(row['serial'], 6789)
+        self.assertEqual(row['gtin'], '80614141123458')
+        self.assertEqual(row['commissioned_at'], 1600000000.0)
+        self.assertEqual(row['order_id'], 'PO-1')
+
+        row = self.registry.get(TAGS[3])
+        self.assertIsNone(row['serial'])
+        self.assertEqual(row['serial_text'], decode_epc(TAGS[3])._serial)
+
+        tag = SGTIN()
+        tag.decode_gtin('00614141123452', 7, 1)
+        self.assertEqual(self.registry.add(iter([tag, int(TAGS[0], 16)]), order_id='PO-2'), 2)
+        self.assertEqual(len(self.registry), 6)
+        self.assertEqual(self.registry.get(TAGS[0])['order_id'], 'PO-2')
+
+    def test_add_invalid(self):
+        """Test adding tags that fail to decode"""
+        with self.assertRaises(ValueError):
+            self.registry.add(['3074257bf7194e4000001a87', 'invalid'])
+        with self.assertRaises(NotImplementedError):
+            self.registry.add(['3074257bf7194e4000001a87', '0074257bf7194e4000001a87'])
+
+        self.assertEqual(len(self.registry), 5)
+
+    def test_query(self):
+        """Test querying by GTIN, company prefix, serial range, URI pattern and order"""
+        self.assertEqual(self.uris(gtin='80614141123458'), [
+            'urn:epc:id:sgtin:0614141.812345.6789',
+            'urn:epc:id:sgtin:0614141.812345.6790',
+        ])
+        self.assertEqual(self.uris(gtin='80614141123458', serial_min=6790, serial_max=7000), [
+            'urn:epc:id:sgtin:0614141.812345.6790',
+        ])
+        self.assertEqual(self.uris(company_prefix='0614141'), [
+            'urn:epc:id:giai:0614141.223295693316430469',
+            'urn:epc:id:sgtin:0614141.812345.6789',
+            'urn:epc:id:sgtin:0614141.812345.6790',
+        ])
+        self.assertEqual(
+            self.uris(company_prefix='0614141', reference=812345, serial_min=6790), [
+                'urn:epc:id:sgtin:0614141.812345.6790',
+            ]
+        )
+        self.assertEqual(self.uris(uri='urn:epc:idpat:sgtin:0614141.*'), [
+            'urn:epc:id:sgtin:0614141.812345.6789',
+            'urn:epc:id:sgtin:0614141.812345.6790',
+        ])
+        self.assertEqual(self.uris(uri='urn:epc:id:gid:*'), [
+            'urn:epc:id:gid:21125055.7443684.6789',
+        ])
+        self.assertEqual(self.uris(uri='urn:epc:id:sgtin:0614141.812345.678?'), [])
+        self.assertEqual(len(self.uris(order_id='PO-1')), 5)
+        self.assertEqual(len(list(self.registry.query(limit=2))), 2)
+
+    def test_serial_index(self):
+        """Test serial ranges are indexed by GTIN, or by company prefix and reference"""
+        def plan(conditions):
+            rows = self.registry._connection.execute(
+                'EXPLAIN QUERY PLAN SELECT * FROM tags WHERE ' + conditions
+            )
+            return ' '.join(row[-1] for row in rows)
+
+        self.assertIn('tags_gtin', plan("gtin = '80614141123458' AND serial >= 1"))
+        self.assertIn('tags_reference', plan(
+            "company_prefix = '0614141' AND reference = 812345 AND serial >= 1"
+        ))
+
+    def test_file(self):
+        """Test registries persist in database files"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'tags.db')
+
+        with TagRegistry(path) as registry:
+            registry.add(TAGS)
+
+        with TagRegistry(path) as registry:
+            self.assertEqual(len(registry), 5)
+            self.assertIn(TAGS[4], registry)
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import threading
+from unittest import TestCase
+
+from epc.server import DecodeServer
+
+HEX = '3074257bf7194e4000001a85'
+
+
+class DecodeServerTest(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = DecodeServer(port=0, cache_size=16, max_batch_size=5)
+        self.loop.run_until_complete(self.server.start())
+
+    def tearDown(self):
+        self.server.close()
+        self.loop.run_until_complete(self.server.wait_closed())
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    async def send(self, *requests):
+        # Send requests on one connection, returning (status, headers, body) of each response,
+        # or of the only response.
+        if isinstance(requests[0], str):
+            return (await self.send(requests))[0]
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+        responses = []
+
+        for method, path, body in requests:
+            body = body if isinstance(body, bytes) else json.dumps(body).encode()
+            writer.write('{} {} HTTP/1.1\r\nContent-Length: {}\r\n\r\n'.format(
+                method, path, len(body)).encode() + body)
+
+            head = await reader.readuntil(b'\r\n\r\n')
+            headers = dict(
+                line.split(': ', 1) for line in head.decode().split('\r\n')[1:] if line
+            )
+            content = await reader.readexactly(int(headers['Content-Length']))
+            responses.append((int(head.split()[1]), headers, content.decode()))
+
+        writer.close()
+        return responses
+
+    def requests(self, *requests):
+        return self.loop.run_until_complete(self.send(*requests))
+
+    def test_batch_endpoints(self):
+        """Test decode, encode and translate requests on one keep-alive connection"""
+        responses = self.requests(
+            ('POST', '/decode', {'values': [HEX, 'zz']}),
+            ('POST', '/encode', {'values': ['urn:epc:tag:gid-96:31231.11.12']}),
+            ('POST', '/translate', {
+                'values': ['(01) 80614141123458 (21) 6789'], 'company_prefix_length': 7,
+            }),
+        )
+        self.assertEqual([status for status, _, _ in responses], [200, 200, 200])
+        self.assertEqual(responses[0][1]['Connection'], 'keep-alive')
+        self.assertEqual(self.server.connections_total, 1)
+
+        results = json.loads(responses[0][2])['results']
+        self.assertEqual(results[0]['uri'], 'urn:epc:id:sgtin:0614141.812345.6789')
+        self.assertIn('error', results[1])
+
+        self.assertEqual(json.loads(responses[1][2])['results'][0]['hex'],
+                         '3500079ff00000b00000000c')
+        self.assertEqual(json.loads(responses[2][2])['results'][0]['hex'],
+                         '3014257bf7194e4000001a85')
+
+    def test_errors(self):
+        """Test invalid requests"""
+        responses = self.requests(
+            ('GET', '/decode', b''),
+            ('POST', '/missing', b''),
+            ('POST', '/decode', b'not json'),
+            ('POST', '/decode', {'values': [HEX] * 6}),
+            ('GET', '/health', b''),
+        )
+        self.assertEqual([status for status, _, _ in responses], [405, 404, 400, 413, 200])
+        # The body of the batch that was too large was read, the connection stays open.
+        self.assertEqual(responses[3][1]['Connection'], 'keep-alive')
+
+    def test_body_too_large(self):
+        """Test bodies over the size limit are refused without reading them"""
+        async def send():
+            reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+            writer.write('POST /decode HTTP/1.1\r\nContent-Length: {}\r\n\r\n'.format(
+                self.server.max_body_size + 1).encode())
+            response = await reader.read()
+            writer.close()
+            return response
+
+        response = self.loop.run_until_complete(send())
+        self.assertTrue(response.startswith(b'HTTP/1.1 413 '))
+        self.assertIn(b'Connection: close\r\n', response)
+
+    def test_metrics(self):
+        """Test cache and request metrics"""
+        responses = self.requests(
+            ('POST', '/decode', {'values': [HEX, HEX]}),
+            ('GET', '/metrics', b''),
+        )
+        metrics = responses[1][2]
+        self.assertIn('epc_server_requests_total{path="/decode",status="200"} 1', metrics)
+        self.assertIn('epc_server_values_total{path="/decode"} 2', metrics)
+        self.assertIn('epc_server_cache_hits_total 1', metrics)
+        self.assertIn('epc_server_connections 1', metrics)
+        self.assertTrue(responses[1][1]['Content-Type'].startswith('text/plain'))
+
+    def test_large_batch(self):
+        """Test other connections are served while a large batch is decoded"""
+        self.server.executor_batch_size = 2
+        record = self.server._record
+        started, finished = threading.Event(), threading.Event()
+        completed = []
+
+        def slow_record(*args):
+            started.set()
+            finished.wait(2)
+            completed.append(args)
+            return record(*args)
+
+        self.server._record = slow_record
+
+        async def send():
+            batch = self.loop.create_task(self.send('POST', '/decode', {'values': [HEX, HEX]}))
+            await self.loop.run_in_executor(None, started.wait, 5)
+
+            health = await self.send('GET', '/health', b'')
+            served_first = not completed
+            finished.set()
+            return served_first, health, await batch
+
+        served_first, health, batch = self.loop.run_until_complete(send())
+        self.assertTrue(served_first)
+        self.assertEqual(health[0], 200)
+        self.assertEqual(batch[0], 200)
+        self.assertEqual(len(json.loads(batch[2])['results']), 2)
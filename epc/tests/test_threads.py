@@ -0,0 +1,145 @@
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+import epc.utils
+from epc import instrumentation
+from epc.registry import TagRegistry
+from epc.schemes import SGTIN
+from epc.utils import batch, jsonl, validation
+from epc.utils.validation import EPC_OK, validate
+
+THREADS = 8
+ROUNDS = 50
+
+HEX_STRINGS = (
+    '3074257bf7194e4000001a85',
+    '3674257bf6b7a659b2c2bf100000000000000000000000000000',
+    '3274257bf46072000000162e',
+    '39180000400002c4000000000000000000000000000000000000',
+    '3374257bf40c0e400000162e',
+    '37180000400000588000000000000000000000000000',
+    '3474257bf4000000000015e9',
+    '3818000058800000000000000000000000000000000000000000',
+    '350000001000001000000001',
+    '3174257bf4499602d2000000',
+    '2c74257bf46072000000162e',
+    '3a34257bf46072b1a2bc2ec500008000',
+    '2d14257bf4607200000004d2',
+)
+
+
+def _results(hex_strings):
+    results = []
+    for hex_string in hex_strings:
+        tag = epc.utils.decode_epc(hex_string)
+        results.append((
+            tag.tag_uri, tag.pure_identity_uri, int(tag), tag.identity_key(),
+            validate(hex_string), epc.utils.decode_epc(int(tag)) == tag,
+        ))
+    return results
+
+
+class ThreadTest(TestCase):
+    def setUp(self):
+        # Switch threads as often as possible, to interleave them mid-operation.
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def run_threads(self, function):
+        barrier = threading.Barrier(THREADS)
+
+        def run(index):
+            barrier.wait()
+            return function(index)
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            return list(executor.map(run, range(THREADS)))
+
+    def test_decode_encode(self):
+        """Test decoding and encoding from many threads matches decoding in one thread"""
+        expected = _results(HEX_STRINGS)
+        for result in expected:
+            self.assertEqual(result[4], EPC_OK)
+
+        # Start with empty caches, so threads race to fill them.
+        validation._layouts.clear()
+        batch._sizes.clear()
+        jsonl._schemes = None
+
+        def run(index):
+            results = []
+            for _ in range(ROUNDS):
+                results = _results(HEX_STRINGS)
+                batch.encode_batch(HEX_STRINGS)
+                jsonl.from_jsonl(jsonl.to_jsonl(epc.utils.decode_epc(h) for h in HEX_STRINGS))
+            return results
+
+        for results in self.run_threads(run):
+            self.assertEqual(results, expected)
+
+    def test_shared_tags(self):
+        """Test tags shared by threads compare and hash the same in every thread"""
+        expected = ['{:x}'.format(int(tag)) for tag in sorted(
+            epc.utils.decode_epc(hex_string) for hex_string in HEX_STRINGS
+        )]
+        # Identity keys of these tags are computed and cached by the threads.
+        tags = [epc.utils.decode_epc(hex_string) for hex_string in HEX_STRINGS]
+
+        def run(index):
+            results = []
+            for _ in range(ROUNDS):
+                results = ['{:x}'.format(int(tag)) for tag in sorted(tags)]
+                self.assertEqual(len(set(tags)), len(tags))
+            return results
+
+        for results in self.run_threads(run):
+            self.assertEqual(results, expected)
+
+    def test_instrumentation(self):
+        """Test metrics recorded from many threads are all counted"""
+        instrumentation.reset()
+        instrumentation.enable()
+
+        def run(index):
+            for _ in range(ROUNDS):
+                epc.utils.decode_epc(HEX_STRINGS[0])
+
+        self.run_threads(run)
+
+        operations = {
+            (entry['operation'], entry['scheme']): entry
+            for entry in instrumentation.snapshot()['operations']
+        }
+        self.assertEqual(operations['dispatch', 'SGTIN']['count'], THREADS * ROUNDS)
+        self.assertEqual(operations['decode', 'SGTIN']['count'], THREADS * ROUNDS)
+        self.assertEqual(sum(operations['decode', 'SGTIN']['buckets']), THREADS * ROUNDS)
+
+    def test_registry(self):
+        """Test threads adding to and querying a shared registry"""
+        registry = TagRegistry(batch_size=7)
+
+        def run(index):
+            tag = SGTIN().company_prefix('0614141').item_reference(12345).filter(
+                SGTIN.FILTER_POS).tag_size(SGTIN.SIZE_96)
+            values = [
+                int(tag.serial_number(serial))
+                for serial in range(index * ROUNDS, (index + 1) * ROUNDS)
+            ]
+
+            registry.add(values, order_id=str(index))
+            self.assertTrue(all(value in registry for value in values))
+            return len(list(registry.query(order_id=str(index))))
+
+        try:
+            self.assertEqual(self.run_threads(run), [ROUNDS] * THREADS)
+            self.assertEqual(len(registry), THREADS * ROUNDS)
+            self.assertEqual(len(list(registry.query(gtin='00614141123452'))), THREADS * ROUNDS)
+        finally:
+            registry.close()
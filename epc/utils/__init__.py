@@ -1,5 +1,42 @@
+from collections.abc import MutableMapping
+
 from epc import schemes
 
+
+class SchemeMap(MutableMapping):
+    """
+    Mapping of keys to EPC scheme classes. Values may be given as scheme class names, which are
+    imported from :mod:`epc.schemes` on first lookup, so only the schemes in use are loaded.
+
+    Lookups are safe from many threads without locking: threads resolving a name at the same
+    time import the scheme once, through the import lock, and store the same class.
+    """
+
+    def __init__(self, scheme_names=()):
+        self._schemes = dict(scheme_names)
+
+    def __getitem__(self, key):
+        scheme = self._schemes[key]
+        if isinstance(scheme, str):
+            scheme = self._schemes[key] = getattr(schemes, scheme)
+        return scheme
+
+    def __setitem__(self, key, scheme):
+        self._schemes[key] = scheme
+
+    def __delitem__(self, key):
+        del self._schemes[key]
+
+    def __iter__(self):
+        return iter(self._schemes)
+
+    def __len__(self):
+        return len(self._schemes)
+
+    def __repr__(self):
+        return '<SchemeMap %r>' % self._schemes
+
+
 epc_encoding_types = {
     0x00: 'Unprogrammed',
     # range(0x01, 0x2B): 'Reserved',
@@ -22,37 +59,43 @@ epc_encoding_types = {
     # range(0x3C, 0xFF): 'Reserved',
 }
 
-epc_encoding_map = {
-    0x30: schemes.SGTIN,
-    0x32: schemes.SGLN,
-    0x33: schemes.GRAI,
-    0x34: schemes.GIAI,
-    0x35: schemes.GID,
-    0x36: schemes.SGTIN,
-    0x37: schemes.GRAI,
-    0x38: schemes.GIAI,
-    0x39: schemes.SGLN,
-}
+epc_encoding_map = SchemeMap({
+    0x2C: 'GDTI',
+    0x2D: 'GSRN',
+    0x30: 'SGTIN',
+    0x31: 'SSCC',
+    0x32: 'SGLN',
+    0x33: 'GRAI',
+    0x34: 'GIAI',
+    0x35: 'GID',
+    0x36: 'SGTIN',
+    0x37: 'GRAI',
+    0x38: 'GIAI',
+    0x39: 'SGLN',
+    0x3A: 'GDTI',
+})
 
 
 def get_epc_header(hex_string):
     """
-    Get the numeric EPC header value for a specified hex string.
+    Get the numeric EPC header value for a specified hex string or integer.
     """
-    # Accept hex strings prefixed by '0x'
-    if hex_string[:2] == '0x':
-        hex_string = hex_string[2:]
+    if isinstance(hex_string, int):
+        tag_data = hex_string
+    else:
+        # Accept hex strings prefixed by '0x'
+        if hex_string[:2] == '0x':
+            hex_string = hex_string[2:]
+
+        tag_data = int(hex_string, 16)
 
-    tag_data = int(hex_string, 16)
     tag_length = tag_data.bit_length()
 
     # Pad the length to multiples of 16, per the EPC Tag Data Standard
     if tag_length % 16 != 0:
         tag_length += 16 - tag_length % 16
 
-    tag_binary = '{:0{}b}'.format(tag_data, tag_length)
-
-    return int(tag_binary[:8], 2)
+    return tag_data >> max(tag_length - 8, 0)
 
 
 def get_epc_encoding(hex_string):
@@ -75,10 +118,11 @@ def get_epc_encoding(hex_string):
 
 def decode_epc(hex_string):
     """
-    Attempt to decode a hex string to an EPC tag. Returns a tag object if successful.
+    Attempt to decode a hex string or integer to an EPC tag. Returns a tag object if
+    successful.
 
-    :param epc: Hexadecimal EPC tag data
-    :type epc: str
+    :param epc: Hexadecimal EPC tag data, or the tag data as an integer
+    :type epc: str, int
 
     :raises NotImplementedError: Unable to determine tag encoding.
     :raises NotImplementedError: Scheme not implemented for tag.
@@ -0,0 +1,476 @@
+"""
+Streaming aggregates of tag reads over time windows, for live dashboards.
+
+A :class:`TagAggregator` counts reads per encoding, filter value and SGLN read point exactly,
+and per GTIN with bounded memory sketches: a :class:`CountMinSketch` estimates the count of any
+GTIN, and a :class:`SpaceSaving` summary keeps the most read ones::
+
+    aggregator = TagAggregator(window=300, step=10, top=100)
+    aggregator.add_many(hex_strings)
+
+    summary = aggregator.snapshot()
+    summary['top_gtins'][:10], summary['read_points'], aggregator.gtin_count('00614141123452')
+
+Windows are made of panes of ``step`` seconds. With the default ``step``, the window itself is
+one pane and windows tumble; with a shorter ``step`` the window slides by one pane at a time.
+Both sketches can be merged, so a window's summary is the merge of its panes.
+"""
+import heapq
+import itertools
+import threading
+import time
+import zlib
+from collections import Counter
+
+from epc.schemes import SGLN, SGTIN
+from epc.schemes.base import EpcScheme
+from epc.utils.validation import EPC_OK, try_decode
+
+
+def _key_bytes(key):
+    if isinstance(key, bytes):
+        return key
+    return str(key).encode('utf-8')
+
+
+class SpaceSaving:
+    """
+    Space-Saving summary of the most frequent keys of a stream, in memory bounded by
+    ``capacity`` keys. Counts of the kept keys are overestimated by at most their ``error``,
+    and any key counted more than ``total / capacity`` times is kept.
+
+    :param capacity: Maximum number of keys kept. Defaults to ``1000``.
+    :type capacity: int, optional
+    """
+
+    def __init__(self, capacity=1000):
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+
+        self.capacity = capacity
+        self.total = 0
+
+        # Key: [Count, Error]
+        self._counts = {}
+        # (Count, Sequence, Key) of every kept key, counts are updated when they reach the top.
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __contains__(self, key):
+        return key in self._counts
+
+    def add(self, key, count=1):
+        """
+        Count a key.
+
+        :param key: Hashable key.
+        :type key: object
+
+        :param count: Number of times to count it. Defaults to ``1``.
+        :type count: int, optional
+        """
+        self.total += count
+
+        entry = self._counts.get(key)
+        if entry is not None:
+            entry[0] += count
+            return
+
+        if len(self._counts) < self.capacity:
+            self._counts[key] = [count, 0]
+            heapq.heappush(self._heap, (count, next(self._sequence), key))
+            return
+
+        # Replace the key with the smallest count, taking over its count as the error.
+        heap = self._heap
+        while True:
+            smallest, _, smallest_key = heap[0]
+            current = self._counts[smallest_key][0]
+            if current == smallest:
+                break
+            heapq.heapreplace(heap, (current, next(self._sequence), smallest_key))
+
+        del self._counts[smallest_key]
+        self._counts[key] = [smallest + count, smallest]
+        heapq.heapreplace(heap, (smallest + count, next(self._sequence), key))
+
+    def update(self, keys):
+        """
+        Count each of many keys once.
+
+        :param keys: Hashable keys.
+        :type keys: iterable
+        """
+        add = self.add
+        for key in keys:
+            add(key)
+
+    def count(self, key):
+        """
+        :return: Estimated count of a kept key, or ``0``.
+        :rtype: int
+        """
+        entry = self._counts.get(key)
+        return entry[0] if entry is not None else 0
+
+    def _floor(self):
+        # Largest count a key that isn't kept can have.
+        if len(self._counts) < self.capacity:
+            return 0
+        return min(count for count, _ in self._counts.values())
+
+    def top(self, n=None):
+        """
+        The most frequent keys.
+
+        :param n: Number of keys. Defaults to all kept keys.
+        :type n: int, optional
+
+        :return: List of ``(key, count, error)`` tuples, by count descending.
+        :rtype: list
+        """
+        entries = sorted(self._counts.items(), key=lambda item: item[1][0], reverse=True)
+        return [(key, count, error) for key, (count, error) in entries[:n]]
+
+    def merge(self, other):
+        """
+        Merge with the summary of another stream.
+
+        :param other: Summary to merge.
+        :type other: :class:`SpaceSaving`
+
+        :return: New summary of both streams, with the larger capacity.
+        :rtype: :class:`SpaceSaving`
+        """
+        merged = SpaceSaving(max(self.capacity, other.capacity))
+        merged.total = self.total + other.total
+
+        # Keys missing from a full summary may have up to its smallest count there.
+        floor, other_floor = self._floor(), other._floor()
+        counts = {}
+        for key in set(self._counts) | set(other._counts):
+            count, error = self._counts.get(key, (floor, floor))
+            other_count, other_error = other._counts.get(key, (other_floor, other_floor))
+            counts[key] = [count + other_count, error + other_error]
+
+        kept = sorted(counts.items(), key=lambda item: item[1][0], reverse=True)
+        for key, entry in kept[:merged.capacity]:
+            merged._counts[key] = entry
+            merged._heap.append((entry[0], next(merged._sequence), key))
+        heapq.heapify(merged._heap)
+
+        return merged
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch of the counts of any number of keys, in ``width * depth`` counters.
+    Estimates are never below the true count, and above it by at most ``2 / width`` of the
+    total with probability ``1 - 2 ** -depth``.
+
+    Keys are hashed with CRC-32 rather than :func:`hash`, so sketches built by different
+    processes can be merged.
+
+    :param width: Counters per row. Defaults to ``2048``.
+    :type width: int, optional
+
+    :param depth: Number of rows. Defaults to ``4``.
+    :type depth: int, optional
+    """
+
+    def __init__(self, width=2048, depth=4):
+        if width < 1 or depth < 1:
+            raise ValueError('width and depth must be at least 1')
+
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._rows = [[0] * width for _ in range(depth)]
+
+    def _columns(self, key):
+        # Double hashing: row i uses h1 + i * h2.
+        data = _key_bytes(key)
+        h1 = zlib.crc32(data)
+        h2 = zlib.crc32(data, 0x9e3779b9) | 1
+        width = self.width
+        return [(h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, key, count=1):
+        """
+        Count a key.
+
+        :param key: Key, as a str, bytes or int.
+        :type key: str, bytes, int
+
+        :param count: Number of times to count it. Defaults to ``1``.
+        :type count: int, optional
+        """
+        self.total += count
+        for row, column in zip(self._rows, self._columns(key)):
+            row[column] += count
+
+    def estimate(self, key):
+        """
+        :return: Estimated count of a key.
+        :rtype: int
+        """
+        return min(row[column] for row, column in zip(self._rows, self._columns(key)))
+
+    def merge(self, other):
+        """
+        Merge with the sketch of another stream.
+
+        :param other: Sketch of the same width and depth.
+        :type other: :class:`CountMinSketch`
+
+        :raises ValueError: Sketches of different sizes.
+
+        :return: New sketch of both streams.
+        :rtype: :class:`CountMinSketch`
+        """
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError('Only sketches of the same width and depth can be merged')
+
+        merged = CountMinSketch(self.width, self.depth)
+        merged.total = self.total + other.total
+        merged._rows = [[a + b for a, b in zip(row, other_row)]
+                        for row, other_row in zip(self._rows, other._rows)]
+        return merged
+
+
+class _Pane:
+    __slots__ = ('reads', 'invalid', 'encodings', 'filters', 'read_points', 'gtins', 'top')
+
+    def __init__(self, top_capacity, sketch_width, sketch_depth):
+        self.reads = 0
+        self.invalid = 0
+        self.encodings = Counter()
+        self.filters = Counter()
+        self.read_points = Counter()
+        self.gtins = CountMinSketch(sketch_width, sketch_depth)
+        self.top = SpaceSaving(top_capacity)
+
+
+class TagAggregator:
+    """
+    Counts of tag reads over a tumbling or sliding time window.
+
+    Methods can be called from many threads.
+
+    :param window: Window length in seconds. Defaults to ``300``.
+    :type window: float, optional
+
+    :param step: Seconds the window slides by, a divisor of ``window``. Defaults to ``window``,
+        for tumbling windows.
+    :type step: float, optional
+
+    :param top: Number of GTINs in :meth:`snapshot`'s ``top_gtins``. Defaults to ``100``.
+    :type top: int, optional
+
+    :param top_capacity: GTINs kept by the :class:`SpaceSaving` summary of each pane, more
+        give more accurate top counts. Defaults to ``10 * top``.
+    :type top_capacity: int, optional
+
+    :param sketch_width: Width of the :class:`CountMinSketch` of each pane. Defaults to
+        ``2048``.
+    :type sketch_width: int, optional
+
+    :param sketch_depth: Depth of the :class:`CountMinSketch` of each pane. Defaults to ``4``.
+    :type sketch_depth: int, optional
+
+    :param on_window: Called with the :meth:`snapshot` of each window as it ends, when a read
+        of a later pane is added.
+    :type on_window: callable, optional
+
+    :param clock: Time of reads added without a timestamp. Defaults to :func:`time.time`.
+    :type clock: callable, optional
+
+    :raises ValueError: Window isn't a positive multiple of step, or ``top``,
+        ``top_capacity`` or a sketch size is less than 1.
+    """
+
+    def __init__(self, window=300.0, step=None, top=100, top_capacity=None, sketch_width=2048,
+                 sketch_depth=4, on_window=None, clock=time.time):
+        if step is None:
+            step = window
+        if window <= 0 or step <= 0:
+            raise ValueError('window and step must be positive')
+        panes = int(round(window / step))
+        if panes < 1 or abs(panes * step - window) > 1e-9 * window:
+            raise ValueError('window must be a positive multiple of step')
+
+        # Panes are created as reads arrive, check their sizes up front.
+        if top < 1:
+            raise ValueError('top must be at least 1')
+        if top_capacity is None:
+            top_capacity = 10 * top
+        if top_capacity < 1:
+            raise ValueError('top_capacity must be at least 1')
+        if sketch_width < 1 or sketch_depth < 1:
+            raise ValueError('sketch_width and sketch_depth must be at least 1')
+
+        self.window = window
+        self.step = step
+        self.top = top
+        self.on_window = on_window
+        self.clock = clock
+
+        #: Reads too old for the window when they were added.
+        self.late = 0
+
+        self._panes = {}
+        self._pane_count = panes
+        self._latest = None
+        self._pane_arguments = (top_capacity, sketch_width, sketch_depth)
+        self._lock = threading.RLock()
+
+    def _pane(self, timestamp):
+        index = int(timestamp // self.step)
+
+        if self._latest is None:
+            self._latest = index
+        elif index > self._latest:
+            self._advance(index)
+        elif index <= self._latest - self._pane_count:
+            self.late += 1
+            return None
+
+        pane = self._panes.get(index)
+        if pane is None:
+            pane = self._panes[index] = _Pane(*self._pane_arguments)
+        return pane
+
+    def _advance(self, index):
+        # Report the windows ending before the new pane, up to the last one with reads.
+        if self.on_window is not None:
+            for last in range(self._latest, min(index, self._latest + self._pane_count)):
+                self.on_window(self._snapshot(last))
+
+        self._latest = index
+        for old in [old for old in self._panes if old <= index - self._pane_count]:
+            del self._panes[old]
+
+    def add(self, tag, timestamp=None):
+        """
+        Count a read.
+
+        :param tag: Tag object, or hex string or integer to decode. Values that don't decode
+            are counted as ``invalid``.
+        :type tag: :class:`epc.schemes.base.EpcScheme`, str, int
+
+        :param timestamp: Unix time of the read. Defaults to now.
+        :type timestamp: float, optional
+        """
+        self.add_many((tag,), timestamp)
+
+    def add_many(self, tags, timestamp=None):
+        """
+        Count reads made at the same time, such as a batch from a reader.
+
+        :param tags: Tag objects, or hex strings or integers to decode.
+        :type tags: iterable
+
+        :param timestamp: Unix time of the reads. Defaults to now.
+        :type timestamp: float, optional
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+
+        with self._lock:
+            pane = self._pane(timestamp)
+            if pane is None:
+                return
+
+            for tag in tags:
+                if not isinstance(tag, EpcScheme):
+                    code, tag = try_decode(tag)
+                    if code != EPC_OK:
+                        pane.invalid += 1
+                        continue
+
+                pane.reads += 1
+                pane.encodings[tag.encoding] += 1
+
+                tag_filter = getattr(tag, '_tag_filter', None)
+                if tag_filter is not None:
+                    pane.filters[tag_filter] += 1
+
+                if isinstance(tag, SGLN):
+                    pane.read_points[tag.pure_identity_uri] += 1
+                elif isinstance(tag, SGTIN):
+                    gtin = tag.gtin
+                    pane.gtins.add(gtin)
+                    pane.top.add(gtin)
+
+    def _window_panes(self, last):
+        return [
+            pane for index, pane in sorted(self._panes.items())
+            if last - self._pane_count < index <= last
+        ]
+
+    def _snapshot(self, last):
+        panes = self._window_panes(last)
+
+        encodings = Counter()
+        filters = Counter()
+        read_points = Counter()
+        top = SpaceSaving(self._pane_arguments[0])
+        for pane in panes:
+            encodings.update(pane.encodings)
+            filters.update(pane.filters)
+            read_points.update(pane.read_points)
+            top = top.merge(pane.top)
+
+        return {
+            'start': (last - self._pane_count + 1) * self.step,
+            'end': (last + 1) * self.step,
+            'reads': sum(pane.reads for pane in panes),
+            'invalid': sum(pane.invalid for pane in panes),
+            'encodings': dict(encodings),
+            'filters': dict(filters),
+            'read_points': dict(read_points),
+            'top_gtins': top.top(self.top),
+        }
+
+    def _last(self, now):
+        if now is None:
+            now = self.clock()
+        return int(now // self.step)
+
+    def snapshot(self, now=None):
+        """
+        Summarize the window ending with the pane of ``now``.
+
+        :param now: Unix time in the last pane of the window. Defaults to now.
+        :type now: float, optional
+
+        :return: Dictionary containing:
+
+            * ``start``, ``end`` (float): Unix times of the start and end of the window
+            * ``reads`` (int): valid reads, and ``invalid`` (int) values that didn't decode
+            * ``encodings``, ``filters``, ``read_points`` (dict): exact read counts per
+              encoding, filter value and SGLN pure identity URI
+            * ``top_gtins`` (list): ``(gtin, count, error)`` tuples of the most read GTINs,
+              by count descending, counts may be overestimated by up to ``error``
+        :rtype: dict
+        """
+        with self._lock:
+            return self._snapshot(self._last(now))
+
+    def gtin_count(self, gtin, now=None):
+        """
+        Estimate the reads of a GTIN in the window, never below the true count.
+
+        :param gtin: GTIN-14.
+        :type gtin: str
+
+        :param now: Unix time in the last pane of the window. Defaults to now.
+        :type now: float, optional
+
+        :rtype: int
+        """
+        with self._lock:
+            return sum(pane.gtins.estimate(gtin) for pane in self._window_panes(self._last(now)))
@@ -0,0 +1,272 @@
+"""
+Columnar on-disk archive for decoded tags.
+
+Each decoded field is stored in its own fixed-width binary column, so analytics queries can
+scan months of reads without re-decoding any hex. An archive is a directory holding a small
+JSON manifest and one file per column per segment. Segments are append-only: new reads are
+written as a new segment, existing column files are never modified.
+
+Columns are opened read-only with :class:`numpy.memmap`, making scans zero-copy.
+
+Requires NumPy (``pip install epc-encoding-utils[numpy]``).
+"""
+import json
+import os
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from epc import schemes
+from epc.utils import epc_encoding_map
+from epc.utils.files import replace_file
+
+ARCHIVE_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+# Characters of the serial text column, the longest alphanumeric serial of the supported
+# encodings is a GIAI-202 asset reference.
+SERIAL_TEXT_SIZE = 24
+
+COLUMNS = (
+    # Column name, NumPy dtype
+    ('header', 'u1'),
+    ('filter', 'u1'),
+    ('company_prefix_length', 'u1'),
+    ('company_prefix', '<u8'),
+    ('reference', '<u8'),
+    ('serial', '<u8'),
+    ('serial_text', 'S%d' % SERIAL_TEXT_SIZE),
+)
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError('NumPy is required to use epc.utils.archive')
+
+
+def _read_manifest(path):
+    manifest_path = os.path.join(path, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return None
+
+    with open(manifest_path) as manifest_file:
+        manifest = json.load(manifest_file)
+
+    if manifest.get('version') != ARCHIVE_VERSION:
+        raise ValueError('Unsupported archive version: %s' % manifest.get('version'))
+
+    return manifest
+
+
+def _column_path(path, segment, column):
+    return os.path.join(path, '{}.{}.bin'.format(segment, column))
+
+
+def _tag_row(tag):
+    """
+    Flatten a decoded tag object into a row of column values.
+    """
+    if tag._identity_fields is None:
+        raise ValueError('Scheme `%s` cannot be archived' % type(tag).__name__)
+    (prefix_attr, _), (reference_attr, _), (serial_attr, _) = tag._identity_fields
+
+    tag.check_fields()
+
+    reference = getattr(tag, reference_attr) if reference_attr else 0
+    serial = getattr(tag, serial_attr)
+
+    # Large encodings carry alphanumeric serials, keep those in the text column.
+    if tag._tag_size == tag.SIZE_96:
+        serial_text = b''
+    else:
+        serial_text = str(serial).encode('ascii')
+        serial = 0
+
+        # Longer text would be truncated by the column.
+        if len(serial_text) > SERIAL_TEXT_SIZE:
+            raise ValueError('Serial `%s` is longer than %d characters' % (
+                serial_text.decode('ascii'), SERIAL_TEXT_SIZE))
+
+    return (
+        tag.HEADERS[tag.TAG_SIZES.index(tag._tag_size)],
+        getattr(tag, '_tag_filter', 0),
+        getattr(tag, '_company_prefix_length', None) or 0,
+        getattr(tag, prefix_attr),
+        reference,
+        serial,
+        serial_text,
+    )
+
+
+def _build_tag(cls, header, tag_filter, company_prefix_length, company_prefix, reference,
+               serial, serial_text):
+    """
+    Construct a tag object from archived column values, without decoding.
+    """
+    _, (_, reference_setter), (_, serial_setter) = cls._identity_fields
+    tag = cls().tag_size(cls.TAG_SIZES[cls.HEADERS.index(header)])
+
+    if cls is schemes.GID:
+        tag.manager_number(company_prefix)
+    else:
+        tag.filter(tag_filter).company_prefix(company_prefix, company_prefix_length)
+
+    if reference_setter:
+        getattr(tag, reference_setter)(reference)
+
+    if tag._tag_size != tag.SIZE_96:
+        serial = serial_text.decode('ascii')
+
+    getattr(tag, serial_setter)(serial)
+    return tag
+
+
+class TagArchiveWriter:
+    """
+    Append decoded tags to a columnar archive, creating it if it doesn't exist.
+
+    :param path: Archive directory.
+    :type path: str
+    """
+
+    def __init__(self, path):
+        _require_numpy()
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+        self._manifest = _read_manifest(path)
+        if self._manifest is None:
+            self._manifest = {
+                'version': ARCHIVE_VERSION,
+                'columns': [list(column) for column in COLUMNS],
+                'segments': [],
+            }
+            self._write_manifest()
+
+    def append(self, tags):
+        """
+        Write a new segment containing the supplied tags.
+
+        :param tags: Decoded tag objects.
+        :type tags: iterable
+
+        :raises ValueError: A tag's scheme cannot be archived, or its serial is longer than
+            :data:`SERIAL_TEXT_SIZE` characters.
+
+        :return: The new segment's name, or ``None`` if no tags were supplied.
+        :rtype: str
+        """
+        rows = [_tag_row(tag) for tag in tags]
+        if not rows:
+            return None
+
+        segment = '{:06d}'.format(len(self._manifest['segments']))
+        values = list(zip(*rows))
+
+        for i, (column, dtype) in enumerate(COLUMNS):
+            numpy.asarray(values[i], dtype=dtype).tofile(_column_path(self.path, segment, column))
+
+        self._manifest['segments'].append({'name': segment, 'count': len(rows)})
+        self._write_manifest()
+        return segment
+
+    def _write_manifest(self):
+        # Replace the manifest atomically, readers never observe a partial segment.
+        # Each writer writes its own temporary file.
+        with replace_file(os.path.join(self.path, MANIFEST_NAME), 'w') as manifest_file:
+            json.dump(self._manifest, manifest_file)
+
+
+class TagArchive:
+    """
+    Read-only view of a columnar tag archive. Column data is memory-mapped, not loaded.
+
+    :param path: Archive directory.
+    :type path: str
+
+    :raises ValueError: Archive not found, or unsupported archive version.
+    """
+
+    def __init__(self, path):
+        _require_numpy()
+        self.path = path
+
+        manifest = _read_manifest(path)
+        if manifest is None:
+            raise ValueError('No archive found at %s' % path)
+
+        columns = [tuple(column) for column in manifest['columns']]
+        self._segments = [
+            {
+                column: numpy.memmap(
+                    _column_path(path, segment['name'], column), dtype=dtype, mode='r',
+                    shape=(segment['count'],)
+                )
+                for column, dtype in columns
+            }
+            for segment in manifest['segments']
+        ]
+
+    def __len__(self):
+        return sum(len(segment['header']) for segment in self._segments)
+
+    def __iter__(self):
+        for segment in self._segments:
+            for row in zip(*(segment[column] for column, _ in COLUMNS)):
+                yield self._row_to_tag(row)
+
+    @property
+    def segments(self):
+        """
+        :return: One dictionary of memory-mapped columns per segment, in append order.
+        :rtype: list
+        """
+        return list(self._segments)
+
+    def column(self, name):
+        """
+        Get the full contents of a column. Zero-copy when the archive has a single segment,
+        otherwise the segments are concatenated into a new array.
+
+        :param name: Column name, one of :data:`COLUMNS`.
+        :type name: str
+
+        :rtype: numpy.ndarray
+        """
+        if len(self._segments) == 1:
+            return self._segments[0][name]
+        if not self._segments:
+            return numpy.empty(0, dtype=dict(COLUMNS)[name])
+        return numpy.concatenate([segment[name] for segment in self._segments])
+
+    def tag(self, index):
+        """
+        Rebuild the tag object stored at a row of the archive.
+
+        :param index: Row number across all segments.
+        :type index: int
+
+        :raises IndexError: Row out of range.
+
+        :rtype: object
+        """
+        if index < 0:
+            index += len(self)
+
+        for segment in self._segments:
+            count = len(segment['header'])
+            if 0 <= index < count:
+                return self._row_to_tag(tuple(segment[column][index] for column, _ in COLUMNS))
+            index -= count
+
+        raise IndexError('Archive index out of range')
+
+    @staticmethod
+    def _row_to_tag(row):
+        header = int(row[0])
+        return _build_tag(
+            epc_encoding_map[header], header, int(row[1]), int(row[2]), int(row[3]),
+            int(row[4]), int(row[5]), bytes(row[6])
+        )
@@ -1,17 +1,20 @@
-from epc import schemes
+from epc.utils import SchemeMap
 
-barcode_encoding_map = {
-    '8003': schemes.GRAI,
-    '8004': schemes.GIAI,
-    '414': schemes.SGLN,
-    '01': schemes.SGTIN,
-}
+barcode_encoding_map = SchemeMap({
+    '8003': 'GRAI',
+    '8004': 'GIAI',
+    '8018': 'GSRN',
+    '414': 'SGLN',
+    '253': 'GDTI',
+    '01': 'SGTIN',
+    '00': 'SSCC',
+})
 
 
 def get_barcode_header(barcode_string):
-    if barcode_string[:2] == '01':
+    if barcode_string[:2] in ('00', '01'):
         return barcode_string[:2]
-    if barcode_string[:3] == '414':
+    if barcode_string[:3] in ('253', '414'):
         return barcode_string[:3]
     return barcode_string[:4]
 
@@ -23,8 +26,9 @@ def decode_barcode(barcode_string, company_prefix_length):
     :param barcode_string: Barcode data
     :type barcode_string: str
 
-    :param company_prefix_length: Number of digits in the company prefix
-    :type company_prefix_length: int
+    :param company_prefix_length: Number of digits in the company prefix, or a resolver
+        returning it, such as :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+    :type company_prefix_length: int, callable
 
     :raises NotImplementedError: Unable to determine tag encoding.
     :raises NotImplementedError: Scheme not implemented for barcode.
@@ -0,0 +1,347 @@
+"""
+Compact framed binary format for batches of encoded tags.
+
+A frame holds one batch. Its header is followed by the EPC headers of the schemes in the
+batch, then the records::
+
+    magic      4 bytes   b'EPCB'
+    version    1 byte    BATCH_VERSION
+    flags      1 byte    FLAG_DELTA for delta records
+    size       2 bytes   bytes per packed record, or of the first delta record
+    count      4 bytes   number of records
+    length     4 bytes   bytes of records
+    schemes    1 byte    number of EPC headers, followed by the headers
+
+Integers are little endian. Packed records are the encoded tags, big endian and padded with
+zeros to the size of the largest tag in the batch: 12 bytes per SGTIN-96, where a JSON array
+of hex strings takes 27. Delta records are for ascending batches of tags of one size, such
+as serial number runs of one GTIN: the first tag is packed, each following one is the unsigned
+LEB128 varint of its difference to the previous one.
+
+Tags are read back as integers or hex strings that decode with
+:func:`epc.utils.decode_epc` to the tags written::
+
+    with open('reads.epcb', 'wb') as f:
+        with BatchWriter(f) as writer:
+            writer.write_many(hex_strings)
+
+    with open('reads.epcb', 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        for batch in iter_batches(m):
+            tags = [decode_epc(value) for value in batch]
+"""
+import struct
+
+from epc.schemes.base import EpcScheme
+from epc.utils import epc_encoding_map, get_epc_header
+
+BATCH_MAGIC = b'EPCB'
+BATCH_VERSION = 1
+
+FLAG_DELTA = 0x01
+
+_HEADER = struct.Struct('<4sBBHII')
+
+_sizes = {}
+
+
+def _tag_size(header):
+    # Tag size in bytes of an EPC header.
+    size = _sizes.get(header)
+    if size is None:
+        try:
+            cls = epc_encoding_map[header]
+        except KeyError:
+            raise NotImplementedError('Unknown encoding')
+        size = _sizes[header] = cls.TAG_SIZES[cls.HEADERS.index(header)] // 8
+    return size
+
+
+def _value(tag):
+    if isinstance(tag, EpcScheme):
+        return int(tag)
+    if isinstance(tag, str):
+        return int(tag, 16)
+    return tag
+
+
+def _write_varint(output, value):
+    while value > 0x7f:
+        output.append(value & 0x7f | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def encode_batch(tags, delta=False):
+    """
+    Encode a batch of tags to a frame.
+
+    :param tags: Tag objects, hex strings or integers.
+    :type tags: iterable
+
+    :param delta: Write delta records. Defaults to ``False``.
+    :type delta: bool, optional
+
+    :raises ValueError: Invalid hex string, or tags of a delta batch out of order or of
+        different sizes.
+    :raises NotImplementedError: Scheme not implemented for a tag.
+
+    :rtype: bytes
+    """
+    values = [_value(tag) for tag in tags]
+    headers = sorted(set(get_epc_header(value) for value in values))
+    sizes = [_tag_size(header) for header in headers]
+    size = max(sizes) if sizes else 0
+
+    if delta and values:
+        if len(set(sizes)) > 1:
+            raise ValueError('Tags of a delta batch must all have the same size')
+
+        records = bytearray(values[0].to_bytes(size, 'big'))
+        previous = values[0]
+        for value in values[1:]:
+            if value < previous:
+                raise ValueError('Tags of a delta batch must be in ascending order')
+            _write_varint(records, value - previous)
+            previous = value
+    elif len(sizes) == 1:
+        records = b''.join([value.to_bytes(size, 'big') for value in values])
+    else:
+        # Large tags are left aligned in their records, padded at the end.
+        records = b''.join([
+            (value << (size - _sizes[get_epc_header(value)]) * 8).to_bytes(size, 'big')
+            for value in values
+        ])
+
+    return b''.join((
+        _HEADER.pack(BATCH_MAGIC, BATCH_VERSION, FLAG_DELTA if delta else 0, size, len(values),
+                     len(records)),
+        bytes([len(headers)] + headers),
+        records,
+    ))
+
+
+class BatchReader:
+    """
+    Reader of one frame, in place over a buffer such as ``bytes`` or :class:`mmap.mmap`.
+    Iterating yields the tags as integers. Packed records can also be read by index.
+
+    :param buffer: Buffer holding the frame.
+    :type buffer: bytes, bytearray, memoryview, mmap.mmap
+
+    :param offset: Offset of the frame in the buffer. Defaults to ``0``.
+    :type offset: int, optional
+
+    :raises ValueError: Invalid or truncated frame.
+    """
+
+    def __init__(self, buffer, offset=0):
+        self.buffer = memoryview(buffer)
+
+        if len(self.buffer) < offset + _HEADER.size + 1:
+            raise ValueError('Truncated batch header')
+
+        magic, version, self.flags, self.record_size, self.count, length = \
+            _HEADER.unpack_from(self.buffer, offset)
+        if magic != BATCH_MAGIC:
+            raise ValueError('Invalid batch magic')
+        if version != BATCH_VERSION:
+            raise ValueError('Unsupported batch version %d' % version)
+
+        scheme_count = self.buffer[offset + _HEADER.size]
+        schemes_start = offset + _HEADER.size + 1
+        self.headers = tuple(self.buffer[schemes_start:schemes_start + scheme_count])
+
+        self._start = schemes_start + scheme_count
+        self._end = self._start + length
+        if len(self.buffer) < self._end:
+            raise ValueError('Truncated batch records')
+
+        #: Bytes of the frame, the next frame of a stream starts at ``offset + size``.
+        self.size = self._end - offset
+
+        self.delta = bool(self.flags & FLAG_DELTA)
+        if not self.delta and length != self.count * self.record_size:
+            raise ValueError('Invalid batch length')
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if self.delta:
+            raise TypeError('Delta records can only be read in order')
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError('Record index out of range')
+
+        start = self._start + index * self.record_size
+        value = int.from_bytes(self.buffer[start:start + self.record_size], 'big')
+        if len(self.headers) > 1:
+            value >>= (self.record_size - _tag_size(value >> self.record_size * 8 - 8)) * 8
+        return value
+
+    def __iter__(self):
+        buffer = self.buffer
+        size = self.record_size
+        start = self._start
+
+        if self.delta:
+            if not self.count:
+                return
+            value = int.from_bytes(buffer[start:start + size], 'big')
+            yield value
+
+            position = start + size
+            for _ in range(self.count - 1):
+                delta = shift = 0
+                while True:
+                    byte = buffer[position]
+                    position += 1
+                    delta |= (byte & 0x7f) << shift
+                    if byte < 0x80:
+                        break
+                    shift += 7
+                value += delta
+                yield value
+        elif len(self.headers) > 1:
+            sizes = {header: size - _tag_size(header) for header in self.headers}
+            for position in range(start, self._end, size):
+                padding = sizes[buffer[position]]
+                yield int.from_bytes(buffer[position:position + size - padding], 'big')
+        else:
+            for position in range(start, self._end, size):
+                yield int.from_bytes(buffer[position:position + size], 'big')
+
+    def hex_strings(self):
+        """
+        :return: The tags as hex strings.
+        :rtype: list
+        """
+        if not self.delta and len(self.headers) == 1:
+            data = self.buffer[self._start:self._end].hex()
+            width = self.record_size * 2
+            return [data[i:i + width] for i in range(0, len(data), width)]
+
+        return [
+            '{:0{}x}'.format(value, _tag_size(get_epc_header(value)) * 2) for value in self
+        ]
+
+
+def iter_batches(buffer):
+    """
+    Read the frames of a buffer in place, such as a memory mapped file of frames.
+
+    :param buffer: Buffer holding frames back to back.
+    :type buffer: bytes, bytearray, memoryview, mmap.mmap
+
+    :raises ValueError: Invalid or truncated frame.
+
+    :return: Iterator of :class:`BatchReader`.
+    :rtype: iterator
+    """
+    offset = 0
+    length = len(buffer)
+    while offset < length:
+        batch = BatchReader(buffer, offset)
+        offset += batch.size
+        yield batch
+
+
+def _read(stream, size):
+    # Sockets, pipes and raw files can return fewer bytes than asked for before the end.
+    data = stream.read(size)
+    while data and len(data) < size:
+        more = stream.read(size - len(data))
+        if not more:
+            break
+        data += more
+    return data
+
+
+def read_batches(stream):
+    """
+    Read frames from a binary stream, such as a file or socket file, one frame at a time.
+
+    :param stream: Binary stream.
+    :type stream: io.RawIOBase, io.BufferedIOBase
+
+    :raises ValueError: Invalid or truncated frame.
+
+    :return: Iterator of :class:`BatchReader`.
+    :rtype: iterator
+    """
+    while True:
+        header = _read(stream, _HEADER.size + 1)
+        if not header:
+            return
+        if len(header) < _HEADER.size + 1:
+            raise ValueError('Truncated batch header')
+
+        length = _HEADER.unpack_from(header)[5]
+        rest = _read(stream, header[-1] + length)
+        yield BatchReader(header + rest)
+
+
+class BatchWriter:
+    """
+    Write tags to a binary stream as frames of up to ``batch_size`` tags. Call :meth:`close`,
+    or use the writer as a context manager, to write the last frame.
+
+    :param stream: Binary stream.
+    :type stream: io.RawIOBase, io.BufferedIOBase
+
+    :param batch_size: Maximum tags per frame. Defaults to ``4096``.
+    :type batch_size: int, optional
+
+    :param delta: Write delta records, see :func:`encode_batch`. Defaults to ``False``.
+    :type delta: bool, optional
+    """
+
+    def __init__(self, stream, batch_size=4096, delta=False):
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
+
+        self.stream = stream
+        self.batch_size = batch_size
+        self.delta = delta
+
+        self._tags = []
+
+    def write(self, tag):
+        """
+        Add a tag, writing a frame when the batch is full.
+
+        :param tag: Tag object, hex string or integer.
+        :type tag: :class:`epc.schemes.base.EpcScheme`, str, int
+        """
+        self._tags.append(tag)
+        if len(self._tags) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, tags):
+        """
+        Add tags, writing frames as batches fill.
+
+        :param tags: Tag objects, hex strings or integers.
+        :type tags: iterable
+        """
+        for tag in tags:
+            self.write(tag)
+
+    def flush(self):
+        """
+        Write the pending tags as a frame, if there are any.
+        """
+        if self._tags:
+            tags, self._tags = self._tags, []
+            self.stream.write(encode_batch(tags, self.delta))
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
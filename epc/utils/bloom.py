@@ -0,0 +1,324 @@
+"""
+Bloom filter of commissioned tags, to check reads against billions of commissioned tags
+without a database round trip per read.
+
+Tags are matched by their encoded integer value, so a read only matches a commissioned tag
+with the same filter and size. Runs of serial numbers are added as integer ranges, hashed a
+chunk at a time without creating a tag or string per serial number::
+
+    commissioned = TagFilter(capacity=2000000000, error_rate=0.0001)
+    commissioned.add_serials(SGTIN().company_prefix('0614141').item_reference(812345).filter(
+        1).tag_size(96), 1, 1000000000)
+    commissioned.save('commissioned.epcf')
+
+    commissioned = TagFilter.open('commissioned.epcf')
+    known = commissioned.contains_many(hex_strings)
+
+A filter never reports a commissioned tag as unknown, and reports a tag that wasn't
+commissioned as known with a probability of about ``error_rate`` once ``capacity`` tags are
+added. Saved filters are opened with :class:`numpy.memmap`, pages are read as queries touch
+them. Filters are opened read-only, unless opened copy on write to add tags and save them.
+
+Requires NumPy (``pip install epc-encoding-utils[numpy]``).
+"""
+import copy
+import math
+import struct
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from epc.schemes.base import EpcScheme
+from epc.utils.files import replace_file
+
+FILTER_MAGIC = b'EPCF'
+FILTER_VERSION = 1
+
+# Magic, version, hashes, reserved, bits, tags added, error rate
+_HEADER = struct.Struct('<4sBBHQQd')
+
+_UINT64_MASK = (1 << 64) - 1
+
+# Values hashed at a time when adding ranges.
+_CHUNK_SIZE = 1 << 20
+
+
+def _require_numpy():
+    if numpy is None:
+        raise ImportError('NumPy is required to use epc.utils.bloom')
+
+
+def _mix(x):
+    # SplitMix64 finalizer of a uint64 array, multiplications wrap around.
+    x = (x ^ (x >> numpy.uint64(30))) * numpy.uint64(0xbf58476d1ce4e5b9)
+    x = (x ^ (x >> numpy.uint64(27))) * numpy.uint64(0x94d049bb133111eb)
+    return x ^ (x >> numpy.uint64(31))
+
+
+def _fold(value):
+    # Bits of a value above the low 64, folded to 64 bits.
+    high = value >> 64
+    folded = 0
+    while high:
+        folded ^= high & _UINT64_MASK
+        high >>= 64
+    return folded
+
+
+def _value(tag):
+    if isinstance(tag, EpcScheme):
+        return int(tag)
+    if isinstance(tag, str):
+        tag = int(tag, 16)
+    if tag < 0:
+        raise ValueError('Tag values must not be negative')
+    return tag
+
+
+class TagFilter:
+    """
+    Bloom filter of tag values, sized for ``capacity`` tags at ``error_rate`` false positives.
+
+    :param capacity: Number of tags the filter is sized for.
+    :type capacity: int
+
+    :param error_rate: False positive rate at ``capacity`` tags. Defaults to ``0.001``.
+    :type error_rate: float, optional
+
+    :raises ValueError: Capacity not positive, or error rate not between 0 and 1.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        _require_numpy()
+
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate must be between 0 and 1')
+
+        # Optimal bits and hashes, bits rounded up to whole 64 bit words.
+        bits = int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        bits = max(64, -(-bits // 64) * 64)
+
+        self.error_rate = error_rate
+        self.bits = bits
+        self.hashes = max(1, int(round(bits / capacity * math.log(2))))
+        #: Number of tags added, counting tags added more than once.
+        self.count = 0
+
+        self._data = numpy.zeros(bits // 8, dtype=numpy.uint8)
+
+    @classmethod
+    def open(cls, path, mode='r'):
+        """
+        Open a saved filter, memory mapped.
+
+        :param path: Path of the filter file.
+        :type path: str
+
+        :param mode: ``'r'`` to open the filter read-only, or ``'c'`` (copy on write) to add
+            tags in memory, kept by saving the filter. Defaults to ``'r'``.
+        :type mode: str, optional
+
+        :raises ValueError: Not a filter file, an unsupported version, or an invalid mode.
+
+        :rtype: :class:`TagFilter`
+        """
+        _require_numpy()
+
+        if mode not in ('r', 'c'):
+            raise ValueError("mode must be 'r' or 'c'")
+
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError('Truncated filter header')
+
+        magic, version, hashes, _, bits, count, error_rate = _HEADER.unpack(header)
+        if magic != FILTER_MAGIC:
+            raise ValueError('Invalid filter magic')
+        if version != FILTER_VERSION:
+            raise ValueError('Unsupported filter version %d' % version)
+
+        tag_filter = cls.__new__(cls)
+        tag_filter.error_rate = error_rate
+        tag_filter.bits = bits
+        tag_filter.hashes = hashes
+        tag_filter.count = count
+        tag_filter._data = numpy.memmap(
+            path, dtype=numpy.uint8, mode=mode, offset=_HEADER.size, shape=(bits // 8,)
+        )
+        return tag_filter
+
+    def save(self, path):
+        """
+        Save the filter to a file, replacing it atomically.
+
+        :param path: Path of the filter file.
+        :type path: str
+        """
+        # Each save writes its own temporary file, so filters saved at once replace each
+        # other whole.
+        with replace_file(path) as f:
+            f.write(_HEADER.pack(FILTER_MAGIC, FILTER_VERSION, self.hashes, 0, self.bits,
+                                 self.count, self.error_rate))
+            numpy.asarray(self._data).tofile(f)
+
+    def __len__(self):
+        return self.count
+
+    def _positions(self, lows, highs):
+        # Bit positions of the values with double hashing, one array per hash.
+        first = _mix(lows ^ _mix(highs))
+        second = _mix(first ^ numpy.uint64(0x9e3779b97f4a7c15)) | numpy.uint64(1)
+        bits = numpy.uint64(self.bits)
+
+        for _ in range(self.hashes):
+            yield first % bits
+            first = first + second
+
+    def _add(self, lows, highs):
+        data = self._data
+        if not data.flags.writeable:
+            raise ValueError("Filter is opened read-only, open it with mode 'c' to add tags")
+
+        for positions in self._positions(lows, highs):
+            numpy.bitwise_or.at(
+                data, positions >> numpy.uint64(3),
+                numpy.left_shift(numpy.uint8(1), (positions & numpy.uint64(7)).astype(numpy.uint8))
+            )
+        self.count += len(lows)
+
+    def _arrays(self, tags):
+        values = [_value(tag) for tag in tags]
+        lows = numpy.array([value & _UINT64_MASK for value in values], dtype=numpy.uint64)
+        highs = numpy.array([_fold(value) for value in values], dtype=numpy.uint64)
+        return lows, highs
+
+    def add(self, tag):
+        """
+        Add a tag.
+
+        :param tag: Tag object, hex string or integer.
+        :type tag: :class:`epc.schemes.base.EpcScheme`, str, int
+
+        :raises ValueError: Negative tag value, or the filter is opened read-only.
+        """
+        self.add_many((tag,))
+
+    def add_many(self, tags):
+        """
+        Add tags.
+
+        :param tags: Tag objects, hex strings or integers.
+        :type tags: iterable
+
+        :raises ValueError: Negative tag value, or the filter is opened read-only.
+        """
+        lows, highs = self._arrays(tags)
+        if len(lows):
+            self._add(lows, highs)
+
+    def add_range(self, first, last, step=1):
+        """
+        Add the tag values from ``first`` to ``last`` inclusive, ``step`` apart.
+
+        :param first: First tag value.
+        :type first: int
+
+        :param last: Last tag value.
+        :type last: int
+
+        :param step: Difference between values. Defaults to ``1``.
+        :type step: int, optional
+
+        :raises ValueError: Range is empty or negative, or the step isn't a positive 64 bit
+            number, or the filter is opened read-only.
+        """
+        if not 0 < step <= _UINT64_MASK:
+            raise ValueError('step must be a positive 64 bit number')
+        if last < first:
+            raise ValueError('last must not be less than first')
+        if first < 0:
+            raise ValueError('Tag values must not be negative')
+
+        value = first
+        remaining = (last - first) // step + 1
+        offsets = numpy.arange(min(remaining, _CHUNK_SIZE), dtype=numpy.uint64)
+        offsets *= numpy.uint64(step)
+
+        while remaining:
+            # Hash a chunk of values whose bits above the low 64 are the same.
+            low = value & _UINT64_MASK
+            size = min(remaining, _CHUNK_SIZE, (_UINT64_MASK - low) // step + 1)
+
+            lows = offsets[:size] + numpy.uint64(low)
+            self._add(lows, numpy.full(size, _fold(value), dtype=numpy.uint64))
+
+            value += size * step
+            remaining -= size
+
+    def add_serials(self, tag, first, last):
+        """
+        Add the tags of a run of numeric serial numbers, the tag with each serial number from
+        ``first`` to ``last`` inclusive. Tags are added as a range of values, which requires
+        the serial number to be an integer field of the encoding. The tag isn't changed.
+
+        :param tag: Tag with every component but the serial number set.
+        :type tag: :class:`epc.schemes.base.EpcScheme`
+
+        :param first: First serial number.
+        :type first: int
+
+        :param last: Last serial number.
+        :type last: int
+
+        :raises ValueError: Serial numbers aren't an integer field of the tag's encoding, or
+            the filter is opened read-only.
+        :raises AttributeError: If any components of the tag are missing, or a serial number
+            is out of range.
+        """
+        # Set serial numbers on a copy, so the tag is left as it was.
+        serial_setter = getattr(copy.copy(tag), tag._identity_fields[2][1])
+
+        start = int(serial_setter(first))
+        if last == first:
+            self.add_range(start, start)
+            return
+
+        step = int(serial_setter(first + 1)) - start
+        end = int(serial_setter(last))
+        if not 0 < step <= _UINT64_MASK or end - start != (last - first) * step:
+            raise ValueError('Serial numbers of %s tags are not an integer field' % tag.encoding)
+
+        self.add_range(start, end, step)
+
+    def __contains__(self, tag):
+        return bool(self.contains_many((tag,))[0])
+
+    def contains_many(self, tags):
+        """
+        Check whether tags were added, in one batch.
+
+        :param tags: Tag objects, hex strings or integers.
+        :type tags: iterable
+
+        :raises ValueError: Negative tag value.
+
+        :return: Boolean array, ``True`` for tags that were probably added and ``False`` for
+            tags that certainly weren't.
+        :rtype: numpy.ndarray
+        """
+        lows, highs = self._arrays(tags)
+        found = numpy.ones(len(lows), dtype=bool)
+        data = self._data
+
+        for positions in self._positions(lows, highs):
+            found &= numpy.right_shift(
+                data[positions >> numpy.uint64(3)], (positions & numpy.uint64(7)).astype(
+                    numpy.uint8)
+            ) & numpy.uint8(1) == 1
+
+        return found
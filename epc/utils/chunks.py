@@ -0,0 +1,334 @@
+"""
+Split large newline delimited reader logs into byte ranges that worker processes decode
+independently, each reading only its own part of the file::
+
+    def decode_range(chunk):
+        return [decode_epc(line) for line in iter_lines('reads.txt', chunk.start, chunk.end)]
+
+    with multiprocessing.Pool(8) as pool:
+        for tags in pool.imap(decode_range, plan_chunks('reads.txt', chunks=8)):
+            ...
+
+Ranges start at the start of a line and end after a newline (or at the end of the file), so
+every line is in exactly one range. Split points are found in a memory map of the file,
+reading only the bytes around them. Files are split at ``\n`` only, so a file with only
+``\r`` line endings is a single range.
+
+A :class:`LineIndex` is a sparse index of line offsets, saved next to the file, which gives
+random access to the Nth line and the line number each range starts at.
+"""
+import bisect
+import marshal
+import mmap
+import os
+from collections import namedtuple
+
+from epc.utils.files import replace_file
+
+INDEX_VERSION = 1
+
+#: Byte range of a file, ``first_line`` is the number of its first line, if known.
+Chunk = namedtuple('Chunk', ('start', 'end', 'first_line'))
+
+# Bytes read at a time when building an index.
+_BLOCK_SIZE = 1 << 24
+
+
+def _line_start(data, offset):
+    # Offset of the first line starting at or after the offset.
+    if offset <= 0:
+        return 0
+
+    newline = data.find(b'\n', offset - 1)
+    return len(data) if newline == -1 else newline + 1
+
+
+def plan_chunks(path, chunks=None, chunk_bytes=None, index=None):
+    """
+    Split a file into newline aligned byte ranges of about the same size.
+
+    :param path: Path of the file.
+    :type path: str
+
+    :param chunks: Number of ranges. Files with fewer lines give fewer ranges.
+    :type chunks: int, optional
+
+    :param chunk_bytes: Size of each range instead, in bytes.
+    :type chunk_bytes: int, optional
+
+    :param index: Index of the file, to set the ranges' ``first_line``.
+    :type index: :class:`LineIndex`, optional
+
+    :raises ValueError: Neither or both of ``chunks`` and ``chunk_bytes`` given, or not
+        positive.
+
+    :return: List of :data:`Chunk`, in file order.
+    :rtype: list
+    """
+    if (chunks is None) == (chunk_bytes is None):
+        raise ValueError('Either chunks or chunk_bytes is required')
+    if (chunk_bytes if chunks is None else chunks) < 1:
+        raise ValueError('Number and size of chunks must be positive')
+
+    size = os.path.getsize(path)
+    if not size:
+        return []
+
+    if chunks is None:
+        chunks = -(-size // chunk_bytes)
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        bounds = [0]
+        for i in range(1, chunks):
+            start = _line_start(data, size * i // chunks)
+            if bounds[-1] < start < size:
+                bounds.append(start)
+        bounds.append(size)
+
+    return [
+        Chunk(start, end, index.line_number(start) if index is not None else None)
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def iter_lines(path, start=0, end=None):
+    """
+    Read the lines of a byte range of a file, such as a range of :func:`plan_chunks`. Lines
+    end at ``\n``, ``\r\n`` or ``\r``, as when reading the file in text mode with universal
+    newlines. Lines are stripped, and blank lines are skipped.
+
+    :param path: Path of the file.
+    :type path: str
+
+    :param start: Offset of the first line. Defaults to ``0``.
+    :type start: int, optional
+
+    :param end: Offset after the last line. Defaults to the end of the file.
+    :type end: int, optional
+
+    :return: Iterator of lines.
+    :rtype: iterator
+    """
+    with open(path, 'rb', buffering=1 << 20) as f:
+        f.seek(start)
+        position = start
+
+        for line in f:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+
+            # Carriage returns end lines too, the same as universal newlines.
+            for part in line.decode('utf-8').split('\r'):
+                part = part.strip()
+                if part:
+                    yield part
+
+
+class LineIndex:
+    """
+    Sparse index of the line offsets of a file. The index marks the start of a line about
+    every ``interval`` bytes with its line number, lines between marks are found by reading
+    from the mark before them. Lines are numbered from ``0``, counting blank lines, and end at
+    ``\n`` only.
+
+    Use :meth:`from_file` to build an index, or load it from where it was saved.
+
+    :param path: Path of the file.
+    :type path: str
+
+    :param lines: Number of the line at each mark.
+    :type lines: list
+
+    :param offsets: Offset of each mark.
+    :type offsets: list
+
+    :param line_count: Number of lines in the file.
+    :type line_count: int
+    """
+
+    def __init__(self, path, lines, offsets, line_count):
+        self.path = path
+        self.line_count = line_count
+
+        self._lines = lines
+        self._offsets = offsets
+        self._file = None
+        self._data = None
+
+    @classmethod
+    def build(cls, path, interval=1 << 16):
+        """
+        Index a file, in one pass over it.
+
+        :param path: Path of the file.
+        :type path: str
+
+        :param interval: Bytes between marks. Defaults to ``65536``.
+        :type interval: int, optional
+
+        :rtype: :class:`LineIndex`
+        """
+        lines = [0]
+        offsets = [0]
+        line = 0
+        size = os.path.getsize(path)
+
+        if not size:
+            return cls(path, lines, offsets, 0)
+
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Count the newlines before each mark, reading at most _BLOCK_SIZE bytes at a time.
+            position = 0
+            while True:
+                mark = _line_start(data, position + interval)
+                if mark >= size:
+                    break
+
+                for block in range(position, mark, _BLOCK_SIZE):
+                    line += data[block:min(block + _BLOCK_SIZE, mark)].count(b'\n')
+                position = mark
+
+                lines.append(line)
+                offsets.append(mark)
+
+            for block in range(position, size, _BLOCK_SIZE):
+                line += data[block:min(block + _BLOCK_SIZE, size)].count(b'\n')
+
+            # A last line without a newline is a line too.
+            if data[size - 1:size] != b'\n':
+                line += 1
+
+        return cls(path, lines, offsets, line)
+
+    @classmethod
+    def from_file(cls, path, index_path=None, interval=1 << 16):
+        """
+        Load the saved index of a file, or build and save it if the file has changed since
+        (or the index doesn't exist).
+
+        :param path: Path of the file.
+        :type path: str
+
+        :param index_path: Path of the saved index. Defaults to ``path`` + ``.idx``. Pass
+            ``False`` to build the index without saving it. The index is built without saving
+            it if it can't be written.
+        :type index_path: str, optional
+
+        :param interval: Bytes between marks of a new index. Defaults to ``65536``.
+        :type interval: int, optional
+
+        :rtype: :class:`LineIndex`
+        """
+        if index_path is None:
+            index_path = path + '.idx'
+
+        stat = os.stat(path)
+        source = (stat.st_mtime_ns, stat.st_size)
+
+        if index_path:
+            try:
+                with open(index_path, 'rb') as index_file:
+                    version, cached_source, lines, offsets, line_count = marshal.load(index_file)
+                if version == INDEX_VERSION and tuple(cached_source) == source:
+                    return cls(path, lines, offsets, line_count)
+            except (OSError, EOFError, ValueError, TypeError):
+                # Missing or unreadable index, rebuild it.
+                pass
+
+        index = cls.build(path, interval)
+
+        if index_path:
+            # Saving is best effort, eg. in a read-only directory. Each process (such as
+            # workers indexing the same file) writes its own temporary file, and the index is
+            # replaced whole.
+            try:
+                with replace_file(index_path) as index_file:
+                    marshal.dump(
+                        (INDEX_VERSION, source, index._lines, index._offsets, index.line_count),
+                        index_file
+                    )
+            except OSError:
+                pass
+
+        return index
+
+    def _map(self):
+        if self._data is None:
+            self._file = open(self.path, 'rb')
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._data
+
+    def close(self):
+        """
+        Close the memory map of the file, if it's open.
+        """
+        if self._data is not None:
+            self._data.close()
+            self._file.close()
+            self._data = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.line_count
+
+    def offset(self, line):
+        """
+        Offset of a line.
+
+        :param line: Line number, negative numbers count from the end.
+        :type line: int
+
+        :raises IndexError: Line number out of range.
+
+        :rtype: int
+        """
+        if line < 0:
+            line += self.line_count
+        if not 0 <= line < self.line_count:
+            raise IndexError('Line number out of range')
+
+        mark = bisect.bisect_right(self._lines, line) - 1
+        offset = self._offsets[mark]
+        data = self._map()
+
+        for _ in range(line - self._lines[mark]):
+            offset = data.find(b'\n', offset) + 1
+
+        return offset
+
+    def line_number(self, offset):
+        """
+        Number of the line an offset is in.
+
+        :param offset: Offset in the file.
+        :type offset: int
+
+        :rtype: int
+        """
+        mark = bisect.bisect_right(self._offsets, offset) - 1
+        return self._lines[mark] + self._map()[self._offsets[mark]:offset].count(b'\n')
+
+    def __getitem__(self, line):
+        """
+        Read a line, without its line ending.
+
+        :param line: Line number, negative numbers count from the end.
+        :type line: int
+
+        :raises IndexError: Line number out of range.
+
+        :rtype: str
+        """
+        offset = self.offset(line)
+        data = self._map()
+
+        end = data.find(b'\n', offset)
+        if end == -1:
+            end = len(data)
+        return data[offset:end].rstrip(b'\r').decode('utf-8')
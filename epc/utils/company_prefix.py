@@ -0,0 +1,147 @@
+"""
+Resolve GS1 Company Prefix lengths from GS1's prefix format list.
+
+GS1 publishes the length of every allocated Company Prefix as the "GCP Length Prefix Format
+List", available as XML (``gcpprefixformatlist.xml``) or as a CSV export. A
+:class:`CompanyPrefixResolver` loaded from either file can be passed anywhere a
+``company_prefix_length`` is accepted, such as :func:`epc.utils.barcode.decode_barcode`.
+"""
+import csv
+import marshal
+import os
+from xml.etree import ElementTree
+
+from epc.utils.files import replace_file
+
+CACHE_VERSION = 1
+
+
+class CompanyPrefixResolver:
+    """
+    Longest-prefix lookup of GS1 Company Prefix lengths.
+
+    Prefixes are kept in a single dictionary, and each lookup probes at most one key per
+    distinct prefix length, so the cost is bounded by the number of digits in the key.
+
+    :param prefixes: Mapping of numeric prefix strings to Company Prefix lengths.
+    :type prefixes: dict
+    """
+
+    def __init__(self, prefixes):
+        self._prefixes = dict(prefixes)
+        self._lengths = sorted({len(prefix) for prefix in self._prefixes}, reverse=True)
+
+    def __call__(self, digits):
+        return self.lookup(digits)
+
+    def __len__(self):
+        return len(self._prefixes)
+
+    def lookup(self, digits):
+        """
+        Find the Company Prefix length for a GS1 key.
+
+        :param digits: GS1 key digits, starting at the first digit of the Company Prefix
+            (after any indicator or extension digit).
+        :type digits: str
+
+        :return: Company Prefix length, or ``None`` if no prefix matches, or the matching
+            prefix is not allocated.
+        :rtype: int
+        """
+        prefixes = self._prefixes
+
+        for length in self._lengths:
+            company_prefix_length = prefixes.get(digits[:length])
+            if company_prefix_length is not None:
+                return company_prefix_length or None
+
+        return None
+
+    @classmethod
+    def from_xml(cls, path):
+        """
+        Load GS1's ``gcpprefixformatlist.xml``.
+
+        :param path: Path to the XML file.
+        :type path: str
+
+        :rtype: :class:`CompanyPrefixResolver`
+        """
+        prefixes = {}
+
+        for _, element in ElementTree.iterparse(path):
+            if element.tag.rpartition('}')[2] == 'entry':
+                prefixes[element.get('prefix')] = int(element.get('gcpLength'))
+            element.clear()
+
+        return cls(prefixes)
+
+    @classmethod
+    def from_csv(cls, path):
+        """
+        Load a two column CSV of prefixes and Company Prefix lengths. A header row is skipped.
+
+        :param path: Path to the CSV file.
+        :type path: str
+
+        :rtype: :class:`CompanyPrefixResolver`
+        """
+        prefixes = {}
+
+        with open(path, newline='') as csv_file:
+            for row in csv.reader(csv_file):
+                if len(row) < 2 or not row[0].strip().isdigit():
+                    continue
+                prefixes[row[0].strip()] = int(row[1])
+
+        return cls(prefixes)
+
+    @classmethod
+    def from_file(cls, path, cache_path=None):
+        """
+        Load a prefix format list from an XML or CSV file, using a compiled cache when the
+        source file hasn't changed since the cache was written.
+
+        :param path: Path to the XML or CSV file.
+        :type path: str
+
+        :param cache_path: Path of the compiled cache. Defaults to ``path`` + ``.cache``. Pass
+            ``False`` to disable caching. The file is loaded without caching if the cache
+            can't be written.
+        :type cache_path: str, optional
+
+        :rtype: :class:`CompanyPrefixResolver`
+        """
+        if cache_path is None:
+            cache_path = path + '.cache'
+
+        stat = os.stat(path)
+        source = (stat.st_mtime_ns, stat.st_size)
+
+        if cache_path:
+            try:
+                with open(cache_path, 'rb') as cache_file:
+                    version, cached_source, prefixes = marshal.load(cache_file)
+                if version == CACHE_VERSION and tuple(cached_source) == source:
+                    return cls(prefixes)
+            except (OSError, EOFError, ValueError, TypeError):
+                # Missing or unreadable cache, rebuild it.
+                pass
+
+        if path.lower().endswith('.xml'):
+            resolver = cls.from_xml(path)
+        else:
+            resolver = cls.from_csv(path)
+
+        if cache_path:
+            # Caching is best effort, the prefixes are loaded without it (eg. in a read-only
+            # directory). Each process writes its own temporary file, and the cache is replaced
+            # whole.
+            try:
+                with replace_file(cache_path) as cache_file:
+                    marshal.dump((CACHE_VERSION, source, resolver._prefixes), cache_file)
+            except OSError:
+                pass
+
+        return resolver
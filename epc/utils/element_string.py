@@ -0,0 +1,232 @@
+"""
+Parse GS1 element strings, the full payload of a GS1-128, DataMatrix or QR barcode.
+
+Element strings are a sequence of Application Identifiers (AIs) followed by their data. They
+are accepted in any of the forms produced by scanners or printed on labels:
+
+* raw, with variable length fields terminated by a FNC1 (``<GS>``, ``\\x1d``) separator:
+  ``0100614141123452\\x1d21400``
+* prefixed by a symbology identifier such as ``]C1``, ``]d2`` or ``]Q3``
+* human readable, with parenthesized AIs: ``(01) 00614141123452 (21) 400``
+"""
+import re
+
+from epc import schemes
+
+GROUP_SEPARATOR = '\x1d'
+
+_ai_table = {
+    # Application Identifier: (Fixed Data Length, Maximum Data Length)
+    '00': (18, 18),
+    '01': (14, 14),
+    '02': (14, 14),
+    '10': (None, 20),
+    '11': (6, 6),
+    '12': (6, 6),
+    '13': (6, 6),
+    '15': (6, 6),
+    '16': (6, 6),
+    '17': (6, 6),
+    '20': (2, 2),
+    '21': (None, 20),
+    '22': (None, 20),
+    '240': (None, 30),
+    '241': (None, 30),
+    '250': (None, 30),
+    '251': (None, 30),
+    '253': (None, 30),
+    '254': (None, 20),
+    '255': (None, 25),
+    '30': (None, 8),
+    '37': (None, 8),
+    '400': (None, 30),
+    '401': (None, 30),
+    '402': (17, 17),
+    '403': (None, 30),
+    '410': (13, 13),
+    '411': (13, 13),
+    '412': (13, 13),
+    '413': (13, 13),
+    '414': (13, 13),
+    '415': (13, 13),
+    '416': (13, 13),
+    '417': (13, 13),
+    '420': (None, 20),
+    '421': (None, 12),
+    '422': (3, 3),
+    '8003': (None, 30),
+    '8004': (None, 30),
+    '8018': (18, 18),
+}
+_ai_table.update({'9%s' % i: (None, 90) for i in range(10)})
+
+# Trade measures (310n - 369n), where n is the implied decimal point position.
+_ai_table.update({
+    '{}{}'.format(family, decimals): (6, 6)
+    for family in range(310, 370) for decimals in range(10)
+})
+
+_ai_lengths = sorted({len(ai) for ai in _ai_table})
+
+_element_schemes = (
+    # Application Identifier of the GS1 key, Scheme
+    ('00', 'SSCC'),
+    ('01', 'SGTIN'),
+    ('414', 'SGLN'),
+    ('253', 'GDTI'),
+    ('8003', 'GRAI'),
+    ('8004', 'GIAI'),
+    ('8018', 'GSRN'),
+)
+
+# Parenthesized AI of a human readable element string.
+_humanized_ai = re.compile(r'\(([0-9]{2,4})\)')
+
+
+def parse_element_string(element_string):
+    """
+    Split an element string into its Application Identifiers and their data, in a single
+    pass over the input.
+
+    :param element_string: Barcode payload.
+    :type element_string: str
+
+    :raises ValueError: Unknown application identifier, or data length invalid.
+
+    :return: ``(application identifier, data)`` tuples, in barcode order.
+    :rtype: list
+    """
+    # Strip the symbology identifier, eg. ]C1 for GS1-128.
+    if element_string[:1] == ']':
+        element_string = element_string[3:]
+
+    if element_string[:1] == '(':
+        return _parse_humanized(element_string)
+
+    elements = []
+    position = 0
+    end = len(element_string)
+
+    while position < end:
+        if element_string[position] == GROUP_SEPARATOR:
+            position += 1
+            continue
+
+        for ai_length in _ai_lengths:
+            ai = element_string[position:position + ai_length]
+            if ai in _ai_table:
+                break
+        else:
+            raise ValueError('Unknown application identifier at `%s`' % element_string[position:])
+
+        fixed_length, max_length = _ai_table[ai]
+        position += ai_length
+
+        if fixed_length is not None:
+            data_end = position + fixed_length
+        else:
+            data_end = element_string.find(GROUP_SEPARATOR, position)
+            if data_end == -1:
+                data_end = end
+
+        data = element_string[position:data_end]
+        _check_length(ai, data, fixed_length, max_length)
+
+        elements.append((ai, data))
+        position = data_end
+
+    return elements
+
+
+def _parse_humanized(element_string):
+    # Parentheses are valid data characters, eg. of a serial number (21), so data only ends
+    # where a known AI is parenthesized.
+    matches = [
+        match for match in _humanized_ai.finditer(element_string) if match.group(1) in _ai_table
+    ]
+    if not matches or matches[0].start():
+        raise ValueError(
+            'Unknown application identifier `%s`' % element_string[1:].partition(')')[0]
+        )
+
+    elements = []
+    ends = [match.start() for match in matches[1:]] + [len(element_string)]
+
+    for match, end in zip(matches, ends):
+        ai = match.group(1)
+
+        # Humanized data is often grouped with spaces, which aren't valid GS1 characters.
+        data = element_string[match.end():end].replace(' ', '').rstrip(GROUP_SEPARATOR)
+        _check_length(ai, data, *_ai_table[ai])
+        elements.append((ai, data))
+
+    return elements
+
+
+def _check_length(ai, data, fixed_length, max_length):
+    if fixed_length is not None and len(data) != fixed_length:
+        raise ValueError('AI (%s) requires %s characters' % (ai, fixed_length))
+    if not data or len(data) > max_length:
+        raise ValueError('AI (%s) must have between 1 and %s characters' % (ai, max_length))
+
+
+def decode_element_string(element_string, company_prefix_length):
+    """
+    Decode an element string to an EPC tag. Returns a tag object if successful.
+
+    :param element_string: Barcode payload.
+    :type element_string: str
+
+    :param company_prefix_length: Number of digits in the company prefix, or a resolver
+        returning it, such as :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+    :type company_prefix_length: int, callable
+
+    :raises ValueError: Unable to parse the element string.
+    :raises ValueError: Serial number (21) missing for a GTIN.
+    :raises NotImplementedError: Scheme not implemented for the element string.
+
+    :returns: EPC tag object
+    :rtype: object
+    """
+    elements = dict(parse_element_string(element_string))
+
+    for ai, scheme in _element_schemes:
+        if ai in elements:
+            tag = getattr(schemes, scheme)()
+            tag._decode_elements(elements, company_prefix_length)
+            return tag
+
+    raise NotImplementedError(
+        'Scheme not implemented for %s' % ', '.join('(%s)' % ai for ai in elements)
+    )
+
+
+def decode_element_strings(element_strings, company_prefix_length, raise_exception=True):
+    """
+    Decode element strings in bulk, such as the lines of a scanner log. Surrounding
+    whitespace and blank lines are skipped.
+
+    :param element_strings: Barcode payloads.
+    :type element_strings: iterable
+
+    :param company_prefix_length: Number of digits in the company prefix, or a resolver
+        returning it.
+    :type company_prefix_length: int, callable
+
+    :param raise_exception: Raise on invalid element strings, otherwise yield ``None``.
+    :type raise_exception: bool, optional
+
+    :returns: Generator of EPC tag objects.
+    :rtype: generator
+    """
+    for element_string in element_strings:
+        element_string = element_string.strip(' \r\n')
+        if not element_string:
+            continue
+
+        try:
+            yield decode_element_string(element_string, company_prefix_length)
+        except (ValueError, AttributeError, NotImplementedError):
+            if raise_exception:
+                raise
+            yield None
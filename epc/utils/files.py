@@ -0,0 +1,56 @@
+"""
+Files replaced atomically, for caches, indexes and manifests that other processes may read
+while they're written::
+
+    with replace_file('manifest.json', 'w') as f:
+        json.dump(manifest, f)
+
+The contents are written to a temporary file of their own in the same directory, which
+replaces the file once it's complete, so readers see either the old file or the new one
+whole.
+"""
+import contextlib
+import os
+import tempfile
+
+
+def _umask():
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode of new files, the umask can only be read by setting it so it's read once.
+_FILE_MODE = 0o666 & ~_umask()
+
+
+@contextlib.contextmanager
+def replace_file(path, mode='wb'):
+    """
+    Open a temporary file next to ``path``, replacing ``path`` with it when the block exits.
+    The temporary file is removed instead if the block raises an exception, leaving ``path``
+    as it was. The new file gets the mode of a newly created file, rather than the owner-only
+    mode temporary files are created with.
+
+    :param path: Path of the file to replace, or create.
+    :type path: str
+
+    :param mode: Mode to open the temporary file with. Defaults to ``'wb'``.
+    :type mode: str, optional
+
+    :raises OSError: Unable to write or replace the file.
+
+    :return: Context manager giving the open temporary file.
+    """
+    f = tempfile.NamedTemporaryFile(
+        mode, dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp', delete=False
+    )
+    try:
+        with f:
+            yield f
+        os.chmod(f.name, _FILE_MODE)
+        os.replace(f.name, path)
+    except BaseException:
+        if os.path.exists(f.name):
+            os.remove(f.name)
+        raise
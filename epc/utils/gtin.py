@@ -0,0 +1,179 @@
+"""
+Bulk normalization and validation of GTINs.
+
+GTIN-8, GTIN-12, GTIN-13 and GTIN-14 values are normalized to GTIN-14 by zero padding on the
+left, and their check digits are validated. Every input row produces a normalized value (or
+``None``) and one of the ``GTIN_*`` result codes, so a bad row never stops a load.
+"""
+import csv
+import re
+from array import array
+
+from epc.encoding.check_digit import is_valid_check_digit
+
+GTIN_OK = 0
+GTIN_EMPTY = 1
+GTIN_NOT_NUMERIC = 2
+GTIN_INVALID_LENGTH = 3
+GTIN_INVALID_CHECK_DIGIT = 4
+
+GTIN_RESULTS = (
+    (GTIN_OK, 'Valid'),
+    (GTIN_EMPTY, 'Empty value'),
+    (GTIN_NOT_NUMERIC, 'Non-numeric characters'),
+    (GTIN_INVALID_LENGTH, 'Not 8, 12, 13 or 14 digits'),
+    (GTIN_INVALID_CHECK_DIGIT, 'Invalid check digit'),
+)
+
+_gtin_lengths = frozenset((8, 12, 13, 14))
+
+# ASCII digits only, str.isdigit() also accepts other scripts' digits and superscripts.
+_is_numeric = re.compile('[0-9]+').fullmatch
+
+
+def normalize_gtin(gtin):
+    """
+    Normalize a single GTIN to GTIN-14.
+
+    :param gtin: GTIN-8, 12, 13 or 14. Integers are accepted, for values whose leading zeros
+        were dropped by a database or spreadsheet.
+    :type gtin: str, int
+
+    :return: Tuple of the GTIN-14 (``None`` if invalid) and a ``GTIN_*`` result code.
+    :rtype: tuple
+    """
+    if isinstance(gtin, int):
+        if gtin < 0:
+            return None, GTIN_NOT_NUMERIC
+        gtin = '{:014d}'.format(gtin)
+    elif gtin is None:
+        return None, GTIN_EMPTY
+    else:
+        gtin = gtin.strip()
+
+    if not gtin:
+        return None, GTIN_EMPTY
+    if not _is_numeric(gtin):
+        return None, GTIN_NOT_NUMERIC
+    if len(gtin) not in _gtin_lengths:
+        return None, GTIN_INVALID_LENGTH
+
+    gtin = gtin.zfill(14)
+    if not is_valid_check_digit(gtin):
+        return None, GTIN_INVALID_CHECK_DIGIT
+
+    return gtin, GTIN_OK
+
+
+def normalize_gtins(gtins):
+    """
+    Normalize GTINs in bulk.
+
+    NumPy arrays are normalized with vectorized operations, returning arrays. Any other
+    iterable is processed row by row, returning a list and an ``array('B')`` of codes.
+
+    :param gtins: GTIN values.
+    :type gtins: iterable, numpy.ndarray
+
+    :return: Tuple of normalized GTIN-14 values (``None`` or empty for invalid rows) and
+        ``GTIN_*`` result codes, one per input row.
+    :rtype: tuple
+    """
+    if type(gtins).__module__ == 'numpy':
+        return _normalize_gtin_array(gtins)
+
+    normalized = []
+    codes = array('B')
+    append_normalized = normalized.append
+    append_code = codes.append
+
+    for gtin in gtins:
+        gtin, code = normalize_gtin(gtin)
+        append_normalized(gtin)
+        append_code(code)
+
+    return normalized, codes
+
+
+def _normalize_gtin_array(gtins):
+    import numpy
+
+    from epc.encoding.check_digit import validate_check_digit_array
+
+    if gtins.dtype.kind in 'iu':
+        strings = numpy.char.zfill(gtins.astype('U20'), 14)
+    else:
+        if gtins.dtype.kind == 'O':
+            # None is an empty value, as in normalize_gtin().
+            gtins = numpy.where(numpy.equal(gtins, None), '', gtins)
+        strings = numpy.char.strip(gtins.astype('U'))
+
+    lengths = numpy.char.str_len(strings)
+    # ASCII digits only, as in normalize_gtin().
+    numeric = numpy.char.isdigit(strings) & (
+        strings.view('u4').reshape(len(strings), strings.itemsize // 4) < 128).all(axis=1)
+    valid_length = numpy.isin(lengths, tuple(_gtin_lengths))
+
+    codes = numpy.full(len(gtins), GTIN_OK, dtype='u1')
+    codes[~valid_length] = GTIN_INVALID_LENGTH
+    codes[~numeric] = GTIN_NOT_NUMERIC
+    codes[lengths == 0] = GTIN_EMPTY
+
+    normalized = numpy.char.zfill(numpy.where(codes == GTIN_OK, strings, ''), 14).astype('S14')
+    digits = normalized.view('u1').reshape(len(gtins), 14) - ord('0')
+
+    check_digit_valid = validate_check_digit_array(digits)
+    codes[(codes == GTIN_OK) & ~check_digit_valid] = GTIN_INVALID_CHECK_DIGIT
+    normalized[codes != GTIN_OK] = b''
+
+    return normalized.astype('U14'), codes
+
+
+def normalize_gtin_csv(in_file, out_file, column=0, has_header=True, chunk_size=10000):
+    """
+    Stream a CSV file, replacing a GTIN column with its normalized GTIN-14 and appending a
+    result code column. Rows are written in chunks, so memory use doesn't grow with the file.
+
+    :param in_file: Readable text file object.
+    :type in_file: file
+
+    :param out_file: Writable text file object.
+    :type out_file: file
+
+    :param column: Index of the GTIN column. Defaults to ``0``.
+    :type column: int, optional
+
+    :param has_header: The first row is a header. Defaults to ``True``.
+    :type has_header: bool, optional
+
+    :param chunk_size: Rows per write. Defaults to ``10000``.
+    :type chunk_size: int, optional
+
+    :return: Count of rows for each ``GTIN_*`` result code.
+    :rtype: dict
+    """
+    reader = csv.reader(in_file)
+    writer = csv.writer(out_file)
+    counts = {code: 0 for code, _ in GTIN_RESULTS}
+
+    if has_header:
+        header = next(reader, None)
+        if header is not None:
+            writer.writerow(header + ['gtin_result'])
+
+    chunk = []
+    for row in reader:
+        gtin, code = normalize_gtin(row[column] if len(row) > column else '')
+        counts[code] += 1
+
+        row.append(code)
+        if gtin is not None:
+            row[column] = gtin
+        chunk.append(row)
+
+        if len(chunk) >= chunk_size:
+            writer.writerows(chunk)
+            chunk = []
+
+    writer.writerows(chunk)
+    return counts
@@ -0,0 +1,274 @@
+"""
+Bulk JSON Lines serialization of tags.
+
+Each record is the tag's encoding and :attr:`values`, in the same text ``json.dumps`` writes::
+
+    {"encoding": "sgtin-96", "size": 96, "filter": 3, "company_prefix": "0614141", "item_reference": 812345, "serial_number": 6789}
+
+Records are formatted straight from the tags' fields rather than through a dict and
+:mod:`json`. Reading back with ``trusted=True`` builds tags from the record values without
+running the setters' validation, for records written by :func:`to_jsonl` or
+:func:`write_jsonl`.
+"""  # noqa: E501
+import json
+from json.encoder import encode_basestring_ascii
+
+from epc.schemes import GDTI, GIAI, GID, GRAI, GSRN, SGLN, SGTIN, SSCC
+from epc.schemes.GDTI import _gdti_prefix_table
+from epc.schemes.GRAI import _grai_prefix_table
+from epc.schemes.GSRN import _gsrn_prefix_table
+from epc.schemes.SGLN import _sgln_prefix_table
+from epc.schemes.SGTIN import _sgtin_prefix_table
+from epc.schemes.SSCC import _sscc_prefix_table
+from epc.utils import epc_encoding_map, epc_encoding_types
+
+
+def _json(value):
+    # Serial numbers are integers or strings depending on the tag size.
+    if value.__class__ is int:
+        return str(value)
+    return encode_basestring_ascii(value)
+
+
+def _gid(tag):
+    return '"manager_number": %d, "object_class": %d, "serial_number": %d' % (
+        tag._manager_number, tag._object_class, tag._serial_number)
+
+
+def _sgtin(tag):
+    return '"filter": %d, "company_prefix": "%0*d", "item_reference": %d, ' \
+           '"serial_number": %s' % (
+               tag._tag_filter, tag._company_prefix_length, tag._company_prefix,
+               tag._item_reference, _json(tag._serial))
+
+
+def _sgln(tag):
+    return '"filter": %d, "company_prefix": "%0*d", "location_reference": "%0*d", ' \
+           '"extension": %s' % (
+               tag._tag_filter, tag._company_prefix_length, tag._company_prefix,
+               tag._location_reference_length, tag._location_reference, _json(tag._extension))
+
+
+def _grai(tag):
+    return '"filter": %d, "company_prefix": "%0*d", "asset_type": %d, "serial_number": %s' % (
+        tag._tag_filter, tag._company_prefix_length, tag._company_prefix, tag._asset_type,
+        _json(tag._serial))
+
+
+def _giai(tag):
+    return '"filter": %d, "company_prefix": "%0*d", "asset_reference": %s' % (
+        tag._tag_filter, tag._company_prefix_length, tag._company_prefix,
+        _json(tag._asset_reference))
+
+
+def _sscc(tag):
+    return '"filter": %d, "company_prefix": "%0*d", "serial_reference": "%0*d"' % (
+        tag._tag_filter, tag._company_prefix_length, tag._company_prefix,
+        tag._serial_reference_length, tag._serial_reference)
+
+
+def _gdti(tag):
+    if tag._document_type_length > 0:
+        document_type = '%0*d' % (tag._document_type_length, tag._document_type)
+    else:
+        document_type = ''
+
+    return '"filter": %d, "company_prefix": "%0*d", "document_type": "%s", ' \
+           '"serial_number": %s' % (
+               tag._tag_filter, tag._company_prefix_length, tag._company_prefix,
+               document_type, _json(tag._serial))
+
+
+def _gsrn(tag):
+    return '"filter": %d, "company_prefix": "%0*d", "service_reference": "%0*d"' % (
+        tag._tag_filter, tag._company_prefix_length, tag._company_prefix,
+        tag._service_reference_length, tag._service_reference)
+
+
+_writers = {
+    # Scheme: Function formatting the fields after the size
+    GID: _gid,
+    SGTIN: _sgtin,
+    SGLN: _sgln,
+    GRAI: _grai,
+    GIAI: _giai,
+    SSCC: _sscc,
+    GDTI: _gdti,
+    GSRN: _gsrn,
+}
+
+_readers = {
+    # Scheme: (Identity field written zero padded, Padded field length attribute,
+    #          Prefix table)
+    SGTIN: (1, '_item_reference_length', _sgtin_prefix_table),
+    SGLN: (1, '_location_reference_length', _sgln_prefix_table),
+    GRAI: (1, '_asset_type_length', _grai_prefix_table),
+    GIAI: (None, None, None),
+    SSCC: (2, '_serial_reference_length', _sscc_prefix_table),
+    GDTI: (1, '_document_type_length', _gdti_prefix_table),
+    GSRN: (2, '_service_reference_length', _gsrn_prefix_table),
+}
+
+_schemes = None
+
+
+def _scheme(encoding):
+    global _schemes
+    if _schemes is None:
+        _schemes = {
+            name: epc_encoding_map[header] for header, name in epc_encoding_types.items()
+            if header in epc_encoding_map
+        }
+
+    try:
+        return _schemes[encoding]
+    except KeyError:
+        raise ValueError('Unknown encoding `%s`' % encoding)
+
+
+def _record(tag):
+    try:
+        writer = _writers[type(tag)]
+    except KeyError:
+        raise ValueError('Scheme `%s` cannot be serialized' % type(tag).__name__)
+
+    tag.check_fields()
+    return '{"encoding": "%s", "size": %d, %s}\n' % (tag.encoding, tag._tag_size, writer(tag))
+
+
+def to_jsonl(tags):
+    """
+    Serialize tags to JSON Lines.
+
+    :param tags: Tags to serialize.
+    :type tags: iterable
+
+    :raises ValueError: Scheme not supported.
+    :raises AttributeError: If any components of a tag are missing.
+
+    :return: One record per tag, each ending with a newline.
+    :rtype: str
+    """
+    return ''.join([_record(tag) for tag in tags])
+
+
+def write_jsonl(tags, stream, chunk_size=10000):
+    """
+    Serialize tags to JSON Lines on a text stream, writing ``chunk_size`` records at a time.
+
+    :param tags: Tags to serialize.
+    :type tags: iterable
+
+    :param stream: Text stream, such as a file or :class:`io.StringIO`.
+    :type stream: io.TextIOBase
+
+    :param chunk_size: Records per write. Defaults to ``10000``.
+    :type chunk_size: int, optional
+
+    :raises ValueError: Scheme not supported.
+    :raises AttributeError: If any components of a tag are missing.
+
+    :return: Number of records written.
+    :rtype: int
+    """
+    count = 0
+    chunk = []
+
+    for tag in tags:
+        chunk.append(_record(tag))
+        if len(chunk) >= chunk_size:
+            stream.write(''.join(chunk))
+            count += len(chunk)
+            chunk = []
+
+    if chunk:
+        stream.write(''.join(chunk))
+        count += len(chunk)
+
+    return count
+
+
+def _trusted_tag(cls, record):
+    # Set the attributes the setters would, without validating them.
+    tag = cls.__new__(cls)
+    attributes = tag.__dict__
+    attributes['_tag_size'] = record['size']
+
+    if cls is GID:
+        attributes['_manager_number'] = record['manager_number']
+        attributes['_object_class'] = record['object_class']
+        attributes['_serial_number'] = record['serial_number']
+        return tag
+
+    padded, length_attribute, prefix_table = _readers[cls]
+    company_prefix = record['company_prefix']
+
+    attributes['_tag_filter'] = record['filter']
+    attributes['_company_prefix'] = int(company_prefix)
+    attributes['_company_prefix_length'] = len(company_prefix)
+
+    # Record keys are the setter names.
+    for index, (attribute, key) in enumerate(cls._identity_fields[1:], 1):
+        if index == padded:
+            attributes[attribute] = int(record[key] or 0)
+            attributes[length_attribute] = prefix_table[len(company_prefix)][2]
+        elif key:
+            attributes[attribute] = record[key]
+
+    return tag
+
+
+def _tag(cls, record):
+    # Setters are named after the record keys.
+    tag = cls().tag_size(record['size'])
+
+    if cls is GID:
+        tag.manager_number(record['manager_number'])
+        tag.object_class(record['object_class'])
+        tag.serial_number(record['serial_number'])
+        return tag
+
+    padded = _readers[cls][0]
+    company_prefix = record['company_prefix']
+    tag.filter(record['filter']).company_prefix(company_prefix, len(company_prefix))
+
+    for index, (_, key) in enumerate(cls._identity_fields[1:], 1):
+        if index == padded:
+            getattr(tag, key)(int(record[key] or 0))
+        elif key:
+            getattr(tag, key)(record[key])
+
+    return tag
+
+
+def from_jsonl(lines, trusted=False):
+    """
+    Deserialize tags from JSON Lines. Blank lines are skipped.
+
+    :param lines: JSON Lines text, or an iterable of lines such as a text file.
+    :type lines: str, iterable
+
+    :param trusted: Build tags without validating their values, for records written by
+        :func:`to_jsonl` or :func:`write_jsonl`. Defaults to ``False``.
+    :type trusted: bool, optional
+
+    :raises ValueError: Invalid JSON, or unknown encoding.
+    :raises KeyError: Value missing from a record.
+    :raises AttributeError: Invalid value, unless ``trusted``.
+
+    :return: List of tags.
+    :rtype: list
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+
+    build = _trusted_tag if trusted else _tag
+    loads = json.loads
+    tags = []
+
+    for line in lines:
+        if line.strip():
+            record = loads(line)
+            tags.append(build(_scheme(record['encoding']), record))
+
+    return tags
@@ -0,0 +1,107 @@
+"""
+Canonical binary keys for tags, for use as primary keys in sorted stores and for merge joins
+of sorted tag files.
+
+A key is :meth:`epc.schemes.base.EpcScheme.identity_key` as :data:`KEY_SIZE` big endian
+bytes. Keys of the same pure identity are equal whatever the tag's filter and size (a
+GRAI-96 and a GRAI-170 of the same asset share a key), and comparing keys bytewise orders
+them by scheme, company prefix, reference and serial number, the same as comparing the tags::
+
+    rows = sorted((encode_key(tag), tag) for tag in tags)
+    decode_key(rows[0][0]).pure_identity_uri
+"""
+from epc.utils import epc_encoding_map
+from epc.utils.archive import _build_tag
+
+# Bytes of a key, holding the 396 bits of an identity key.
+KEY_SIZE = 50
+
+_SERIAL_BITS = 256
+_REFERENCE_BITS = 64
+_PREFIX_BITS = 64
+
+
+def _scheme(header):
+    # Keys carry the header of the scheme's first encoding.
+    cls = epc_encoding_map.get(header)
+    if cls is None or cls.HEADERS[0] != header or cls._identity_fields is None:
+        raise ValueError('Invalid key header: 0x%02x' % header)
+    return cls
+
+
+def encode_key(tag):
+    """
+    Canonical key of a tag.
+
+    :param tag: Tag to encode.
+    :type tag: :class:`epc.schemes.base.EpcScheme`
+
+    :raises AttributeError: If any components of the tag are missing or out of range.
+
+    :rtype: bytes
+    """
+    return tag.identity_key().to_bytes(KEY_SIZE, 'big')
+
+
+def encode_keys(tags):
+    """
+    Canonical keys of many tags, for bulk loads.
+
+    :param tags: Tags to encode.
+    :type tags: iterable
+
+    :raises AttributeError: If any components of a tag are missing or out of range.
+
+    :return: List of keys, in the order of the tags.
+    :rtype: list
+    """
+    return [
+        (tag._identity or tag.identity_key()).to_bytes(KEY_SIZE, 'big')
+        for tag in tags
+    ]
+
+
+def decode_key(key):
+    """
+    Build the tag of a canonical key. The tag has the key's pure identity, filter ``0``, and
+    the 96 bit size unless its serial number is alphanumeric (or has leading zeros) or doesn't
+    fit in 96 bits, which uses the scheme's largest size.
+
+    :param key: Canonical key.
+    :type key: bytes
+
+    :raises ValueError: Invalid key.
+
+    :return: EPC tag object
+    :rtype: :class:`epc.schemes.base.EpcScheme`
+    """
+    if len(key) != KEY_SIZE:
+        raise ValueError('Key must be %d bytes' % KEY_SIZE)
+
+    value = int.from_bytes(key, 'big')
+
+    serial = value & ((1 << _SERIAL_BITS) - 1)
+    value >>= _SERIAL_BITS
+    reference = value & ((1 << _REFERENCE_BITS) - 1)
+    value >>= _REFERENCE_BITS
+    company_prefix = value & ((1 << _PREFIX_BITS) - 1)
+    value >>= _PREFIX_BITS
+    company_prefix_length = value & 0xf
+
+    cls = _scheme(value >> 4)
+
+    if serial & 1:
+        serial = serial >> 1
+        serial_text = serial.to_bytes((serial.bit_length() + 7) // 8, 'big')
+        header = cls.HEADERS[-1]
+    else:
+        serial = serial >> 1
+        serial_text = str(serial).encode('ascii')
+        size = cls._identity_size(serial, company_prefix_length or None)
+        header = cls.HEADERS[cls.TAG_SIZES.index(size)]
+
+    try:
+        return _build_tag(cls, header, 0, company_prefix_length or None, company_prefix,
+                          reference, serial, serial_text)
+    except (AttributeError, UnicodeDecodeError):
+        raise ValueError('Invalid key')
@@ -0,0 +1,167 @@
+"""
+Integer key ranges covering every 96 bit EPC of a GS1 key, for index range scans over tags
+stored as integers.
+
+In the 96 bit SGTIN, SGLN, GRAI and GIAI encodings the header, filter, partition, company
+prefix and reference fields come before the serial number, so all tags of one key (and one
+filter value) form a single contiguous interval of integers. Each function returns one
+inclusive ``(lo, hi)`` interval per filter value, sorted::
+
+    for lo, hi in sgtin_ranges('00614141123452', 7):
+        cursor.execute('SELECT * FROM reads WHERE epc BETWEEN ? AND ?', (lo, hi))
+
+Tags stored as two 64 bit columns (see :meth:`epc.schemes.base.EpcScheme.to_parts`) are
+scanned with the same intervals split by :func:`range_parts`.
+"""
+from epc.schemes import GIAI, GRAI, SGLN, SGTIN
+from epc.schemes.GIAI import _giai_96_partition_table
+
+_UINT64_MASK = (1 << 64) - 1
+
+_FILTERS = tuple(range(8))
+
+_SERIAL_BITS = {
+    # Scheme: Serial Bits in the 96 bit Encoding
+    SGTIN: 38,
+    SGLN: 41,
+    GRAI: 38,
+}
+
+
+def _ranges(tag, serial_bits, filters):
+    if filters is None:
+        filters = _FILTERS
+
+    tag.tag_size(tag.SIZE_96)
+    serial_mask = (1 << serial_bits) - 1
+
+    ranges = []
+    for tag_filter in sorted(set(filters)):
+        lo = int(tag.filter(tag_filter)) & ~serial_mask
+        ranges.append((lo, lo | serial_mask))
+
+    return ranges
+
+
+def sgtin_ranges(gtin, company_prefix_length, filters=None):
+    """
+    Integer ranges of the SGTIN-96 tags of a GTIN.
+
+    :param gtin: GTIN-14, GTIN-13 or GTIN-12, including the check digit.
+    :type gtin: str
+
+    :param company_prefix_length: Number of digits of the company prefix length, or a
+        resolver returning it, such as
+        :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+    :type company_prefix_length: int, callable
+
+    :param filters: Filter values to include. Defaults to all of them.
+    :type filters: iterable, optional
+
+    :raises ValueError: Invalid GTIN length.
+    :raises AttributeError: Invalid check digit, company prefix length or filter.
+
+    :return: Sorted list of inclusive ``(lo, hi)`` tuples, one per filter value.
+    :rtype: list
+    """
+    tag = SGTIN()
+    tag.decode_gtin(gtin, company_prefix_length)
+    return _ranges(tag, _SERIAL_BITS[SGTIN], filters)
+
+
+def sgln_ranges(gln, company_prefix_length, filters=None):
+    """
+    Integer ranges of the SGLN-96 tags of a GLN, covering every extension.
+
+    :param gln: 13 digit GLN, including the check digit.
+    :type gln: str
+
+    :param company_prefix_length: Number of digits of the company prefix length, or a
+        resolver returning it, such as
+        :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+    :type company_prefix_length: int, callable
+
+    :param filters: Filter values to include. Defaults to all of them.
+    :type filters: iterable, optional
+
+    :raises ValueError: Invalid GLN length.
+    :raises AttributeError: Invalid check digit, company prefix length or filter.
+
+    :return: Sorted list of inclusive ``(lo, hi)`` tuples, one per filter value.
+    :rtype: list
+    """
+    if len(gln) != 13:
+        raise ValueError('GLN must be 13 digits')
+
+    tag = SGLN()
+    tag.decode_barcode(SGLN.HEADER_BARCODE + gln + '2540', company_prefix_length)
+    return _ranges(tag, _SERIAL_BITS[SGLN], filters)
+
+
+def grai_ranges(grai, company_prefix_length, filters=None):
+    """
+    Integer ranges of the GRAI-96 tags of an asset type.
+
+    :param grai: 14 digit GRAI without a serial number: a ``0`` pad digit, the company prefix,
+        the asset type and the check digit.
+    :type grai: str
+
+    :param company_prefix_length: Number of digits of the company prefix length, or a
+        resolver returning it, such as
+        :class:`epc.utils.company_prefix.CompanyPrefixResolver`.
+    :type company_prefix_length: int, callable
+
+    :param filters: Filter values to include. Defaults to all of them.
+    :type filters: iterable, optional
+
+    :raises ValueError: Invalid GRAI length.
+    :raises AttributeError: Invalid check digit, company prefix length or filter.
+
+    :return: Sorted list of inclusive ``(lo, hi)`` tuples, one per filter value.
+    :rtype: list
+    """
+    if len(grai) != 14:
+        raise ValueError('GRAI must be 14 digits, without a serial number')
+
+    tag = GRAI()
+    tag.decode_barcode(GRAI.HEADER_BARCODE + grai + '1', company_prefix_length)
+    return _ranges(tag, _SERIAL_BITS[GRAI], filters)
+
+
+def giai_ranges(company_prefix, filters=None):
+    """
+    Integer ranges of the GIAI-96 tags of a company prefix, covering every asset reference.
+
+    :param company_prefix: GS1 company prefix, 6 to 12 digits.
+    :type company_prefix: str
+
+    :param filters: Filter values to include. Defaults to all of them.
+    :type filters: iterable, optional
+
+    :raises AttributeError: Invalid company prefix length or filter.
+
+    :return: Sorted list of inclusive ``(lo, hi)`` tuples, one per filter value.
+    :rtype: list
+    """
+    tag = GIAI().company_prefix(company_prefix).asset_reference(0)
+
+    for _, company_prefix_digits, asset_reference_bits in _giai_96_partition_table.values():
+        if company_prefix_digits == len(company_prefix):
+            return _ranges(tag, asset_reference_bits, filters)
+
+
+def range_parts(ranges):
+    """
+    Split integer ranges for tags stored as two unsigned 64 bit columns. Each interval becomes
+    a pair of ``(high, low)`` bounds, to compare with the columns as a composite key.
+
+    :param ranges: Inclusive ``(lo, hi)`` tuples.
+    :type ranges: iterable
+
+    :return: List of ``((lo_high, lo_low), (hi_high, hi_low))`` tuples.
+    :rtype: list
+    """
+    return [
+        ((lo >> 64, lo & _UINT64_MASK), (hi >> 64, hi & _UINT64_MASK))
+        for lo, hi in ranges
+    ]
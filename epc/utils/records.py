@@ -0,0 +1,81 @@
+"""
+Decode tag data given as a hex string, URI or barcode element string, and describe the result
+as a record. Used by the command line tool (:mod:`epc.cli`) and the HTTP service
+(:mod:`epc.server`).
+"""
+from epc.utils.element_string import decode_element_string
+from epc.utils.uri import decode_uri
+from epc.utils.validation import EPC_OK, EPC_RESULTS, try_decode
+
+INPUT_FORMATS = ('auto', 'hex', 'uri', 'barcode')
+
+_errors = (AttributeError, LookupError, NotImplementedError, ValueError)
+
+
+def _detect_input_format(value):
+    if value[:4] == 'urn:':
+        return 'uri'
+    if value[:1] in ('(', ']') or '\x1d' in value:
+        return 'barcode'
+    return 'hex'
+
+
+def decode_value(value, input_format='auto', company_prefix_length=None):
+    """
+    Decode a hex string, URI or barcode element string to an EPC tag.
+
+    :param value: Tag data.
+    :type value: str
+
+    :param input_format: One of :data:`INPUT_FORMATS`. ``auto`` detects URIs, and barcodes that
+        are parenthesized or FNC1 separated, treating anything else as hex. Defaults to ``auto``.
+    :type input_format: str, optional
+
+    :param company_prefix_length: Number of digits in barcode company prefixes, or a resolver
+        returning it. Required to decode barcodes.
+    :type company_prefix_length: int, callable, optional
+
+    :raises ValueError: Unable to decode the value.
+    :raises NotImplementedError: Scheme not implemented for the value.
+    :raises AttributeError: Decoded values are invalid for the scheme.
+
+    :returns: EPC tag object
+    :rtype: object
+    """
+    if input_format == 'auto':
+        input_format = _detect_input_format(value)
+
+    if input_format == 'hex':
+        code, tag = try_decode(value)
+        if code != EPC_OK:
+            raise ValueError(EPC_RESULTS[code][1])
+        return tag
+
+    if input_format == 'uri':
+        return decode_uri(value)
+
+    if company_prefix_length is None:
+        raise ValueError('A company prefix length is required to decode barcodes')
+
+    return decode_element_string(value, company_prefix_length)
+
+
+def tag_record(value, input_format='auto', company_prefix_length=None):
+    """
+    Decode a value with :func:`decode_value` and describe the result.
+
+    :return: Dictionary containing ``input``, and either ``encoding``, ``hex``, ``uri`` and
+        ``tag_uri``, or an ``error`` message.
+    :rtype: dict
+    """
+    try:
+        tag = decode_value(value, input_format, company_prefix_length)
+        return {
+            'input': value,
+            'encoding': tag.encoding,
+            'hex': '{:0{}x}'.format(int(tag), tag._tag_size // 4),
+            'uri': tag.pure_identity_uri,
+            'tag_uri': tag.tag_uri,
+        }
+    except _errors as e:
+        return {'input': value, 'error': str(e)}
@@ -0,0 +1,154 @@
+import random
+from collections import Counter
+from unittest import TestCase
+
+from epc.schemes import SGLN, SGTIN
+from epc.utils.aggregate import CountMinSketch, SpaceSaving, TagAggregator
+
+
+def sgtin(item_reference, serial_number=1, tag_filter=SGTIN.FILTER_POS):
+    return SGTIN().company_prefix('0614141').item_reference(item_reference).filter(
+        tag_filter).serial_number(serial_number).tag_size(SGTIN.SIZE_96)
+
+
+READ_POINT = SGLN().company_prefix('0614141').location_reference(12345).extension(400).filter(
+    0).tag_size(SGLN.SIZE_96)
+
+
+class SketchTest(TestCase):
+    def setUp(self):
+        generator = random.Random(7)
+        self.stream = [int(generator.paretovariate(1.1)) for _ in range(20000)]
+        self.counts = Counter(self.stream)
+
+    def test_space_saving(self):
+        """Test Space-Saving keeps the most frequent keys within their error bounds"""
+        summary = SpaceSaving(50)
+        summary.update(self.stream)
+
+        self.assertEqual(len(summary), 50)
+        self.assertEqual(summary.total, len(self.stream))
+        self.assertEqual([key for key, _, _ in summary.top(5)],
+                         [key for key, _ in self.counts.most_common(5)])
+
+        for key, count, error in summary.top():
+            self.assertLessEqual(count - error, self.counts[key])
+            self.assertGreaterEqual(count, self.counts[key])
+        self.assertEqual(summary.count(1), self.counts[1])
+        self.assertEqual(summary.count('missing'), 0)
+
+        with self.assertRaises(ValueError):
+            SpaceSaving(0)
+
+    def test_space_saving_merge(self):
+        """Test merged Space-Saving summaries keep the error bounds of the whole stream"""
+        first, second = SpaceSaving(50), SpaceSaving(50)
+        first.update(self.stream[:5000])
+        second.update(self.stream[5000:])
+
+        merged = first.merge(second)
+        self.assertEqual(merged.total, len(self.stream))
+        self.assertEqual(len(merged), 50)
+
+        for key, count, error in merged.top():
+            self.assertLessEqual(count - error, self.counts[key])
+            self.assertGreaterEqual(count, self.counts[key])
+
+    def test_count_min(self):
+        """Test Count-Min estimates are never below the true counts"""
+        sketch = CountMinSketch(width=256, depth=4)
+        for key in self.stream:
+            sketch.add(key)
+
+        for key, count in self.counts.items():
+            self.assertGreaterEqual(sketch.estimate(key), count)
+        self.assertEqual(sketch.estimate(1), self.counts[1])
+
+        other = CountMinSketch(width=256, depth=4)
+        other.add('00614141123452', 3)
+        merged = sketch.merge(other)
+        self.assertEqual(merged.total, len(self.stream) + 3)
+        self.assertGreaterEqual(merged.estimate('00614141123452'), 3)
+        self.assertEqual(merged.estimate(1), sketch.estimate(1))
+
+        with self.assertRaises(ValueError):
+            sketch.merge(CountMinSketch(width=128))
+
+
+class TagAggregatorTest(TestCase):
+    def test_tumbling(self):
+        """Test counts of a tumbling window"""
+        aggregator = TagAggregator(window=60, top=2)
+        aggregator.add_many([sgtin(1), sgtin(1, 2), sgtin(2)], timestamp=0)
+        aggregator.add(int(sgtin(3, tag_filter=SGTIN.FILTER_FULL_CASE)), timestamp=10)
+        aggregator.add('{:x}'.format(int(READ_POINT)), timestamp=20)
+        aggregator.add_many(['not hex', '3074257bf7194e40'], timestamp=30)
+
+        summary = aggregator.snapshot(now=59)
+        self.assertEqual((summary['start'], summary['end']), (0, 60))
+        self.assertEqual(summary['reads'], 5)
+        self.assertEqual(summary['invalid'], 2)
+        self.assertEqual(summary['encodings'], {'sgtin-96': 4, 'sgln-96': 1})
+        self.assertEqual(summary['filters'], {1: 3, 2: 1, 0: 1})
+        self.assertEqual(summary['read_points'], {READ_POINT.pure_identity_uri: 1})
+        self.assertEqual(len(summary['top_gtins']), 2)
+        self.assertEqual(summary['top_gtins'][0], (sgtin(1).gtin, 2, 0))
+        self.assertEqual(aggregator.gtin_count(sgtin(1).gtin, now=59), 2)
+
+        aggregator.add(sgtin(1), timestamp=60)
+        self.assertEqual(aggregator.snapshot(now=60)['reads'], 1)
+        self.assertEqual(aggregator.snapshot(now=120)['reads'], 0)
+
+        aggregator.add(sgtin(1), timestamp=59)
+        self.assertEqual(aggregator.late, 1)
+
+    def test_sliding(self):
+        """Test a sliding window drops panes as it slides, and reports each window"""
+        windows = []
+        aggregator = TagAggregator(window=30, step=10, on_window=windows.append)
+
+        for second in range(0, 60, 5):
+            aggregator.add(sgtin(second // 10), timestamp=second)
+
+        summary = aggregator.snapshot(now=55)
+        self.assertEqual((summary['start'], summary['end']), (30, 60))
+        self.assertEqual(summary['reads'], 6)
+        self.assertEqual(len(summary['top_gtins']), 3)
+        self.assertEqual(aggregator.gtin_count(sgtin(5).gtin, now=55), 2)
+        self.assertEqual(aggregator.gtin_count(sgtin(0).gtin, now=55), 0)
+
+        self.assertEqual([(window['end'], window['reads']) for window in windows],
+                         [(10, 2), (20, 4), (30, 6), (40, 6), (50, 6)])
+
+        aggregator.add(sgtin(0), timestamp=100)
+        self.assertEqual([(window['end'], window['reads']) for window in windows[5:]],
+                         [(60, 6), (70, 4), (80, 2)])
+
+        with self.assertRaises(ValueError):
+            TagAggregator(window=30, step=7)
+        with self.assertRaises(ValueError):
+            TagAggregator(window=30, step=60)
+
+    def test_invalid(self):
+        """Test invalid window and summary sizes are refused up front"""
+        for arguments in (
+            {'step': 0},
+            {'window': 0},
+            {'window': -30, 'step': -10},
+            {'top': 0},
+            {'top_capacity': 0},
+            {'sketch_width': 0},
+            {'sketch_depth': 0},
+        ):
+            with self.assertRaises(ValueError, msg=arguments):
+                TagAggregator(**arguments)
+
+    def test_clock(self):
+        """Test reads without a timestamp use the clock"""
+        now = [1000.0]
+        aggregator = TagAggregator(window=10, clock=lambda: now[0])
+        aggregator.add(sgtin(1))
+        self.assertEqual(aggregator.snapshot()['reads'], 1)
+
+        now[0] = 1010.0
+        self.assertEqual(aggregator.snapshot()['reads'], 0)
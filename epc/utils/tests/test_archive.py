@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase, skipIf
+
+from epc.schemes import SGTIN
+from epc.utils import decode_epc
+
+try:
+    import numpy
+    from epc.utils.archive import TagArchive, TagArchiveWriter
+except ImportError:
+    numpy = None
+
+
+@skipIf(numpy is None, 'NumPy is not installed')
+class TagArchiveTest(TestCase):
+    tags = (
+        '301800004000004000000001',
+        '3618000040000050a24a993a852a95ac5ab97b062c8000000000',
+        '32140138800002000000002a',
+        '341401388000000000000001',
+        '3174257bf4499602d2000000',
+        '3a34257bf46072b1a2bc2ec500008000',
+        '3500079ff00000b00000000c',
+    )
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+    def test_round_trip(self):
+        """Test archived tags rebuild to the same encoding"""
+        TagArchiveWriter(self.path).append(decode_epc(tag) for tag in self.tags)
+
+        archive = TagArchive(self.path)
+        self.assertEqual(len(archive), len(self.tags))
+        self.assertEqual(['{:x}'.format(int(tag)) for tag in archive], list(self.tags))
+        self.assertEqual(archive.tag(-1).pure_identity_uri, 'urn:epc:id:gid:31231.11.12')
+
+    def test_columns(self):
+        """Test columns are memory-mapped and appended segment by segment"""
+        TagArchiveWriter(self.path).append([decode_epc(self.tags[0])])
+        archive = TagArchive(self.path)
+        self.assertIsInstance(archive.column('header'), numpy.memmap)
+
+        TagArchiveWriter(self.path).append(decode_epc(tag) for tag in self.tags[2:])
+        archive = TagArchive(self.path)
+        self.assertEqual(len(archive.segments), 2)
+        self.assertEqual(
+            archive.column('header').tolist(), [0x30, 0x32, 0x34, 0x31, 0x3A, 0x35]
+        )
+        self.assertEqual(
+            archive.column('company_prefix').tolist(), [1, 20000, 20000, 614141, 614141, 31231]
+        )
+        self.assertEqual(archive.column('serial').tolist(), [1, 42, 1, 1234567890, 0, 12])
+        self.assertEqual(archive.column('serial_text')[4], b'00000000000000001')
+
+    def test_empty_segment(self):
+        """Test appending no tags doesn't create a segment"""
+        self.assertIsNone(TagArchiveWriter(self.path).append([]))
+        self.assertEqual(len(TagArchive(self.path)), 0)
+
+    def test_serial_text(self):
+        """Test the longest serials are kept whole, and longer serials are refused"""
+        giai = decode_epc('3818000058800000000000000000000000000000000000000000')
+        giai.asset_reference('A' * 24)
+        writer = TagArchiveWriter(self.path)
+        writer.append([giai])
+        self.assertEqual(TagArchive(self.path).tag(0).values['asset_reference'], 'A' * 24)
+
+        sgtin = SGTIN().company_prefix('0614141').item_reference(12345).filter(1).tag_size(
+            SGTIN.SIZE_198).serial_number(2 ** 100)
+        with self.assertRaisesRegex(ValueError, 'longer than 24 characters'):
+            writer.append([sgtin])
+        self.assertEqual(len(TagArchive(self.path)), 1)
+
+    def test_manifest(self):
+        """Test the manifest is replaced through a temporary file of its own"""
+        writer = TagArchiveWriter(self.path)
+        writer.append([decode_epc(self.tags[0])])
+        self.assertEqual(sorted(name for name in os.listdir(self.path) if 'manifest' in name),
+                         ['manifest.json'])
+        self.assertEqual(os.stat(os.path.join(self.path, 'manifest.json')).st_mode & 0o777,
+                         os.stat(os.path.join(self.path, '000000.header.bin')).st_mode & 0o777)
@@ -0,0 +1,134 @@
+import io
+import mmap
+import os
+import tempfile
+from unittest import TestCase
+
+from epc.utils import decode_epc
+from epc.utils.batch import (
+    BATCH_VERSION, BatchReader, BatchWriter, encode_batch, iter_batches, read_batches
+)
+
+TAGS = [
+    '3074257bf7194e4000001a85',
+    '3618000040000050a24a993a852a95ac5ab97b062c8000000000',
+    '3514257bf7194e4000001a85',
+    '3718000040000050a24a993a852a95ac5ab97b062c80',
+    '2c74257bf460720000000190',
+    '3a14257bf46072000000000013c58000',
+]
+
+SERIALS = [0x3074257bf7194e4000000000 + serial for serial in (1, 2, 3, 200, 70000, 70000)]
+
+
+class BatchTest(TestCase):
+    def test_packed(self):
+        """Test packed batches round trip"""
+        frame = encode_batch(TAGS[:1] * 3)
+        self.assertEqual(len(frame), 16 + 2 + 36)
+
+        batch = BatchReader(frame)
+        self.assertEqual(batch.headers, (0x30,))
+        self.assertEqual(batch.hex_strings(), TAGS[:1] * 3)
+        self.assertEqual(batch.size, len(frame))
+
+    def test_mixed(self):
+        """Test batches of several schemes and sizes round trip"""
+        tags = [decode_epc(hex_string) for hex_string in TAGS]
+        batch = BatchReader(encode_batch(tags))
+
+        self.assertEqual(batch.headers, (0x2c, 0x30, 0x35, 0x36, 0x37, 0x3a))
+        self.assertEqual(batch.record_size, 26)
+        self.assertEqual(batch.hex_strings(), TAGS)
+        self.assertEqual([decode_epc(value) for value in batch], tags)
+        self.assertEqual([batch[i] for i in range(len(batch))], list(batch))
+        self.assertEqual(batch[-1], int(TAGS[-1], 16))
+
+        with self.assertRaises(IndexError):
+            batch[len(TAGS)]
+
+    def test_delta(self):
+        """Test delta batches round trip"""
+        frame = encode_batch(SERIALS, delta=True)
+        self.assertEqual(len(frame), 16 + 2 + 12 + 1 + 1 + 2 + 3 + 1)
+
+        batch = BatchReader(frame)
+        self.assertTrue(batch.delta)
+        self.assertEqual(list(batch), SERIALS)
+        self.assertEqual(batch.hex_strings()[0], '3074257bf7194e4000000001')
+
+        with self.assertRaises(TypeError):
+            batch[0]
+        with self.assertRaises(ValueError):
+            encode_batch(SERIALS[::-1], delta=True)
+        with self.assertRaises(ValueError):
+            encode_batch(TAGS[:2], delta=True)
+
+        self.assertEqual(list(BatchReader(encode_batch([], delta=True))), [])
+
+    def test_invalid(self):
+        """Test reading invalid frames"""
+        frame = encode_batch(TAGS)
+
+        with self.assertRaises(ValueError):
+            BatchReader(frame[:-1])
+        with self.assertRaises(ValueError):
+            BatchReader(b'EPCA' + frame[4:])
+        with self.assertRaises(ValueError):
+            BatchReader(frame[:4] + bytes([BATCH_VERSION + 1]) + frame[5:])
+        with self.assertRaises(NotImplementedError):
+            encode_batch(['3f74257bf7194e4000001a85'])
+
+    def test_stream(self):
+        """Test writing and reading streams of frames"""
+        output = io.BytesIO()
+        with BatchWriter(output, batch_size=4) as writer:
+            writer.write_many(TAGS)
+            writer.write(decode_epc(TAGS[0]))
+
+        batches = list(read_batches(io.BytesIO(output.getvalue())))
+        self.assertEqual([len(batch) for batch in batches], [4, 3])
+        self.assertEqual([v for batch in batches for v in batch.hex_strings()], TAGS + TAGS[:1])
+
+        with self.assertRaises(ValueError):
+            list(read_batches(io.BytesIO(output.getvalue()[:-1])))
+
+    def test_short_reads(self):
+        """Test frames are read whole from streams returning a few bytes per read"""
+        class Trickle(io.RawIOBase):
+            def __init__(self, data):
+                self.data = io.BytesIO(data)
+
+            def readable(self):
+                return True
+
+            def readinto(self, buffer):
+                data = self.data.read(min(len(buffer), 5))
+                buffer[:len(data)] = data
+                return len(data)
+
+        output = io.BytesIO()
+        with BatchWriter(output, batch_size=4, delta=True) as writer:
+            writer.write_many(SERIALS)
+
+        batches = list(read_batches(Trickle(output.getvalue())))
+        self.assertEqual([value for batch in batches for value in batch], SERIALS)
+
+        with self.assertRaises(ValueError):
+            list(read_batches(Trickle(output.getvalue()[:-1])))
+
+    def test_mmap(self):
+        """Test reading frames in place from a memory mapped file"""
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.remove, path)
+
+        with os.fdopen(fd, 'wb') as f:
+            with BatchWriter(f, batch_size=2, delta=True) as writer:
+                writer.write_many(SERIALS)
+
+        with open(path, 'rb') as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            values = [value for batch in iter_batches(m) for value in batch]
+            m.close()
+
+        self.assertEqual(values, SERIALS)
@@ -0,0 +1,142 @@
+import os
+import random
+import shutil
+import tempfile
+from unittest import TestCase, skipIf
+
+from epc.schemes import SGTIN, SSCC
+from epc.utils import decode_epc
+
+try:
+    import numpy
+    from epc.utils.bloom import TagFilter
+except ImportError:
+    numpy = None
+
+ITEM = SGTIN().company_prefix('0614141').item_reference(12345).filter(
+    SGTIN.FILTER_POS).tag_size(SGTIN.SIZE_96)
+
+
+@skipIf(numpy is None, 'NumPy is not installed')
+class TagFilterTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_membership(self):
+        """Test added tags are always found, and other tags at about the error rate"""
+        generator = random.Random(3)
+        values = [generator.getrandbits(96) for _ in range(20000)]
+
+        tag_filter = TagFilter(10000, error_rate=0.01)
+        tag_filter.add_many(values[:10000])
+        self.assertEqual(len(tag_filter), 10000)
+
+        self.assertTrue(tag_filter.contains_many(values[:10000]).all())
+        self.assertLess(tag_filter.contains_many(values[10000:]).mean(), 0.02)
+
+        tag_filter.add(decode_epc('3674257bf6b7a659b2c2bf100000000000000000000000000000'))
+        self.assertIn('3674257bf6b7a659b2c2bf100000000000000000000000000000', tag_filter)
+
+        with self.assertRaises(ValueError):
+            TagFilter(0)
+        with self.assertRaises(ValueError):
+            TagFilter(100, error_rate=1)
+
+    def test_ranges(self):
+        """Test ranges add every value, including ranges crossing 64 bit boundaries"""
+        tag_filter = TagFilter(5000)
+        tag_filter.add_range(2 ** 128 - 100, 2 ** 128 + 99)
+        tag_filter.add_range(2 ** 95, 2 ** 95 + 3000, step=3)
+        self.assertEqual(len(tag_filter), 1201)
+
+        values = list(range(2 ** 128 - 100, 2 ** 128 + 100))
+        values.extend(range(2 ** 95, 2 ** 95 + 3001, 3))
+        self.assertTrue(tag_filter.contains_many(values).all())
+        self.assertEqual(tag_filter.contains_many([2 ** 128 + 100, 2 ** 95 + 1]).tolist(),
+                         [False, False])
+
+        with self.assertRaises(ValueError):
+            tag_filter.add_range(10, 9)
+        with self.assertRaises(ValueError):
+            tag_filter.add_range(1, 9, step=0)
+        with self.assertRaises(ValueError):
+            tag_filter.add_range(-1, 9)
+        with self.assertRaises(ValueError):
+            tag_filter.add(-1)
+        with self.assertRaises(ValueError):
+            tag_filter.contains_many(['-1'])
+        self.assertEqual(len(tag_filter), 1201)
+
+    def test_serials(self):
+        """Test runs of serial numbers are added without the tags in between"""
+        tag_filter = TagFilter(3000)
+        tag_filter.add_serials(ITEM.serial_number(1), 1000, 2999)
+        self.assertEqual(ITEM.values['serial_number'], 1)
+        self.assertIn(ITEM.serial_number(1000), tag_filter)
+        self.assertIn(ITEM.serial_number(2999), tag_filter)
+        self.assertNotIn(ITEM.serial_number(3000), tag_filter)
+
+        # The serial reference of an SSCC is followed by reserved bits.
+        sscc = SSCC().company_prefix('0614141').filter(0).tag_size(SSCC.SIZE_96)
+        tag_filter.add_serials(sscc, 1, 500)
+        self.assertIn(sscc.serial_reference(250), tag_filter)
+        self.assertNotIn(sscc.serial_reference(501), tag_filter)
+
+        item = SGTIN().company_prefix('0614141').item_reference(12345).filter(
+            SGTIN.FILTER_POS).tag_size(SGTIN.SIZE_198)
+        for first, last in ((1, 10), (1, 9)):
+            with self.assertRaisesRegex(ValueError, 'not an integer field'):
+                tag_filter.add_serials(item, first, last)
+        self.assertIsNone(item._serial)
+        self.assertEqual(ITEM.values['serial_number'], 3000)
+
+    def test_save(self):
+        """Test saved filters open memory mapped with the same members"""
+        path = os.path.join(self.directory, 'commissioned.epcf')
+        tag_filter = TagFilter(1000, error_rate=0.001)
+        tag_filter.add_serials(ITEM, 1, 1000)
+        tag_filter.save(path)
+        self.assertEqual(os.listdir(self.directory), ['commissioned.epcf'])
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o666 & ~umask)
+
+        opened = TagFilter.open(path)
+        self.assertIsInstance(opened._data, numpy.memmap)
+        self.assertEqual((opened.bits, opened.hashes, len(opened), opened.error_rate),
+                         (tag_filter.bits, tag_filter.hashes, 1000, 0.001))
+
+        values = [int(ITEM.serial_number(serial)) for serial in range(1, 2001)]
+        self.assertEqual(opened.contains_many(values).tolist(),
+                         tag_filter.contains_many(values).tolist())
+        del opened
+
+        with open(path, 'r+b') as f:
+            f.write(b'XXXX')
+        with self.assertRaises(ValueError):
+            TagFilter.open(path)
+
+    def test_open_mode(self):
+        """Test opened filters refuse tags unless opened copy on write"""
+        path = os.path.join(self.directory, 'commissioned.epcf')
+        TagFilter(1000).save(path)
+
+        opened = TagFilter.open(path)
+        with self.assertRaisesRegex(ValueError, 'read-only'):
+            opened.add(ITEM.serial_number(1))
+        with self.assertRaisesRegex(ValueError, 'read-only'):
+            opened.add_serials(ITEM, 1, 10)
+        self.assertEqual(len(opened), 0)
+
+        copied = TagFilter.open(path, mode='c')
+        copied.add_serials(ITEM, 1, 10)
+        self.assertIn(ITEM.serial_number(5), copied)
+        self.assertNotIn(ITEM.serial_number(5), opened)
+
+        copied.save(path)
+        del opened, copied
+        self.assertIn(ITEM.serial_number(5), TagFilter.open(path))
+
+        with self.assertRaises(ValueError):
+            TagFilter.open(path, mode='r+')
@@ -0,0 +1,108 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from epc.utils.chunks import LineIndex, iter_lines, plan_chunks
+
+# Reads of varying length, with blank lines and Windows line endings.
+LINES = [
+    '3074257bf7194e4000001a85' if i % 7 else '' if i % 3 else '3074257bf7194e40%08x\r' % i
+    for i in range(1000)
+]
+
+
+class ChunksTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.path = self.write('reads.txt', '\n'.join(LINES))
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', newline='') as f:
+            f.write(text)
+        return path
+
+    def test_plan(self):
+        """Test ranges split files at line starts and cover every line once"""
+        expected = [line.strip() for line in LINES if line.strip()]
+
+        for chunks in (1, 2, 7, 100, 5000):
+            ranges = plan_chunks(self.path, chunks=chunks)
+            self.assertLessEqual(len(ranges), chunks)
+            self.assertEqual(ranges[0].start, 0)
+            self.assertEqual(ranges[-1].end, os.path.getsize(self.path))
+
+            for previous, chunk in zip(ranges, ranges[1:]):
+                self.assertEqual(previous.end, chunk.start)
+
+            lines = [line for start, end, _ in ranges for line in iter_lines(self.path, start, end)]
+            self.assertEqual(lines, expected)
+
+        ranges = plan_chunks(self.path, chunk_bytes=1000)
+        self.assertEqual(len(ranges), -(-os.path.getsize(self.path) // 1000))
+        self.assertLessEqual(max(end - start for start, end, _ in ranges), 1000 + 25)
+        self.assertEqual(plan_chunks(self.write('empty.txt', ''), chunks=4), [])
+
+        # Lines end the same as with universal newlines.
+        path = self.write('newlines.txt', 'a\rb\r\n\r\n c \n\rd\r')
+        with open(path) as f:
+            expected = [line.strip() for line in f if line.strip()]
+        self.assertEqual(list(iter_lines(path)), expected)
+        self.assertEqual(expected, ['a', 'b', 'c', 'd'])
+
+        with self.assertRaises(ValueError):
+            plan_chunks(self.path)
+        with self.assertRaises(ValueError):
+            plan_chunks(self.path, chunks=2, chunk_bytes=100)
+        with self.assertRaises(ValueError):
+            plan_chunks(self.path, chunks=0)
+
+    def test_index(self):
+        """Test random access to lines through the index"""
+        index = LineIndex.build(self.path, interval=100)
+        self.assertEqual(len(index), len(LINES))
+        self.assertGreater(len(index._offsets), 100)
+
+        for line in (0, 1, 6, 7, 500, 998, 999, -1):
+            self.assertEqual(index[line], LINES[line].rstrip('\r'))
+        with self.assertRaises(IndexError):
+            index[1000]
+
+        ranges = plan_chunks(self.path, chunks=9, index=index)
+        for chunk, next_chunk in zip(ranges, ranges[1:]):
+            self.assertEqual(index.offset(chunk.first_line), chunk.start)
+            self.assertEqual(index.line_number(chunk.end - 1), next_chunk.first_line - 1)
+
+        index.close()
+        self.assertEqual(len(LineIndex.build(self.write('newline.txt', 'a\n\nb\n'))), 3)
+        self.assertEqual(len(LineIndex.build(self.write('empty.txt', ''))), 0)
+
+    def test_saved_index(self):
+        """Test indexes are saved next to the file and rebuilt when it changes"""
+        index = LineIndex.from_file(self.path, interval=100)
+        self.assertTrue(os.path.exists(self.path + '.idx'))
+
+        with LineIndex.from_file(self.path) as saved:
+            self.assertEqual(saved._offsets, index._offsets)
+            self.assertEqual(saved[999], LINES[999])
+
+        with open(self.path, 'a') as f:
+            f.write('\n3074257bf7194e4000001a86\n')
+
+        with LineIndex.from_file(self.path) as rebuilt:
+            self.assertEqual(len(rebuilt), len(LINES) + 1)
+            self.assertEqual(rebuilt[-1], '3074257bf7194e4000001a86')
+
+        index_path = os.path.join(self.directory, 'reads.index')
+        LineIndex.from_file(self.path, index_path=index_path).close()
+        self.assertTrue(os.path.exists(index_path))
+
+        unwritable = os.path.join(self.directory, 'missing', 'reads.idx')
+        with LineIndex.from_file(self.path, index_path=unwritable) as index:
+            self.assertEqual(len(index), len(LINES) + 1)
+        self.assertFalse(os.path.exists(unwritable))
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ['reads.index', 'reads.txt', 'reads.txt.idx'])
@@ -0,0 +1,89 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from epc.schemes import GIAI, GRAI, SGLN, SGTIN
+from epc.utils.barcode import decode_barcode
+from epc.utils.company_prefix import CompanyPrefixResolver
+
+PREFIX_LIST_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<GCPPrefixFormatList xmlns="urn:gs1:gcp" date="2020-09-01T00:00:00">
+    <entry prefix="0" gcpLength="7"/>
+    <entry prefix="002" gcpLength="7"/>
+    <entry prefix="0614141" gcpLength="7"/>
+    <entry prefix="320" gcpLength="12"/>
+    <entry prefix="3200" gcpLength="8"/>
+    <entry prefix="977" gcpLength="0"/>
+</GCPPrefixFormatList>
+'''
+
+
+class CompanyPrefixResolverTest(TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.xml_path = os.path.join(directory, 'gcpprefixformatlist.xml')
+        with open(self.xml_path, 'w') as xml_file:
+            xml_file.write(PREFIX_LIST_XML)
+
+        self.csv_path = os.path.join(directory, 'gcpprefixformatlist.csv')
+        with open(self.csv_path, 'w') as csv_file:
+            csv_file.write('prefix,gcpLength\n0,7\n002,7\n320,12\n3200,8\n977,0\n')
+
+    def test_lookup(self):
+        """Test longest prefix matching"""
+        for resolver in (
+            CompanyPrefixResolver.from_xml(self.xml_path),
+            CompanyPrefixResolver.from_csv(self.csv_path),
+        ):
+            self.assertEqual(resolver.lookup('0020000000001'), 7)
+            self.assertEqual(resolver.lookup('3200000005000'), 8)
+            self.assertEqual(resolver.lookup('3201000005000'), 12)
+            self.assertIsNone(resolver.lookup('9771234567890'))
+            self.assertIsNone(resolver.lookup('5000000000000'))
+
+    def test_cache(self):
+        """Test the compiled cache is written and reused"""
+        resolver = CompanyPrefixResolver.from_file(self.xml_path)
+        self.assertTrue(os.path.exists(self.xml_path + '.cache'))
+
+        cached = CompanyPrefixResolver.from_file(self.xml_path)
+        self.assertEqual(len(cached), len(resolver))
+        self.assertEqual(cached.lookup('0614141123456'), 7)
+
+        directory = os.path.dirname(self.xml_path)
+        self.assertEqual(sorted(os.listdir(directory)), [
+            'gcpprefixformatlist.csv', 'gcpprefixformatlist.xml', 'gcpprefixformatlist.xml.cache'
+        ])
+
+        unwritable = os.path.join(directory, 'missing', 'prefixes.cache')
+        resolver = CompanyPrefixResolver.from_file(self.xml_path, cache_path=unwritable)
+        self.assertEqual(resolver.lookup('0614141123456'), 7)
+        self.assertFalse(os.path.exists(unwritable))
+
+    def test_decode(self):
+        """Test decoding barcodes without a fixed company prefix length"""
+        resolver = CompanyPrefixResolver.from_file(self.csv_path, cache_path=False)
+
+        tag = decode_barcode('01232000000500002151681623', resolver)
+        self.assertIsInstance(tag, SGTIN)
+        self.assertEqual(tag.pure_identity_uri, 'urn:epc:id:sgtin:32000000.25000.51681623')
+
+        tag = SGTIN()
+        tag.decode_gtin('00020000000015', resolver, serial_number=1)
+        self.assertEqual(tag.pure_identity_uri, 'urn:epc:id:sgtin:0020000.000001.1')
+
+        self.assertEqual(
+            SGLN(barcode='41400200000000082541', company_prefix_length=resolver).pure_identity_uri,
+            'urn:epc:id:sgln:0020000.00000.1'
+        )
+        self.assertEqual(
+            GRAI(barcode='800300020000000008B', company_prefix_length=resolver).pure_identity_uri,
+            'urn:epc:id:grai:0020000.00000.B'
+        )
+        self.assertEqual(
+            GIAI(barcode='800400200001', company_prefix_length=resolver).pure_identity_uri,
+            'urn:epc:id:giai:0020000.1'
+        )
+
+        with self.assertRaises(AttributeError):
+            decode_barcode('01597700000000102151681623', resolver)
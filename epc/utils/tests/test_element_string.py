@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+from epc.schemes import GDTI, GIAI, GRAI, GSRN, SGLN, SGTIN, SSCC
+from epc.utils.element_string import (
+    decode_element_string, decode_element_strings, parse_element_string
+)
+
+
+class ElementStringTest(TestCase):
+    def test_parse(self):
+        """Test parsing raw, FNC1 separated and human readable element strings"""
+        expected = [('01', '00614141123452'), ('17', '251231'), ('21', '400'), ('10', 'AB1')]
+
+        self.assertEqual(parse_element_string('01006141411234521725123121400\x1d10AB1'), expected)
+        self.assertEqual(
+            parse_element_string(']C101006141411234521725123121400\x1d10AB1'), expected
+        )
+        self.assertEqual(
+            parse_element_string('(01) 00614141123452 (17) 251231 (21) 400 (10) AB1'), expected
+        )
+        self.assertEqual(
+            parse_element_string('4140614141123452\x1d25412'),
+            [('414', '0614141123452'), ('254', '12')]
+        )
+
+        self.assertEqual(
+            parse_element_string('(01)00614141123452(21)AB(C)D(10)(1)'),
+            [('01', '00614141123452'), ('21', 'AB(C)D'), ('10', '(1)')]
+        )
+
+        with self.assertRaises(ValueError):
+            parse_element_string('0100614141')
+        with self.assertRaises(ValueError):
+            parse_element_string('(C)D(01)00614141123452')
+        with self.assertRaises(ValueError):
+            parse_element_string('(01)00614141123452(99999)1')
+        with self.assertRaises(ValueError):
+            parse_element_string('21' + '1' * 21)
+
+    def test_decode(self):
+        """Test decoding element strings to tags"""
+        tag = decode_element_string(']d201232000000500002151681623', 8)
+        self.assertIsInstance(tag, SGTIN)
+        self.assertEqual(tag.pure_identity_uri, 'urn:epc:id:sgtin:32000000.25000.51681623')
+
+        for tag in (
+            SGTIN().company_prefix('0020000').item_reference(1).serial_number(1),
+            SGLN().company_prefix('0020000').location_reference(0).extension(1),
+            GRAI().company_prefix('0020000').asset_type(0).serial_number(1),
+            GIAI().company_prefix('0020000').asset_reference(1),
+            SSCC().company_prefix('0020000').serial_reference(1),
+            GDTI().company_prefix('0020000').document_type(1).serial_number(1),
+            GSRN().company_prefix('0020000').service_reference(1),
+        ):
+            self.assertEqual(
+                decode_element_string(tag.barcode_humanized, 7).pure_identity_uri,
+                tag.pure_identity_uri
+            )
+
+        # Elements are used as parsed, in any order.
+        tag = decode_element_string('(21) AB(C)D (01) 00614141123452', 7)
+        self.assertEqual(tag.tag_uri, 'urn:epc:tag:sgtin-198:0.0614141.012345.AB(C)D')
+
+        tag = decode_element_string('4140020000000008', 7)
+        self.assertEqual(tag.pure_identity_uri, 'urn:epc:id:sgln:0020000.00000.0')
+
+        with self.assertRaises(ValueError):
+            decode_element_string('0100020000000015', 7)
+        with self.assertRaises(NotImplementedError):
+            decode_element_string('(02)00020000000015', 7)
+
+    def test_batch(self):
+        """Test bulk decoding of scanner output"""
+        lines = ['0100020000000015211\n', '\n', '0100020000000016211\n', '8004002000012\n']
+
+        tags = list(decode_element_strings(lines, 7, raise_exception=False))
+        self.assertEqual(len(tags), 3)
+        self.assertIsNone(tags[1])
+        self.assertEqual(str(tags[2]), 'urn:epc:id:giai:0020000.12')
+
+        with self.assertRaises(AttributeError):
+            list(decode_element_strings(lines, 7))
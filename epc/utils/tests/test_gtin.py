@@ -0,0 +1,73 @@
+import io
+from unittest import TestCase, skipIf
+
+from epc.utils.gtin import (
+    GTIN_EMPTY, GTIN_INVALID_CHECK_DIGIT, GTIN_INVALID_LENGTH, GTIN_NOT_NUMERIC, GTIN_OK,
+    normalize_gtin, normalize_gtin_csv, normalize_gtins
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+GTINS = ['96385074', '036000291452', ' 4006381333931 ', '00614141123452', '', '0061414112345A',
+         '123456789', '00614141123453', 36000291452]
+NORMALIZED = ['00000096385074', '00036000291452', '04006381333931', '00614141123452', None,
+              None, None, None, '00036000291452']
+CODES = [GTIN_OK, GTIN_OK, GTIN_OK, GTIN_OK, GTIN_EMPTY, GTIN_NOT_NUMERIC, GTIN_INVALID_LENGTH,
+         GTIN_INVALID_CHECK_DIGIT, GTIN_OK]
+
+
+class GTINNormalizationTest(TestCase):
+    def test_normalize(self):
+        """Test GTIN normalization and result codes"""
+        self.assertEqual(normalize_gtin('036000291452'), ('00036000291452', GTIN_OK))
+        self.assertEqual(normalize_gtin(None), (None, GTIN_EMPTY))
+
+        normalized, codes = normalize_gtins(iter(GTINS))
+        self.assertEqual(normalized, NORMALIZED)
+        self.assertEqual(codes.tolist(), CODES)
+
+    @skipIf(numpy is None, 'NumPy is not installed')
+    def test_normalize_array(self):
+        """Test vectorized GTIN normalization"""
+        normalized, codes = normalize_gtins(numpy.array(GTINS[:-1]))
+        self.assertEqual(normalized.tolist(), [gtin or '' for gtin in NORMALIZED[:-1]])
+        self.assertEqual(codes.tolist(), CODES[:-1])
+
+        normalized, codes = normalize_gtins(numpy.array([96385074, 614141123452, 614141123453]))
+        self.assertEqual(normalized.tolist(), ['00000096385074', '00614141123452', ''])
+        self.assertEqual(codes.tolist(), [GTIN_OK, GTIN_OK, GTIN_INVALID_CHECK_DIGIT])
+
+    @skipIf(numpy is None, 'NumPy is not installed')
+    def test_paths_agree(self):
+        """Test rows get the same result from the row by row and vectorized paths"""
+        rows = ['00614141123452', '\u0660\u0660\u0666\u0661\u0664\u0661\u0664\u0661'
+                '\u0661\u0662\u0663\u0664\u0665\u0662', '\u00b2' * 14, None, '', ' ',
+                ' 614141123452 ', '0061414112345A', '00614141123453', 614141123452]
+
+        normalized, codes = normalize_gtins(rows)
+        array_normalized, array_codes = normalize_gtins(numpy.array(rows, dtype=object))
+        self.assertEqual(array_codes.tolist(), codes.tolist())
+        self.assertEqual(array_normalized.tolist(), [gtin or '' for gtin in normalized])
+        self.assertEqual(codes.tolist(), [
+            GTIN_OK, GTIN_NOT_NUMERIC, GTIN_NOT_NUMERIC, GTIN_EMPTY, GTIN_EMPTY, GTIN_EMPTY,
+            GTIN_OK, GTIN_NOT_NUMERIC, GTIN_INVALID_CHECK_DIGIT, GTIN_OK
+        ])
+
+        normalized, codes = normalize_gtins(numpy.array(rows[:3]))
+        self.assertEqual(codes.tolist(), [GTIN_OK, GTIN_NOT_NUMERIC, GTIN_NOT_NUMERIC])
+
+    def test_csv(self):
+        """Test streaming CSV normalization"""
+        in_file = io.StringIO('sku,gtin\nA,036000291452\nB,00614141123453\nC\n')
+        out_file = io.StringIO()
+
+        counts = normalize_gtin_csv(in_file, out_file, column=1, chunk_size=1)
+        self.assertEqual(counts[GTIN_OK], 1)
+        self.assertEqual(counts[GTIN_INVALID_CHECK_DIGIT], 1)
+        self.assertEqual(counts[GTIN_EMPTY], 1)
+        self.assertEqual(out_file.getvalue().splitlines(), [
+            'sku,gtin,gtin_result', 'A,00036000291452,0', 'B,00614141123453,4', 'C,1',
+        ])
@@ -0,0 +1,75 @@
+import io
+import json
+from unittest import TestCase
+
+from epc.schemes import SGTIN
+from epc.utils import decode_epc
+from epc.utils.jsonl import from_jsonl, to_jsonl, write_jsonl
+
+TAGS = [
+    '3074257bf7194e4000001a85',
+    '3618000040000050a24a993a852a95ac5ab97b062c8000000000',
+    '3274257bf7194e4000001a85',
+    '39180000400002851254c9d42954ad62d5cbd831640000000000',
+    '3314257bf7194e4000001a85',
+    '3718000040000050a24a993a852a95ac5ab97b062c80',
+    '3474257bf7194e4000001a85',
+    '3818000069d4ab5abd8b36afe1c58f265cd9f469d5af66dddbc0',
+    '3514257bf7194e4000001a85',
+    '3174257bf4499602d2000000',
+    '2c74257bf460720000000190',
+    '3a14257bf46072000000000013c58000',
+    '2d74257bf4499602d2000000',
+]
+
+
+class JSONLinesTest(TestCase):
+    def setUp(self):
+        self.tags = [decode_epc(hex_string) for hex_string in TAGS]
+
+    def test_to_jsonl(self):
+        """Test records match JSON encoded tag values"""
+        self.assertEqual(to_jsonl(self.tags), ''.join(
+            json.dumps(dict(encoding=tag.encoding, **tag.values)) + '\n' for tag in self.tags
+        ))
+        self.assertEqual(
+            to_jsonl(self.tags[:1]),
+            '{"encoding": "sgtin-96", "size": 96, "filter": 3, "company_prefix": "0614141", '
+            '"item_reference": 812345, "serial_number": 6789}\n'
+        )
+
+        with self.assertRaises(AttributeError):
+            to_jsonl([SGTIN()])
+
+    def test_write_jsonl(self):
+        """Test writing records to a stream in chunks"""
+        output = io.StringIO()
+        self.assertEqual(write_jsonl(iter(self.tags), output, chunk_size=5), len(TAGS))
+        self.assertEqual(output.getvalue(), to_jsonl(self.tags))
+
+    def test_from_jsonl(self):
+        """Test reading records back, validated and trusted"""
+        text = to_jsonl(self.tags)
+
+        for trusted in (False, True):
+            tags = from_jsonl(io.StringIO(text + '\n'), trusted=trusted)
+            self.assertEqual(['{:x}'.format(int(tag)).zfill(len(hex_string))
+                              for tag, hex_string in zip(tags, TAGS)], TAGS)
+            self.assertEqual([tag.tag_uri for tag in tags], [tag.tag_uri for tag in self.tags])
+            self.assertEqual(to_jsonl(tags), text)
+
+    def test_from_jsonl_invalid(self):
+        """Test reading invalid records"""
+        record = json.loads(to_jsonl(self.tags[:1]))
+
+        with self.assertRaises(ValueError):
+            from_jsonl('{"encoding": "sgtin-64"}')
+        with self.assertRaises(ValueError):
+            from_jsonl('{"encoding"')
+        with self.assertRaises(KeyError):
+            from_jsonl('{"encoding": "sgtin-96", "size": 96}')
+
+        record['filter'] = 8
+        with self.assertRaises(AttributeError):
+            from_jsonl(json.dumps(record))
+        self.assertEqual(from_jsonl(json.dumps(record), trusted=True)[0]._tag_filter, 8)
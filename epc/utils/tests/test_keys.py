@@ -0,0 +1,72 @@
+from unittest import TestCase
+
+from epc.schemes import GRAI
+from epc.utils import decode_epc
+from epc.utils.keys import KEY_SIZE, decode_key, encode_key, encode_keys
+
+TAGS = [
+    '3074257bf7194e4000001a85',
+    '3618000040000050a24a993a852a95ac5ab97b062c8000000000',
+    '3614013880000058800000000000000000000000000000000000',
+    '3718000040000050a24a993a852a95ac5ab97b062c80',
+    '3818000069d4ab5abd8b36afe1c58f265cd9f469d5af66dddbc0',
+    '39105e30a70003061438916347912654b993674fa146953a8000',
+    '3314257bf7194e4000001a85',
+    '3474257bf7194e4000001a85',
+    '3514257bf7194e4000001a85',
+    '3174257bf4499602d2000000',
+    '2c74257bf460720000000190',
+    '2d74257bf4499602d2000000',
+    '3274257bf7194e4000001a85',
+]
+
+
+class KeysTest(TestCase):
+    def test_round_trip(self):
+        """Test keys decode to the pure identity of their tag"""
+        for hex_string in TAGS:
+            tag = decode_epc(hex_string)
+            key = encode_key(tag)
+
+            self.assertEqual(len(key), KEY_SIZE)
+            self.assertEqual(decode_key(key).pure_identity_uri, tag.pure_identity_uri)
+
+        self.assertEqual(decode_key(encode_key(decode_epc(TAGS[2]))).encoding, 'sgtin-96')
+        self.assertEqual(decode_key(encode_key(decode_epc(TAGS[1]))).encoding, 'sgtin-198')
+
+    def test_large_serial(self):
+        """Test keys of numeric serials too large for 96 bits decode to the large encoding"""
+        for hex_string in (
+            '3a14257bf46072c790e65d7aa5c38000',
+            '3814257bf5cb972e5cb972e5cb972e5cb972e5cb972e5cb90000',
+        ):
+            tag = decode_epc(hex_string)
+            decoded = decode_key(encode_key(tag))
+
+            self.assertEqual(decoded.encoding, tag.encoding)
+            self.assertEqual('{:x}'.format(int(decoded)), hex_string)
+
+    def test_identity(self):
+        """Test keys ignore filter and tag size"""
+        tag = GRAI().company_prefix('0614141').asset_type('12345').serial_number(6789)
+        large = GRAI().company_prefix('0614141').asset_type('12345').serial_number('6789')
+
+        large.filter(6).tag_size(GRAI.SIZE_170)
+
+        self.assertEqual(encode_key(tag.filter(1)), encode_key(large))
+        self.assertNotEqual(encode_key(tag), encode_key(large.serial_number('06789')))
+
+    def test_order(self):
+        """Test keys sort like their tags"""
+        tags = [decode_epc(hex_string) for hex_string in TAGS]
+        keys = encode_keys(tags)
+
+        self.assertEqual(keys, [encode_key(tag) for tag in tags])
+        self.assertEqual([decode_key(key) for key in sorted(keys)], sorted(tags))
+
+    def test_invalid(self):
+        """Test decoding invalid keys"""
+        with self.assertRaises(ValueError):
+            decode_key(b'\x00' * (KEY_SIZE - 1))
+        with self.assertRaises(ValueError):
+            decode_key(b'\x00' * KEY_SIZE)
@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+from epc.schemes import GIAI, GRAI, SGLN, SGTIN
+from epc.utils import decode_epc
+from epc.utils.company_prefix import CompanyPrefixResolver
+from epc.utils.ranges import giai_ranges, grai_ranges, range_parts, sgln_ranges, sgtin_ranges
+
+
+class RangesTest(TestCase):
+    def assertCovers(self, ranges, tag, tag_filter):
+        """Check only the range of the tag's filter contains the tag"""
+        value = int(tag)
+        self.assertEqual([lo <= value <= hi for lo, hi in ranges],
+                         [f == tag_filter for f in range(8)])
+
+    def test_sgtin_ranges(self):
+        """Test SGTIN-96 ranges of a GTIN"""
+        ranges = sgtin_ranges('00614141123452', 7)
+
+        self.assertEqual(len(ranges), 8)
+        self.assertEqual(ranges[3], (0x3074257bf40c0e4000000000, 0x3074257bf40c0e7fffffffff))
+        self.assertEqual(ranges, sorted(ranges))
+
+        tag = SGTIN()
+        tag.decode_gtin('00614141123452', 7, 6789)
+        self.assertCovers(ranges, tag.filter(3), 3)
+        self.assertEqual(decode_epc(ranges[3][1]).pure_identity_uri,
+                         'urn:epc:id:sgtin:0614141.012345.274877906943')
+
+        # A GTIN with another company prefix length has other ranges.
+        tag.decode_gtin('00614141812349', 8)
+        self.assertCovers(ranges, tag.filter(3), None)
+
+        resolver = CompanyPrefixResolver({'0614141': 7})
+        self.assertEqual(sgtin_ranges('00614141123452', resolver, [3]), [ranges[3]])
+        self.assertEqual(sgtin_ranges('614141123452', 7, [1, 3]), [ranges[1], ranges[3]])
+
+        with self.assertRaises(AttributeError):
+            sgtin_ranges('00614141123453', 7)
+
+    def test_sgln_ranges(self):
+        """Test SGLN-96 ranges of a GLN"""
+        ranges = sgln_ranges('0614141123452', 7)
+        self.assertEqual(ranges[3], (0x3274257bf460720000000000, 0x3274257bf46073ffffffffff))
+
+        tag = SGLN()
+        tag.decode_barcode('41406141411234522545678', 7)
+        self.assertCovers(ranges, tag.filter(3), 3)
+
+        with self.assertRaises(ValueError):
+            sgln_ranges('061414112345', 7)
+
+    def test_grai_ranges(self):
+        """Test GRAI-96 ranges of an asset type"""
+        ranges = grai_ranges('00614141123452', 7)
+
+        tag = GRAI()
+        tag.decode_barcode('8003006141411234525678', 7)
+        self.assertCovers(ranges, tag.filter(6), 6)
+
+        tag.decode_barcode('8003006141411234695678', 7)
+        self.assertCovers(ranges, tag.filter(6), None)
+
+    def test_giai_ranges(self):
+        """Test GIAI-96 ranges of a company prefix"""
+        ranges = giai_ranges('0614141')
+        self.assertEqual(ranges[3], (0x3474257bf400000000000000, 0x3474257bf7ffffffffffffff))
+
+        tag = GIAI().company_prefix('0614141').asset_reference(12345678)
+        self.assertCovers(ranges, tag.filter(3).tag_size(96), 3)
+
+        tag.company_prefix('06141410')
+        self.assertCovers(ranges, tag, None)
+
+        with self.assertRaises(AttributeError):
+            giai_ranges('06141')
+
+    def test_range_parts(self):
+        """Test splitting ranges into 64 bit parts"""
+        ranges = sgtin_ranges('00614141123452', 7, [3])
+        tag = SGTIN()
+        tag.decode_gtin('00614141123452', 7, 6789)
+        high, low = tag.filter(3).to_parts()
+
+        (lo, hi), = range_parts(ranges)
+        self.assertEqual(lo, (0x3074257b, 0xf40c0e4000000000))
+        self.assertTrue(lo <= (high, low) <= hi)
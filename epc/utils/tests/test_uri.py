@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+from epc.schemes import GDTI, GIAI, GID, GRAI, GSRN, SGLN, SGTIN, SSCC
+from epc.utils.uri import decode_uri
+
+
+class DecodeURITest(TestCase):
+    def test_tag_uri(self):
+        """Test tag URIs round trip for each scheme and size"""
+        tags = [
+            GID().manager_number(31231).object_class(11).serial_number(12),
+            SGTIN().filter(3).company_prefix('0614141').item_reference(812345).serial_number(6789),
+            SGTIN().tag_size(SGTIN.SIZE_198).company_prefix('0614141').item_reference(
+                812345).serial_number('a/b%'),
+            SGLN().company_prefix('061414112345').location_reference(0).extension(5),
+            SGLN().tag_size(SGLN.SIZE_195).company_prefix('0614141').location_reference(
+                12345).extension('ext'),
+            GRAI().company_prefix('0614141').asset_type(12345).serial_number(400),
+            GRAI().tag_size(GRAI.SIZE_170).company_prefix('0614141').asset_type(
+                12345).serial_number('x1'),
+            GIAI().filter(1).company_prefix('0614141').asset_reference(12345),
+            GIAI().tag_size(GIAI.SIZE_202).company_prefix('0614141').asset_reference('a.1'),
+            SSCC().filter(2).company_prefix('0614141').serial_reference(1234567890),
+            GDTI().company_prefix('061414112345').document_type(0).serial_number(400),
+            GDTI().tag_size(GDTI.SIZE_113).company_prefix('0614141').document_type(
+                12345).serial_number('0400'),
+            GSRN().company_prefix('0614141').service_reference(1234567890),
+        ]
+
+        for tag in tags:
+            decoded = decode_uri(tag.tag_uri)
+            self.assertEqual(type(decoded), type(tag))
+            self.assertEqual(int(decoded), int(tag), tag.tag_uri)
+
+    def test_pure_identity_uri(self):
+        """Test pure identity URIs choose the tag size from the final field"""
+        tag = decode_uri('urn:epc:id:sgtin:0614141.812345.6789')
+        self.assertEqual(tag.tag_uri, 'urn:epc:tag:sgtin-96:0.0614141.812345.6789')
+
+        tag = decode_uri('urn:epc:id:sgtin:0614141.812345.06789')
+        self.assertEqual(tag.tag_uri, 'urn:epc:tag:sgtin-198:0.0614141.812345.06789')
+
+        tag = decode_uri('urn:epc:id:gdti:0614141.12345.006847')
+        self.assertEqual(tag.tag_uri, 'urn:epc:tag:gdti-113:0.0614141.12345.006847')
+
+        tag = decode_uri('urn:epc:id:sscc:0614141.0234567890')
+        self.assertEqual(tag.tag_uri, 'urn:epc:tag:sscc-96:0.0614141.0234567890')
+
+        # Numeric serial numbers too large for the 96 bit encoding.
+        tag = decode_uri('urn:epc:id:gdti:0614141.12345.12345678901234567')
+        self.assertEqual(tag.tag_uri, 'urn:epc:tag:gdti-113:0.0614141.12345.12345678901234567')
+
+        tag = decode_uri('urn:epc:id:giai:0614141.9999999999999999999999')
+        self.assertEqual(tag.tag_uri, 'urn:epc:tag:giai-202:0.0614141.9999999999999999999999')
+
+        tag = decode_uri('urn:epc:id:giai:0614141.288230376151711743')
+        self.assertEqual(tag.tag_uri, 'urn:epc:tag:giai-96:0.0614141.288230376151711743')
+
+    def test_invalid(self):
+        """Test invalid and unsupported URIs"""
+        with self.assertRaises(ValueError):
+            decode_uri('0614141.812345.6789')
+        with self.assertRaises(ValueError):
+            decode_uri('urn:epc:id:sgtin:0614141.812345')
+        with self.assertRaises(NotImplementedError):
+            decode_uri('urn:epc:tag:sgtin-97:0.0614141.812345.6789')
+        with self.assertRaises(NotImplementedError):
+            decode_uri('urn:epc:id:usdod:CAGE.1')
+        with self.assertRaises(AttributeError):
+            decode_uri('urn:epc:tag:sgtin-96:0.0614141.812345.abc')
@@ -0,0 +1,92 @@
+import random
+from unittest import TestCase
+
+from epc.schemes import GDTI, GIAI, SGLN, SGTIN, SSCC
+from epc.utils import decode_epc
+from epc.utils.validation import (
+    EPC_INVALID_CHARACTER, EPC_INVALID_LENGTH, EPC_INVALID_PARTITION, EPC_INVALID_VALUE, EPC_OK,
+    EPC_UNKNOWN_HEADER, Diagnostics, try_decode, try_decode_epcs, validate, validate_epcs
+)
+
+SGTIN_96 = '3074257bf7194e4000001a85'
+SGTIN_198 = '3614257bf7194e70e25ac5900000000000000000000000000000'
+GIAI_202 = '3814257bf70ae620000000000000000000000000000000000000'
+
+INVALID = [
+    ('', EPC_INVALID_LENGTH),
+    ('3074257bf7194e4000001a', EPC_UNKNOWN_HEADER),
+    ('3074257bf7194e4000001a8g', EPC_INVALID_CHARACTER),
+    ('2f74257bf7194e4000001a85', EPC_UNKNOWN_HEADER),
+    ('307e257bf7194e4000001a85', EPC_INVALID_PARTITION),
+    ('3614257bf7194e7fe25ac5900000000000000000000000000000', EPC_INVALID_CHARACTER),
+    ('3074257bf7194e4000001a85' + '0000', EPC_INVALID_LENGTH),
+    ('3a14257bf46072000000000000000000', EPC_INVALID_VALUE),
+]
+
+
+class ValidationTest(TestCase):
+    def test_validate(self):
+        """Test result codes for valid and invalid tags"""
+        for hex_string in (SGTIN_96, '0x' + SGTIN_96, SGTIN_198, GIAI_202,
+                           '3500079ff00000b00000000c'):
+            self.assertEqual(validate(hex_string), EPC_OK, hex_string)
+
+        for hex_string, code in INVALID:
+            self.assertEqual(validate(hex_string), code, hex_string)
+
+    def test_try_decode(self):
+        """Test decoding without exceptions"""
+        code, tag = try_decode(SGTIN_96)
+        self.assertEqual(code, EPC_OK)
+        self.assertEqual(tag.pure_identity_uri, 'urn:epc:id:sgtin:0614141.812345.6789')
+
+        self.assertEqual(try_decode('307e257bf7194e4000001a85'), (EPC_INVALID_PARTITION, None))
+
+    def test_matches_decode(self):
+        """Test tags that validate can be decoded, and tags that fail decoding don't validate"""
+        rng = random.Random(34)
+        tags = [
+            SGTIN().company_prefix('0614141').item_reference(812345).serial_number(6789),
+            SGTIN().tag_size(SGTIN.SIZE_198).company_prefix('0614141').item_reference(
+                812345).serial_number('ab-12'),
+            SGLN().tag_size(SGLN.SIZE_195).company_prefix('0614141').location_reference(
+                12345).extension('ext'),
+            GIAI().tag_size(GIAI.SIZE_202).company_prefix('0614141').asset_reference('a.1'),
+            SSCC().company_prefix('0614141').serial_reference(1234567890),
+            GDTI().tag_size(GDTI.SIZE_113).company_prefix('0614141').document_type(
+                12345).serial_number('006847'),
+        ]
+
+        for tag in tags:
+            hex_string = '{:x}'.format(int(tag))
+            for _ in range(200):
+                corrupted = '{:0{}x}'.format(
+                    int(hex_string, 16) ^ (1 << rng.randrange(len(hex_string) * 4)),
+                    len(hex_string)
+                )
+                try:
+                    decode_epc(corrupted)
+                    decodes = True
+                except (NotImplementedError, ValueError):
+                    decodes = False
+
+                if validate(corrupted) == EPC_OK:
+                    self.assertTrue(decodes, corrupted)
+                elif not decodes:
+                    self.assertIsNone(try_decode(corrupted)[1])
+
+    def test_batch(self):
+        """Test batch validation and sampled diagnostics"""
+        hex_strings = [SGTIN_96] + [hex_string for hex_string, _ in INVALID]
+        diagnostics = Diagnostics(sample_size=2, sample_every=2)
+
+        codes = validate_epcs(hex_strings, diagnostics)
+        self.assertEqual(codes.tolist(), [EPC_OK] + [code for _, code in INVALID])
+        self.assertEqual(diagnostics.counts[EPC_INVALID_LENGTH], 2)
+        self.assertEqual(list(diagnostics.samples), [INVALID[4], INVALID[6]])
+        self.assertEqual(diagnostics.summary()[0], (EPC_OK, 'Valid', 1))
+
+        tags, codes = try_decode_epcs(hex_strings[:2])
+        self.assertEqual(tags[0].values['serial_number'], 6789)
+        self.assertIsNone(tags[1])
+        self.assertEqual(codes.tolist(), [EPC_OK, EPC_INVALID_LENGTH])
@@ -1,19 +1,12 @@
 import re
 
+from epc.encoding import check_digit
+
 GTIN_MATCH = re.compile(r'^\d{8}$|^\d{12,14}$')
 
 
 def calc_check_digit(upc_string):
-    evens = []
-    odds = []
-
-    for i, char in enumerate(upc_string):
-        if (i + 2) % 2 == 0:
-            evens.append(int(char))
-        else:
-            odds.append(int(char))
-
-    return (10 - (((3 * sum(evens)) + sum(odds)) % 10)) % 10
+    return check_digit.calc_check_digit(upc_string)
 
 
 def is_valid_upc(upc_string):
@@ -22,4 +15,4 @@ def is_valid_upc(upc_string):
     if not match:
         return False
 
-    return calc_check_digit(upc_string[:-1]) == int(upc_string[-1])
+    return check_digit.is_valid_check_digit(upc_string)
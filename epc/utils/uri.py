@@ -0,0 +1,92 @@
+from urllib.parse import unquote
+
+from epc import schemes
+
+uri_scheme_map = {
+    # URI Scheme: (Scheme, URI Fields (excluding the filter))
+    'sgtin': ('SGTIN', ('company_prefix', 'item_reference', 'serial_number')),
+    'sgln': ('SGLN', ('company_prefix', 'location_reference', 'extension')),
+    'grai': ('GRAI', ('company_prefix', 'asset_type', 'serial_number')),
+    'giai': ('GIAI', ('company_prefix', 'asset_reference')),
+    'gid': ('GID', ('manager_number', 'object_class', 'serial_number')),
+    'sscc': ('SSCC', ('company_prefix', 'serial_reference')),
+    'gdti': ('GDTI', ('company_prefix', 'document_type', 'serial_number')),
+    'gsrn': ('GSRN', ('company_prefix', 'service_reference')),
+}
+
+_numeric_fields = frozenset((
+    'item_reference', 'location_reference', 'asset_type', 'document_type', 'serial_reference',
+    'service_reference',
+))
+
+
+def decode_uri(uri):
+    """
+    Decode a tag URI or pure identity URI to an EPC tag. Returns a tag object if successful.
+
+    Tag URIs (``urn:epc:tag:sgtin-96:3.0614141.812345.6789``) specify the filter and tag size.
+    Pure identity URIs (``urn:epc:id:sgtin:0614141.812345.6789``) use the ``FILTER_ALL``
+    filter, and the 96 bit encoding unless the serial number or final field is alphanumeric,
+    has leading zeros or doesn't fit in 96 bits.
+
+    :param uri: Tag URI or pure identity URI.
+    :type uri: str
+
+    :raises ValueError: Input is not an EPC URI.
+    :raises NotImplementedError: Scheme not implemented for URI.
+    :raises AttributeError: URI values are invalid for the scheme.
+
+    :returns: EPC tag object
+    :rtype: object
+    """
+    parts = uri.split(':', 4)
+    if len(parts) != 5 or parts[0] != 'urn' or parts[1] != 'epc' or parts[2] not in ('id', 'tag'):
+        raise ValueError('`%s` is not an EPC tag or pure identity URI' % uri)
+
+    is_tag_uri = parts[2] == 'tag'
+    encoding = parts[3]
+    uri_scheme = encoding.split('-', 1)[0]
+
+    try:
+        scheme_name, fields = uri_scheme_map[uri_scheme]
+    except KeyError:
+        raise NotImplementedError('Scheme not implemented for %s' % encoding)
+
+    cls = getattr(schemes, scheme_name)
+    has_filter = hasattr(cls, 'filter')
+    values = parts[4].split('.', len(fields) - 1 + (is_tag_uri and has_filter))
+
+    if len(values) != len(fields) + (is_tag_uri and has_filter):
+        raise ValueError('`%s` does not have the expected number of fields' % uri)
+
+    tag = cls()
+
+    if is_tag_uri:
+        if encoding not in cls.ENCODINGS:
+            raise NotImplementedError('Scheme not implemented for %s' % encoding)
+        tag.tag_size(cls.TAG_SIZES[cls.ENCODINGS.index(encoding)])
+
+        if has_filter:
+            tag_filter = values.pop(0)
+            if not tag_filter.isdigit():
+                raise AttributeError('Filter must be an integer')
+            tag.filter(int(tag_filter))
+    elif encoding != uri_scheme:
+        raise ValueError('`%s` is not an EPC tag or pure identity URI' % uri)
+    else:
+        tag.tag_size(cls._identity_size(values[-1], len(values[0])))
+
+    for field, value in zip(fields, values):
+        if field in _numeric_fields:
+            value = value or '0'
+        elif field != 'company_prefix':
+            if tag._tag_size == cls.SIZE_96:
+                if not value.isdigit():
+                    raise AttributeError('%s must be an integer' % field)
+                value = int(value)
+            else:
+                value = unquote(value)
+
+        getattr(tag, field)(value)
+
+    return tag
@@ -0,0 +1,295 @@
+"""
+Validate and decode EPC hex strings without raising exceptions.
+
+Tags are checked with integer operations before any decoding is attempted, in the same order
+as the schemes' ``decode_epc()``: length, header, partition and character data. The
+first failing check is reported as one of the ``EPC_*`` result codes, so corrupted reads cost
+about the same as valid ones.
+
+Unlike :func:`epc.utils.decode_epc`, tags whose bit length doesn't match the encoding named by
+their header are rejected.
+"""
+from array import array
+from collections import deque
+
+from epc import utils
+from epc.encoding.string import _hex_map
+
+EPC_OK = 0
+EPC_UNKNOWN_HEADER = 1
+EPC_INVALID_LENGTH = 2
+EPC_INVALID_PARTITION = 3
+# Reserved, every filter value is valid for the supported schemes.
+EPC_INVALID_FILTER = 4
+EPC_INVALID_CHARACTER = 5
+EPC_INVALID_VALUE = 6
+
+EPC_RESULTS = (
+    (EPC_OK, 'Valid'),
+    (EPC_UNKNOWN_HEADER, 'Unknown or unsupported header'),
+    (EPC_INVALID_LENGTH, 'Bit length does not match the encoding'),
+    (EPC_INVALID_PARTITION, 'Invalid partition value'),
+    (EPC_INVALID_FILTER, 'Invalid filter value'),
+    (EPC_INVALID_CHARACTER, 'Non-hexadecimal input, or a character that cannot be decoded'),
+    (EPC_INVALID_VALUE, 'Unable to decode'),
+)
+
+_hex_characters = frozenset('0123456789abcdefABCDEF')
+_decodable = frozenset(_hex_map)
+
+
+def _fixed_string(start, length):
+    return {partition: (start, length) for partition in range(7)}
+
+
+def _giai_202_strings():
+    from epc.schemes.GIAI import _giai_202_partition_table
+
+    return {
+        partition: (14 + prefix_bit_length, asset_bit_length)
+        for partition, (prefix_bit_length, _, asset_bit_length)
+        in _giai_202_partition_table.items()
+    }
+
+
+_encodings = {
+    # Header: (Tag Size (bits), Has Filter and Partition, String Positions by Partition)
+    0x30: (96, True, None),
+    0x36: (208, True, lambda: _fixed_string(58, 140)),
+    0x32: (96, True, None),
+    0x39: (208, True, lambda: _fixed_string(55, 153)),
+    0x33: (96, True, None),
+    0x37: (176, True, lambda: _fixed_string(58, 112)),
+    0x34: (96, True, None),
+    0x38: (208, True, _giai_202_strings),
+    0x35: (96, False, None),
+    0x31: (96, True, None),
+    0x2C: (96, True, None),
+    0x3A: (128, True, None),
+    0x2D: (96, True, None),
+}
+
+_numeric_strings = {
+    # Header: (Numeric String Shift, Numeric String Length (bits))
+    0x3A: (15, 58),
+}
+
+# Header: (Tag Size, Partition: (String Start, String Length)), built on first use.
+_layouts = {}
+
+
+def _layout(header):
+    layout = _layouts.get(header)
+    if layout is not None or header in _layouts:
+        return layout
+
+    encoding = _encodings.get(header)
+    if encoding is not None:
+        tag_size, has_partition, strings = encoding
+        partitions = None
+
+        if has_partition:
+            partitions = strings() if strings else _fixed_string(0, 0)
+
+        layout = (tag_size, partitions)
+
+    _layouts[header] = layout
+    return layout
+
+
+def _check(hex_string):
+    if isinstance(hex_string, int):
+        tag_data = hex_string
+        if tag_data < 0:
+            return EPC_INVALID_VALUE, None
+    else:
+        if hex_string[:2] in ('0x', '0X'):
+            hex_string = hex_string[2:]
+
+        if not hex_string:
+            return EPC_INVALID_LENGTH, None
+        if not _hex_characters.issuperset(hex_string):
+            return EPC_INVALID_CHARACTER, None
+
+        tag_data = int(hex_string, 16)
+
+    tag_length = tag_data.bit_length()
+
+    # Pad the length to multiples of 16, per the EPC Tag Data Standard
+    if tag_length % 16 != 0:
+        tag_length += 16 - tag_length % 16
+    if tag_length == 0:
+        return EPC_UNKNOWN_HEADER, None
+
+    header = tag_data >> (tag_length - 8)
+    layout = _layout(header)
+    if layout is None:
+        if header in utils.epc_encoding_map:
+            # Registered scheme without a known layout, checked by decoding.
+            return EPC_OK, header
+        return EPC_UNKNOWN_HEADER, header
+
+    tag_size, partitions = layout
+    if tag_length != tag_size:
+        return EPC_INVALID_LENGTH, header
+
+    if partitions is None:
+        return EPC_OK, header
+
+    strings = partitions.get((tag_data >> (tag_size - 14)) & 0x7)
+    if strings is None:
+        return EPC_INVALID_PARTITION, header
+
+    start, length = strings
+    if length:
+        end = start + length
+
+        # Same 7 bit chunks as decode_string(), the string ends at the first zero character.
+        for position in range(start, end, 7):
+            bits = min(7, end - position)
+            character = (tag_data >> (tag_size - position - bits)) & ((1 << bits) - 1)
+            if character == 0:
+                break
+            if character not in _decodable:
+                return EPC_INVALID_CHARACTER, header
+
+    numeric_string = _numeric_strings.get(header)
+    if numeric_string is not None:
+        # Numeric strings are encoded with a leading 1 digit, which keeps their leading zeros.
+        shift, bit_length = numeric_string
+        digits = str(tag_data >> shift & ((1 << bit_length) - 1))
+        if digits[0] != '1' or len(digits) == 1:
+            return EPC_INVALID_VALUE, header
+
+    return EPC_OK, header
+
+
+def validate(hex_string):
+    """
+    Check that a hex string can be decoded, without decoding it.
+
+    :param hex_string: Hexadecimal EPC tag data, or the tag data as an integer.
+    :type hex_string: str, int
+
+    :return: An ``EPC_*`` result code.
+    :rtype: int
+    """
+    return _check(hex_string)[0]
+
+
+def try_decode(hex_string):
+    """
+    Decode a hex string to an EPC tag, returning a result code instead of raising.
+
+    :param hex_string: Hexadecimal EPC tag data, or the tag data as an integer.
+    :type hex_string: str, int
+
+    :return: Tuple of an ``EPC_*`` result code and the tag object (``None`` if invalid).
+    :rtype: tuple
+    """
+    code, header = _check(hex_string)
+    if code != EPC_OK:
+        return code, None
+
+    cls = utils.epc_encoding_map[header]
+    if _layouts[header] is not None:
+        return EPC_OK, cls(epc=hex_string)
+
+    try:
+        return EPC_OK, cls(epc=hex_string)
+    except (AttributeError, LookupError, NotImplementedError, ValueError):
+        return EPC_INVALID_VALUE, None
+
+
+class Diagnostics:
+    """
+    Count result codes and keep a sample of failing inputs from batch validation.
+
+    :param sample_size: Maximum number of failures kept, the oldest are dropped first.
+        Defaults to ``100``.
+    :type sample_size: int, optional
+
+    :param sample_every: Keep one in every ``sample_every`` failures. Defaults to ``1``.
+    :type sample_every: int, optional
+    """
+
+    def __init__(self, sample_size=100, sample_every=1):
+        self.counts = {code: 0 for code, _ in EPC_RESULTS}
+        self.samples = deque(maxlen=sample_size)
+        self.sample_every = sample_every
+        self._failures = 0
+
+    def record(self, hex_string, code):
+        """
+        Record the result code of one input.
+        """
+        self.counts[code] += 1
+
+        if code != EPC_OK:
+            if self._failures % self.sample_every == 0:
+                self.samples.append((hex_string, code))
+            self._failures += 1
+
+    def summary(self):
+        """
+        :return: ``(code, description, count)`` tuples for every result code seen.
+        :rtype: list
+        """
+        return [
+            (code, description, self.counts[code])
+            for code, description in EPC_RESULTS if self.counts[code]
+        ]
+
+
+def validate_epcs(hex_strings, diagnostics=None):
+    """
+    Validate many hex strings.
+
+    :param hex_strings: Hexadecimal EPC tag data, or integers.
+    :type hex_strings: iterable
+
+    :param diagnostics: Records result counts and sampled failures.
+    :type diagnostics: :class:`Diagnostics`, optional
+
+    :return: ``EPC_*`` result codes, one per input.
+    :rtype: array.array
+    """
+    codes = array('B')
+    append = codes.append
+
+    for hex_string in hex_strings:
+        code = _check(hex_string)[0]
+        append(code)
+        if diagnostics is not None:
+            diagnostics.record(hex_string, code)
+
+    return codes
+
+
+def try_decode_epcs(hex_strings, diagnostics=None):
+    """
+    Decode many hex strings, returning result codes instead of raising.
+
+    :param hex_strings: Hexadecimal EPC tag data, or integers.
+    :type hex_strings: iterable
+
+    :param diagnostics: Records result counts and sampled failures.
+    :type diagnostics: :class:`Diagnostics`, optional
+
+    :return: Tuple of a list of tag objects (``None`` for invalid inputs) and an array of
+        ``EPC_*`` result codes, one per input.
+    :rtype: tuple
+    """
+    tags = []
+    codes = array('B')
+    append_tag = tags.append
+    append_code = codes.append
+
+    for hex_string in hex_strings:
+        code, tag = try_decode(hex_string)
+        append_tag(tag)
+        append_code(code)
+        if diagnostics is not None:
+            diagnostics.record(hex_string, code)
+
+    return tags, codes
@@ -14,12 +14,15 @@ setup(
     author='AAC Engineering',
     url='https://github.com/AACEngineering/epcpy-tools',
     license='MIT',
-    packages=find_packages(),
+    packages=find_packages(exclude=('benchmarks', 'benchmarks.*')),
     include_package_data=True,
     python_requires='>=3.5',
     install_requires=[
         'setuptools'
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',